@@ -33,6 +33,7 @@ Usage:
 
 import json
 import logging
+import threading
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Optional
@@ -44,6 +45,8 @@ LOG_RETENTION_DAYS = 90
 # Sentinel file — prune runs at most once per calendar day
 _PRUNE_SENTINEL = ".last_pruned"
 
+_write_lock = threading.Lock()
+
 
 # ── Approval status constants ──────────────────────────────────────────────────
 
@@ -97,17 +100,19 @@ def write_log_entry(
     }
 
     log_file = logs_dir / f"{now.strftime('%Y-%m-%d')}.json"
-    entries: list = []
-    if log_file.exists():
-        try:
-            entries = json.loads(log_file.read_text(encoding="utf-8"))
-            if not isinstance(entries, list):
+    # Read-modify-write — serialized so watchers sharing one process don't drop entries
+    with _write_lock:
+        entries: list = []
+        if log_file.exists():
+            try:
+                entries = json.loads(log_file.read_text(encoding="utf-8"))
+                if not isinstance(entries, list):
+                    entries = []
+            except Exception:
                 entries = []
-        except Exception:
-            entries = []
 
-    entries.append(entry)
-    log_file.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+        entries.append(entry)
+        log_file.write_text(json.dumps(entries, indent=2), encoding="utf-8")
 
     # Prune old logs (at most once per day to avoid I/O on every call)
     _maybe_prune(logs_dir)
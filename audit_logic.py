@@ -9,8 +9,12 @@ Standalone usage:
     python audit_logic.py --vault ./path/to/vault
 """
 
+import re
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
-from datetime import datetime, timezone
+from statistics import median
+from datetime import datetime, timezone, timedelta
 
 # ── Subscription Pattern Dictionary ───────────────────────────────────────────
 # Maps lowercase keywords found in transaction descriptions → canonical tool name.
@@ -113,6 +117,64 @@ SUBSCRIPTION_PATTERNS: dict[str, str] = {
 IDLE_DAYS_THRESHOLD: int = 30          # flag if no login for this many days
 PRICE_INCREASE_PCT_THRESHOLD: float = 20.0  # flag if price rose more than this %
 
+# Recurring-charge detection: (cadence, min gap days, max gap days, charges per year)
+RECURRING_CADENCES: tuple[tuple[str, int, int, int], ...] = (
+    ("monthly", 26, 35, 12),
+    ("annual", 350, 380, 1),
+)
+RECURRING_AMOUNT_TOLERANCE_PCT: float = 10.0  # earlier charges must sit within this % of their median
+# Two charges prove nothing about stability (a $12 and a $300 purchase 30 days apart
+# look "monthly"). A two-charge series only counts for a known subscription
+# pattern, and only when both amounts agree.
+RECURRING_MIN_CHARGES: int = 3
+
+
+# ── Compiled Matcher ───────────────────────────────────────────────────────────
+# All patterns are folded into one alternation regex, built once at import.
+# The alternation sits inside a lookahead, so the scan reports a hit at every
+# position (hits may overlap), not only the non-overlapping ones finditer would
+# return. At each position the longest pattern matches, and any shorter
+# pattern matching there is a prefix of it, so each pattern is mapped to its
+# best-ranked prefix. The pattern that appears earliest in
+# SUBSCRIPTION_PATTERNS wins, exactly as in the original substring loop
+# ("more specific patterns go first").
+
+_PATTERN_RANK: dict[str, int] = {}
+_BEST_PREFIX: dict[str, str] = {}
+_SUBSCRIPTION_RE: re.Pattern = re.compile("(?!)")
+
+
+def rebuild_matcher() -> None:
+    """Recompile the matcher — call after editing SUBSCRIPTION_PATTERNS at runtime."""
+    global _PATTERN_RANK, _BEST_PREFIX, _SUBSCRIPTION_RE
+    _PATTERN_RANK = {pattern: i for i, pattern in enumerate(SUBSCRIPTION_PATTERNS)}
+    _BEST_PREFIX = {
+        pattern: min((q for q in SUBSCRIPTION_PATTERNS if pattern.startswith(q)), key=_PATTERN_RANK.__getitem__)
+        for pattern in SUBSCRIPTION_PATTERNS
+    }
+    ordered = sorted(SUBSCRIPTION_PATTERNS, key=lambda p: (-len(p), _PATTERN_RANK[p]))
+    alternation = "|".join(re.escape(p) for p in ordered)
+    _SUBSCRIPTION_RE = re.compile(f"(?=({alternation}))" if alternation else "(?!)")
+    _match_subscription.cache_clear()
+
+
+@lru_cache(maxsize=4096)
+def _match_subscription(description_lower: str) -> str | None:
+    """Return the canonical tool name for a lowercase description, or None."""
+    best_rank = len(_PATTERN_RANK)
+    best: str | None = None
+    for m in _SUBSCRIPTION_RE.finditer(description_lower):
+        candidate = _BEST_PREFIX[m.group(1)]
+        rank = _PATTERN_RANK[candidate]
+        if rank < best_rank:
+            best_rank, best = rank, candidate
+            if rank == 0:
+                break
+    return SUBSCRIPTION_PATTERNS[best] if best is not None else None
+
+
+rebuild_matcher()
+
 
 # ── Core Pattern Matching ──────────────────────────────────────────────────────
 
@@ -130,37 +192,139 @@ def analyze_transaction(transaction: dict) -> dict | None:
     Returns:
         dict { type, name, amount, date } if subscription, else None.
     """
-    description_lower = transaction.get("description", "").lower()
-
-    # Fast path: category already tagged as subscription
-    if transaction.get("category", "").lower() == "subscription":
-        for pattern, name in SUBSCRIPTION_PATTERNS.items():
-            if pattern in description_lower:
-                return {
-                    "type": "subscription",
-                    "name": name,
-                    "amount": transaction.get("amount"),
-                    "date": transaction.get("date"),
-                }
+    description = transaction.get("description", "")
+    name = _match_subscription(description.lower())
+
+    if name is None:
         # Tagged as subscription but no pattern match — return raw description
-        return {
-            "type": "subscription",
-            "name": transaction.get("description", "Unknown"),
-            "amount": transaction.get("amount"),
-            "date": transaction.get("date"),
-        }
-
-    # Slow path: pattern match against all known patterns
-    for pattern, name in SUBSCRIPTION_PATTERNS.items():
-        if pattern in description_lower:
-            return {
-                "type": "subscription",
-                "name": name,
-                "amount": transaction.get("amount"),
-                "date": transaction.get("date"),
-            }
-
-    return None
+        if transaction.get("category", "").lower() != "subscription":
+            return None
+        name = transaction.get("description", "Unknown")
+
+    return {
+        "type": "subscription",
+        "name": name,
+        "amount": transaction.get("amount"),
+        "date": transaction.get("date"),
+    }
+
+
+def analyze_transactions(rows: list[dict]) -> list[dict]:
+    """
+    Batch form of analyze_transaction() — returns the subscription matches only.
+
+    Repeated descriptions (the same monthly charge across years of ledger rows)
+    hit the matcher cache, so large ledgers cost one dict lookup per row.
+    """
+    matches = []
+    for row in rows:
+        match = analyze_transaction(row)
+        if match:
+            matches.append(match)
+    return matches
+
+
+# ── Recurring-Charge Detection ─────────────────────────────────────────────────
+# Finds periodic spend that SUBSCRIPTION_PATTERNS does not know about, and price
+# increases on any recurring payee. Rows are keyed by normalized payee, sorted
+# once by (payee, date) and walked group by group — O(n log n) overall.
+
+# Tokens that vary between charges from the same payee and carry no identity
+_PAYEE_NOISE_RE = re.compile(
+    r"\b(?:subscription|subscr|recurring|monthly|annual|yearly|renewal|payment|"
+    r"invoice|inv|receipt|charge|billing|bill|plan|inc|llc|ltd|gmbh|co)\b"
+    r"|#?\d[\w-]*|[^a-z\s]"
+)
+
+
+def _payee_key(description: str) -> str:
+    """
+    Group key for a ledger description: the canonical tool name when a
+    SUBSCRIPTION_PATTERNS entry matches, otherwise the description with
+    reference numbers, punctuation and billing words stripped.
+    """
+    lower = description.lower()
+    name = _match_subscription(lower)
+    if name is not None:
+        return name
+    return " ".join(_PAYEE_NOISE_RE.sub(" ", lower).split()) or lower.strip()
+
+
+def detect_recurring_charges(rows: list[dict]) -> list[dict]:
+    """
+    Detect periodic expense series (monthly / annual cadence, stable amount).
+
+    Args:
+        rows: ledger rows with date (YYYY-MM-DD), description, amount (negative = expense).
+
+    Returns one dict per recurring payee:
+        payee, cadence, count, first_seen, last_seen, last_amount, previous_amount,
+        monthly_cost, price_change_pct, price_increase (bool), known_pattern (bool),
+        next_expected.
+    """
+    charges = []
+    for row in rows:
+        amount = row.get("amount")
+        if not isinstance(amount, (int, float)) or amount >= 0:
+            continue
+        try:
+            day = datetime.strptime(row.get("date", ""), "%Y-%m-%d").date()
+        except ValueError:
+            continue
+        description = row.get("description", "")
+        charges.append((_payee_key(description), day, -float(amount), description))
+
+    charges.sort()
+    series: list[dict] = []
+    for payee, group in groupby(charges, key=lambda c: c[0]):
+        group = list(group)
+        if len(group) < 2:
+            continue
+        dates = [c[1] for c in group]
+        amounts = [c[2] for c in group]
+        gaps = [(b - a).days for a, b in zip(dates, dates[1:])]
+        gap = median(gaps)
+
+        cadence = next(
+            ((name, per_year) for name, lo, hi, per_year in RECURRING_CADENCES if lo <= gap <= hi),
+            None,
+        )
+        if cadence is None:
+            continue
+
+        known = _match_subscription(group[-1][3].lower()) is not None
+        if len(group) < RECURRING_MIN_CHARGES:
+            # Too short to judge stability: known subscriptions at a steady amount only
+            tolerance = amounts[0] * RECURRING_AMOUNT_TOLERANCE_PCT / 100
+            if not known or abs(amounts[1] - amounts[0]) > tolerance:
+                continue
+        else:
+            # Stability is judged on the charges before the latest one, so a fresh
+            # price rise does not hide the series it belongs to.
+            baseline = amounts[:-1]
+            base = median(baseline)
+            tolerance = base * RECURRING_AMOUNT_TOLERANCE_PCT / 100
+            if any(abs(a - base) > tolerance for a in baseline):
+                continue
+
+        last, previous = amounts[-1], amounts[-2]
+        change_pct = round((last - previous) / previous * 100, 1) if previous else 0.0
+        name, per_year = cadence
+        series.append({
+            "payee": payee,
+            "cadence": name,
+            "count": len(group),
+            "first_seen": dates[0].isoformat(),
+            "last_seen": dates[-1].isoformat(),
+            "last_amount": round(last, 2),
+            "previous_amount": round(previous, 2),
+            "monthly_cost": round(last * per_year / 12, 2),
+            "price_change_pct": change_pct,
+            "price_increase": change_pct > PRICE_INCREASE_PCT_THRESHOLD,
+            "known_pattern": known,
+            "next_expected": (dates[-1] + timedelta(days=round(gap))).isoformat(),
+        })
+    return series
 
 
 # ── Bank_Transactions.md Parsers ───────────────────────────────────────────────
@@ -244,7 +408,7 @@ def run_subscription_audit(vault_path: Path) -> dict:
 
     Applies 3 rules from Business_Goals.md:
       1. No login in 30 days  → flag for cancellation
-      2. Cost increased > 20% → flag for review     (requires prior_cost in notes)
+      2. Cost increased > 20% → flag for review     (from ledger price history)
       3. Duplicate tool       → flag lower-usage one (detected via 'duplicate' in notes)
 
     Returns structured dict suitable for:
@@ -257,16 +421,24 @@ def run_subscription_audit(vault_path: Path) -> dict:
     if not bank_file.exists():
         return {"error": f"Bank_Transactions.md not found: {bank_file}"}
 
+    # Ledger rows come from the indexed store; the inventory table is still markdown
+    from ledger_store import get_ledger
     content = bank_file.read_text(encoding="utf-8")
-    ledger_rows = _parse_ledger_rows(content)
+    ledger_rows = get_ledger(vault_path).all_rows()
     inventory = _parse_subscriptions_inventory(content)
 
     # Identify subscriptions from raw ledger via pattern matching
-    identified_from_ledger: list[dict] = []
-    for row in ledger_rows:
-        match = analyze_transaction(row)
-        if match:
-            identified_from_ledger.append(match)
+    identified_from_ledger = analyze_transactions(ledger_rows)
+
+    # Recurring spend from ledger cadence — catches payees missing from the dictionary
+    recurring = detect_recurring_charges(ledger_rows)
+    recurring_by_payee = {r["payee"]: r for r in recurring}
+    inventory_keys = {_payee_key(s["tool"]) for s in inventory}
+    new_recurring = [
+        r for r in recurring
+        if not r["known_pattern"] and r["payee"] not in inventory_keys
+    ]
+    price_increases = [r for r in recurring if r["price_increase"]]
 
     # Audit each entry in the Subscriptions Inventory table
     flagged: list[dict] = []
@@ -302,6 +474,17 @@ def run_subscription_audit(vault_path: Path) -> dict:
                 "detail": sub["notes"].replace("⚠️ ", ""),
             })
 
+        # Rule: Price increase > PRICE_INCREASE_PCT_THRESHOLD on the ledger series
+        series = recurring_by_payee.get(_payee_key(sub["tool"]))
+        if series and series["price_increase"]:
+            reasons.append({
+                "rule": "price_increase",
+                "detail": (
+                    f"Charge rose {series['price_change_pct']}% "
+                    f"(${series['previous_amount']:.2f} → ${series['last_amount']:.2f})"
+                ),
+            })
+
         if reasons:
             monthly = sub["monthly_cost"]
             safe_name = sub["tool"].replace(" ", "_").replace("/", "_")
@@ -328,6 +511,9 @@ def run_subscription_audit(vault_path: Path) -> dict:
         "potential_annual_saving": round(flagged_monthly * 12, 2),
         "flagged": flagged,
         "identified_from_ledger": identified_from_ledger,
+        "recurring_charges": recurring,
+        "new_recurring": new_recurring,
+        "price_increases": price_increases,
     }
 
 
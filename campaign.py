@@ -0,0 +1,368 @@
+"""
+campaign.py — Mail-merge campaigns for the AI Employee.
+
+One template + one recipient CSV → ONE approval file → a throttled, resumable send:
+
+  1. Request — `uv run campaign --template offer.md --csv clients.csv` validates
+     the list (bad/duplicate addresses, opt-outs via permission_guard, missing
+     merge fields), freezes template + recipients under /Campaigns/<id>/, and
+     writes a single summary approval to /Pending_Approval/ (HITL — Handbook §6).
+  2. Dispatch — once approved, the orchestrator streams recipients.csv from a
+     persisted cursor in chunks: opt-outs are re-checked in bulk per chunk,
+     `email_send` slots are reserved from the shared rate limiter, and the
+     chunk is rendered and sent with CAMPAIGN_SEND_CONCURRENCY parallel sends.
+     Failed sends go to the outbound queue (email_queue.py) for retry.
+  3. When the rate limit is reached the run stops and saves its cursor; the
+     orchestrator resumes it on a later tick (and after a restart). Each run
+     writes ONE `campaign_batch` audit entry summarising what it did.
+
+Template format — Markdown with a `subject:` frontmatter field; `{{column}}`
+placeholders are filled from the CSV (which needs an `email` column):
+
+    ---
+    subject: Spring offer for {{company}}
+    ---
+    Hi {{first_name}}, ...
+
+Configure:
+    CAMPAIGN_SEND_CONCURRENCY=4      # parallel sends within a chunk
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import csv
+import json
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from dotenv import load_dotenv
+
+from audit_logger import write_log_entry, infer_approval
+from email_queue import enqueue
+from permission_guard import is_sensitive_content, opted_out
+from rate_limiter import get_limiter, RateLimitExceededError
+
+load_dotenv()
+
+logger = logging.getLogger("Campaign")
+
+CAMPAIGN_SEND_CONCURRENCY = int(os.getenv("CAMPAIGN_SEND_CONCURRENCY", "4"))
+_CHUNK_PER_WORKER = 5     # rows reserved + sent per worker before the cursor is saved
+_PREVIEW_ROWS = 20        # recipients listed in the approval file
+
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+_EMAIL_RE = re.compile(r"^[^@\s,;]+@[^@\s,;]+\.[^@\s,;]+$")
+
+
+# ── Template ──────────────────────────────────────────────────────────────────
+
+def load_template(path: Path) -> tuple[str, str]:
+    """Return (subject, body) of a campaign template file."""
+    text = Path(path).read_text(encoding="utf-8")
+    subject, body = "", text
+    if text.startswith("---"):
+        parts = text.split("---", 2)
+        if len(parts) == 3:
+            body = parts[2]
+            for line in parts[1].splitlines():
+                if line.startswith("subject:"):
+                    subject = line.split(":", 1)[1].strip()
+    if not subject:
+        raise ValueError(f"Template {path} has no 'subject:' frontmatter field")
+    return subject, body.strip()
+
+
+def placeholders(*texts: str) -> set[str]:
+    """Placeholder names, lowercased like the CSV headers they are matched against."""
+    return {m.lower() for text in texts for m in _PLACEHOLDER_RE.findall(text)}
+
+
+def render(text: str, row: dict) -> str:
+    """Fill `{{column}}` placeholders (case-insensitive) from a CSV row (missing values render empty)."""
+    return _PLACEHOLDER_RE.sub(lambda m: (row.get(m.group(1).lower()) or "").strip(), text)
+
+
+# ── Request (writes the single approval file) ────────────────────────────────
+
+def _read_rows(csv_path: Path) -> Iterator[dict]:
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            # Fields beyond the header land under key None (as a list): ignored
+            yield {k.strip().lower(): (v or "").strip() for k, v in row.items() if k is not None}
+
+
+def request_campaign_approval(vault_path: Path, template_path: Path, csv_path: Path,
+                              name: str = "") -> Path:
+    """
+    Validate the recipient list, freeze template + recipients under
+    /Campaigns/<id>/ and write ONE approval file for the whole campaign.
+    """
+    vault_path = Path(vault_path)
+    subject, body = load_template(template_path)
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        header = [h.strip().lower() for h in next(csv.reader(f), [])]
+    if "email" not in header:
+        raise ValueError(f"{csv_path} has no 'email' column")
+    missing = placeholders(subject, body) - set(header)
+    if missing:
+        raise ValueError(f"Template fields not in CSV: {', '.join(sorted(missing))}")
+
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    slug = re.sub(r"[^\w-]+", "_", name or Path(template_path).stem).strip("_")[:40]
+    campaign_id = f"{slug}_{ts}"
+    campaign_dir = vault_path / "Campaigns" / campaign_id
+    campaign_dir.mkdir(parents=True, exist_ok=True)
+    (campaign_dir / "template.md").write_text(f"---\nsubject: {subject}\n---\n\n{body}\n", encoding="utf-8")
+
+    # Stream the source list once: keep valid, unique addresses; exclude opt-outs in bulk
+    seen: set[str] = set()
+    invalid, duplicates, preview = [], 0, []
+    rows_file = campaign_dir / "recipients.csv"
+    with open(rows_file, "w", newline="", encoding="utf-8") as out:
+        writer = csv.DictWriter(out, fieldnames=header, extrasaction="ignore")
+        writer.writeheader()
+        for row in _read_rows(csv_path):
+            addr = row.get("email", "").lower()
+            if not _EMAIL_RE.match(addr):
+                invalid.append(row.get("email", "") or "(blank)")
+                continue
+            if addr in seen:
+                duplicates += 1
+                continue
+            seen.add(addr)
+            row["email"] = addr
+            writer.writerow(row)
+            if len(preview) < _PREVIEW_ROWS:
+                preview.append(row)
+
+    excluded = opted_out(seen, vault_path)
+    count = len(seen) - len(excluded)
+
+    # Sensitive-content flags on the rendered messages (shown to the approver)
+    flagged = []
+    for row in _read_rows(rows_file):
+        keyword = row["email"] not in excluded and is_sensitive_content(
+            f"{render(subject, row)} {render(body, row)}")
+        if keyword:
+            flagged.append((row["email"], f"sensitive context detected ('{keyword}')"))
+
+    first = preview[0] if preview else {}
+    table = "\n".join(f"| {r['email']} | {'🚫 opted out' if r['email'] in excluded else 'send'} |"
+                      for r in preview)
+    notes = []
+    if excluded:
+        notes.append(f"- {len(excluded)} opted-out recipient(s) will be skipped "
+                     f"(human-only communication): {', '.join(sorted(excluded)[:10])}")
+    if invalid:
+        notes.append(f"- {len(invalid)} invalid address(es) dropped: {', '.join(invalid[:10])}")
+    if duplicates:
+        notes.append(f"- {duplicates} duplicate row(s) dropped")
+    notes.extend(f"- ⚠️ {addr}: {reason}" for addr, reason in flagged[:10])
+
+    pending = vault_path / "Pending_Approval"
+    pending.mkdir(exist_ok=True)
+    approval = pending / f"APPROVAL_campaign_{campaign_id}.md"
+    approval.write_text(
+        f"""---
+type: campaign_approval
+action: send_campaign
+campaign_id: {campaign_id}
+campaign_dir: {campaign_dir.relative_to(vault_path)}
+subject: {subject}
+recipient_count: {count}
+excluded_count: {len(excluded)}
+flagged_count: {len(flagged)}
+source: {Path(csv_path).name}
+created: {datetime.now(timezone.utc).isoformat()}
+status: pending
+---
+
+## Email Campaign — {count} recipients
+
+**Template:** {Path(template_path).name}  **Recipients:** {Path(csv_path).name}
+
+### Preview (first recipient)
+
+**Subject:** {render(subject, first)}
+
+{render(body, first)}
+
+### Recipients (first {len(preview)} of {len(seen)})
+
+| Email | Action |
+|-------|--------|
+{table}
+
+{chr(10).join(notes) or "- No exclusions."}
+
+Move this file to `/Approved/` to send every message above. Sends are throttled by
+the `email_send` rate limit; a partly sent campaign resumes automatically.
+""",
+        encoding="utf-8",
+    )
+    _log(vault_path, "campaign_requested", approval.name, "pending",
+         {"campaign_id": campaign_id, "recipients": count, "excluded": len(excluded),
+          "invalid": len(invalid), "duplicates": duplicates, "flagged": len(flagged)}, dry_run=False)
+    return approval
+
+
+# ── Dispatch ──────────────────────────────────────────────────────────────────
+
+def _load_progress(campaign_dir: Path) -> dict:
+    try:
+        return json.loads((campaign_dir / "progress.json").read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {"cursor": 0, "sent": 0, "queued": 0, "skipped_opt_out": 0, "done": False}
+
+
+def _save_progress(campaign_dir: Path, progress: dict) -> None:
+    tmp = campaign_dir / "progress.json.tmp"
+    tmp.write_text(json.dumps(progress, indent=2), encoding="utf-8")
+    tmp.replace(campaign_dir / "progress.json")
+
+
+def run_campaign(vault_path: Path, campaign_dir: Path,
+                 send: Optional[Callable[..., bool]] = None, dry_run: bool = True,
+                 concurrency: int = CAMPAIGN_SEND_CONCURRENCY) -> dict:
+    """
+    Send the next part of an approved campaign. `send(to, subject, body)` delivers
+    one email and returns True on success (the orchestrator passes its Gmail sender).
+
+    Streams recipients.csv from the saved cursor and stops when the rate limit is
+    reached; call again later to continue. Returns this run's summary (with
+    "done": True once every recipient has been handled) and writes one
+    `campaign_batch` audit entry.
+    """
+    vault_path = Path(vault_path)
+    campaign_dir = Path(campaign_dir)
+    subject, body = load_template(campaign_dir / "template.md")
+    progress = _load_progress(campaign_dir)
+    started = datetime.now(timezone.utc)
+    run = {"sent": 0, "queued": 0, "skipped_opt_out": 0, "would_send": 0}
+    if progress["done"]:
+        return {**run, "done": True, "cursor": progress["cursor"]}
+
+    limiter = get_limiter(vault_path)
+    chunk_size = max(1, concurrency) * _CHUNK_PER_WORKER
+    rows = islice(_read_rows(campaign_dir / "recipients.csv"), progress["cursor"], None)
+    rate_limited = None
+
+    def _deliver(row: dict) -> tuple[dict, bool]:
+        try:
+            return row, bool(send(row["email"], render(subject, row), render(body, row)))
+        except Exception as e:
+            logger.error(f"Campaign email to {row['email']} failed: {e}")
+            return row, False
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        while rate_limited is None:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                progress["done"] = True
+                break
+
+            # Opt-outs may have been added since approval — one bulk check per chunk
+            blocked = opted_out((r["email"] for r in chunk), vault_path)
+            to_send = [r for r in chunk if r["email"] not in blocked]
+
+            if dry_run:
+                for row in to_send:
+                    logger.info(f"[DRY RUN] Would email {row['email']}: {render(subject, row)}")
+                run["would_send"] += len(to_send)
+                run["skipped_opt_out"] += len(blocked)
+                continue
+
+            # Reserve send slots sequentially (file-backed limiter); rows past the
+            # limit stay behind the cursor for the next run
+            allowed = []
+            for row in to_send:
+                try:
+                    limiter.check("email_send")
+                except RateLimitExceededError as e:
+                    rate_limited = e
+                    break
+                allowed.append(row)
+            handled = chunk if rate_limited is None else chunk[:chunk.index(to_send[len(allowed)])]
+
+            delta = {"sent": 0, "queued": 0,
+                     "skipped_opt_out": sum(1 for r in handled if r["email"] in blocked)}
+            for row, ok in pool.map(_deliver, allowed):
+                if ok:
+                    delta["sent"] += 1
+                else:
+                    enqueue(vault_path, row["email"], render(subject, row), render(body, row),
+                            reason="campaign_send_failed", name=f"campaign_{campaign_dir.name}")
+                    delta["queued"] += 1
+
+            progress["cursor"] += len(handled)
+            for key, n in delta.items():
+                run[key] += n
+                progress[key] += n
+            _save_progress(campaign_dir, progress)
+
+    if not dry_run:
+        _save_progress(campaign_dir, progress)
+
+    summary = {
+        "campaign_id": campaign_dir.name,
+        **run,
+        "cursor": progress["cursor"],
+        "done": progress["done"],
+        "rate_limited": rate_limited is not None,
+        "reset_in": rate_limited.reset_in if rate_limited is not None else 0,
+        "dry_run": dry_run,
+        "elapsed_seconds": round((datetime.now(timezone.utc) - started).total_seconds(), 2),
+    }
+    if not dry_run:
+        summary["total_sent"] = progress["sent"]
+        summary["total_queued"] = progress["queued"]
+    _log(vault_path, "campaign_batch", campaign_dir.name, "success" if not run["queued"] else "partial",
+         summary, dry_run)
+    logger.info(f"Campaign batch: {summary}")
+    return summary
+
+
+def _log(vault_path: Path, action_type: str, target: str, result: str,
+         details: dict, dry_run: bool) -> None:
+    approval_status, approved_by = infer_approval(action_type, dry_run)
+    write_log_entry(
+        logs_dir=vault_path / "Logs",
+        action_type=action_type,
+        actor="campaign",
+        target=target,
+        result=result,
+        parameters=details,
+        approval_status=approval_status,
+        approved_by=approved_by,
+    )
+
+
+# ── CLI ────────────────────────────────────────────────────────────────────────
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [Campaign] %(levelname)s: %(message)s",
+                        datefmt="%Y-%m-%dT%H:%M:%S")
+    parser = argparse.ArgumentParser(description="Request approval for a mail-merge campaign (HITL)")
+    parser.add_argument("--vault", default=os.getenv("VAULT_PATH", "./AI_Employee_Vault"))
+    parser.add_argument("--template", type=Path, required=True, help="Markdown template with subject: frontmatter")
+    parser.add_argument("--csv", type=Path, required=True, help="Recipient CSV with an email column")
+    parser.add_argument("--name", default="", help="Campaign name (default: template file name)")
+    args = parser.parse_args()
+
+    vault_path = Path(args.vault).resolve()
+    try:
+        approval = request_campaign_approval(vault_path, args.template, args.csv, args.name)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    print(f"Campaign awaiting approval: Pending_Approval/{approval.name}")
+
+
+if __name__ == "__main__":
+    main()
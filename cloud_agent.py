@@ -7,7 +7,8 @@ the Cloud↔Local split architecture:
   CLOUD AGENT OWNS (draft-only, no execution):
   - Email triage → draft replies → /Pending_Approval/
   - Social post drafts → /To_Post/ or /Pending_Approval/
-  - Claim items via move-to /In_Progress/cloud/
+  - Claim items via move-to /In_Progress/cloud/<agent_id>/ under a lease
+    (heartbeat-renewed; lapsed leases are reclaimed by any cloud agent)
   - Write results to /Updates/ for Local Agent to merge
 
   LOCAL AGENT OWNS (execution):
@@ -25,6 +26,8 @@ Usage:
     uv run python cloud_agent.py --dry-run
     uv run python cloud_agent.py --no-gmail
     uv run python cloud_agent.py --agent-id cloud-vm-01
+    uv run python cloud_agent.py --agent-id cloud-02   # scale out: several agents, one vault
+    uv run python cloud_agent.py --workers 8           # parallel drafting within one agent
 """
 
 import os
@@ -33,11 +36,14 @@ import time
 import json
 import signal
 import logging
+import threading
 import argparse
 import subprocess
 from pathlib import Path
+from typing import Callable
 from datetime import datetime, timezone
 from dotenv import load_dotenv
+from task_priority import PriorityTaskQueue
 
 load_dotenv()
 
@@ -73,7 +79,15 @@ SIGNALS            = _path("Signals")
 
 # ─── Logging ─────────────────────────────────────────────────────────────────
 
+_log_lock = threading.Lock()   # claim / release / draft entries come from several threads
+
+
 def log_action(action_type: str, target: str, result: str, details: dict = None):
+    with _log_lock:
+        _append_log(action_type, target, result, details)
+
+
+def _append_log(action_type: str, target: str, result: str, details: dict = None):
     log_file = LOGS / f"{datetime.now(timezone.utc).strftime('%Y-%m-%d')}.json"
     entry = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -93,46 +107,217 @@ def log_action(action_type: str, target: str, result: str, details: dict = None)
     log_file.write_text(json.dumps(entries, indent=2), encoding="utf-8")
 
 
-# ─── Claim-by-Move ───────────────────────────────────────────────────────────
+# ─── Leased Claim-by-Move ────────────────────────────────────────────────────
+#
+# Several cloud-0N agents share one vault. An item is claimed by an atomic
+# rename into the agent's own In_Progress/cloud/<agent_id>/ directory (the
+# rename is the mutex), and a `<name>.lease` sidecar records who holds it and
+# until when. While the agent works, a heartbeat thread keeps extending its
+# leases. If an agent crashes, its leases lapse, and any agent reclaims the
+# item with the same atomic rename. A failed item is not dumped back into
+# Needs_Action; its lease is left to lapse after a backoff, and it is retried
+# up to LEASE_MAX_ATTEMPTS times before moving to /Quarantine/.
 
-def claim_item(task_file: Path) -> Path | None:
-    """
-    Atomically claim a task by moving it from Needs_Action → In_Progress/cloud/.
-    Returns the new path, or None if already claimed by another agent.
-    """
-    dest = IN_PROGRESS_CLOUD / task_file.name
-    try:
-        task_file.rename(dest)
-        logger.info(f"Claimed: {task_file.name}")
-        log_action("claim_item", task_file.name, "success", {"agent": AGENT_ID})
+LEASE_TTL          = int(os.getenv("CLOUD_LEASE_TTL", "300"))           # seconds a claim survives without heartbeat
+LEASE_MAX_ATTEMPTS = int(os.getenv("CLOUD_LEASE_MAX_ATTEMPTS", "3"))
+LEASE_RETRY_BASE   = int(os.getenv("CLOUD_LEASE_RETRY_BASE", "60"))     # failed item waits BASE·2^(n-1) seconds
+
+
+def _now() -> float:
+    return time.time()
+
+
+class LeaseQueue:
+    """Claim, heartbeat, release and reclaim of leased work items for one agent."""
+
+    def __init__(self, agent_id: str, ttl: int = LEASE_TTL, max_attempts: int = LEASE_MAX_ATTEMPTS):
+        self.agent_id = agent_id
+        self.ttl = ttl
+        self.max_attempts = max_attempts
+        self.root = IN_PROGRESS_CLOUD
+        self.dir = IN_PROGRESS_CLOUD / agent_id
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self._held: set[str] = set()          # item names this agent is actively working on
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat_thread: threading.Thread | None = None
+
+    # ── Lease files ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _lease_path(item: Path) -> Path:
+        return item.with_name(item.name + ".lease")
+
+    @staticmethod
+    def read_lease(item: Path) -> dict | None:
+        try:
+            return json.loads(LeaseQueue._lease_path(item).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write_lease(self, item: Path, attempts: int, expires_at: float, state: str = "active"):
+        lease = {
+            "agent": self.agent_id,
+            "item": item.name,
+            "state": state,
+            "attempts": attempts,
+            "claimed_at": datetime.now(timezone.utc).isoformat(),
+            "expires_at": expires_at,
+        }
+        tmp = item.with_name(f".{item.name}.lease.tmp")
+        tmp.write_text(json.dumps(lease, indent=2), encoding="utf-8")
+        tmp.replace(self._lease_path(item))
+
+    # ── Claim / release ──────────────────────────────────────────────────────
+
+    def claim(self, task_file: Path, attempts: int = 1) -> Path | None:
+        """Atomically move `task_file` into this agent's directory and lease it. None if someone else won."""
+        dest = self.dir / task_file.name
+        try:
+            task_file.rename(dest)
+        except FileNotFoundError:
+            return None            # another agent claimed (or reclaimed) it first
+        except Exception as e:
+            logger.warning(f"Could not claim {task_file.name}: {e}")
+            return None
+        self._write_lease(dest, attempts, _now() + self.ttl)
+        with self._lock:
+            self._held.add(dest.name)
+        logger.info(f"Claimed: {task_file.name} (attempt {attempts})")
+        log_action("claim_item", task_file.name, "success", {"agent": self.agent_id, "attempt": attempts})
         return dest
-    except FileNotFoundError:
-        # Another agent already claimed it
-        return None
-    except Exception as e:
-        logger.warning(f"Could not claim {task_file.name}: {e}")
-        return None
-
-
-def release_item(claimed_file: Path, outcome: str = "done"):
-    """Move a claimed item to /Done/ (completed) or back to /Needs_Action/ (failed)."""
-    if outcome == "done":
-        dest = DONE / claimed_file.name
-    else:
-        dest = NEEDS_ACTION_CLOUD / claimed_file.name
-    try:
-        claimed_file.rename(dest)
-        log_action("release_item", claimed_file.name, outcome)
-    except Exception as e:
-        logger.error(f"Could not release {claimed_file.name}: {e}")
+
+    def holds(self, claimed_file: Path) -> bool:
+        """Fencing check before side effects: is the item still ours (not reclaimed after a stall)?"""
+        lease = self.read_lease(claimed_file)
+        return claimed_file.exists() and lease is not None and lease.get("agent") == self.agent_id
+
+    def release(self, claimed_file: Path, outcome: str = "done"):
+        """Done → /Done/. Failed → lease left to lapse after a backoff, then retried or quarantined."""
+        with self._lock:
+            self._held.discard(claimed_file.name)
+        lease = self.read_lease(claimed_file) or {}
+        attempts = lease.get("attempts", 1)
+        try:
+            if outcome == "done":
+                claimed_file.rename(DONE / claimed_file.name)
+                self._lease_path(claimed_file).unlink(missing_ok=True)
+            elif attempts >= self.max_attempts:
+                self._quarantine(claimed_file, attempts)
+                return
+            else:
+                delay = LEASE_RETRY_BASE * 2 ** (attempts - 1)
+                self._write_lease(claimed_file, attempts, _now() + delay, state="retry_wait")
+                logger.info(f"{claimed_file.name} failed (attempt {attempts}) — retry in {delay}s")
+            log_action("release_item", claimed_file.name, outcome, {"agent": self.agent_id, "attempt": attempts})
+        except FileNotFoundError:
+            logger.warning(f"{claimed_file.name} was reclaimed by another agent before release")
+        except Exception as e:
+            logger.error(f"Could not release {claimed_file.name}: {e}")
+
+    def _quarantine(self, item: Path, attempts: int):
+        quarantine = VAULT_PATH / "Quarantine"
+        quarantine.mkdir(exist_ok=True)
+        item.rename(quarantine / item.name)
+        self._lease_path(item).unlink(missing_ok=True)
+        logger.error(f"{item.name} failed {attempts} times — moved to /Quarantine/")
+        log_action("quarantine_item", item.name, "error", {"agent": self.agent_id, "attempts": attempts})
+
+    # ── Expiry / reclaim ─────────────────────────────────────────────────────
+
+    def reclaim_expired(self) -> list[Path]:
+        """
+        Take over items whose lease lapsed in any agent's directory (crashed agent,
+        or a failed item whose retry backoff is over). Returns the reclaimed items.
+        """
+        now = _now()
+        reclaimed = []
+        for item in self.root.glob("*/*.md"):
+            with self._lock:
+                if item.parent == self.dir and item.name in self._held:
+                    continue
+            lease = self.read_lease(item)
+            if lease is None:
+                # Crash between rename and lease write — judge by when the rename happened
+                try:
+                    if now - item.stat().st_ctime < self.ttl:
+                        continue
+                except FileNotFoundError:
+                    continue
+                attempts = 1
+            elif lease.get("expires_at", 0) > now:
+                continue
+            else:
+                attempts = lease.get("attempts", 1) + 1   # a crash counts as a failed attempt too
+            old_lease = self._lease_path(item)
+            if attempts > self.max_attempts:
+                dest = self.dir / item.name
+                try:
+                    item.rename(dest)
+                except FileNotFoundError:
+                    continue
+                old_lease.unlink(missing_ok=True)
+                self._quarantine(dest, attempts - 1)
+                continue
+            claimed = self.claim(item, attempts=attempts)
+            if claimed is None:
+                continue
+            if old_lease.parent != self.dir:
+                old_lease.unlink(missing_ok=True)
+            holder = lease.get("agent", item.parent.name) if lease else item.parent.name
+            logger.warning(f"Reclaimed {item.name} from {holder} (lease expired)")
+            log_action("reclaim_item", item.name, "success",
+                       {"agent": self.agent_id, "previous_holder": holder, "attempt": attempts})
+            reclaimed.append(claimed)
+        return reclaimed
+
+    # ── Heartbeat ────────────────────────────────────────────────────────────
+
+    def heartbeat(self) -> int:
+        """Extend the lease of every item this agent is working on. Returns how many."""
+        renewed = 0
+        # Under the lock, so a release() in between cannot have its lease
+        # (or its retry_wait backoff) rewritten as active afterwards
+        with self._lock:
+            for name in list(self._held):
+                item = self.dir / name
+                lease = self.read_lease(item)
+                if lease is None or lease.get("agent") != self.agent_id or not item.exists():
+                    self._held.discard(name)   # lost it (reclaimed while we stalled)
+                    continue
+                self._write_lease(item, lease.get("attempts", 1), _now() + self.ttl)
+                renewed += 1
+        return renewed
+
+    def start_heartbeat(self, on_beat: Callable[[], None] | None = None):
+        """Renew leases every min(TTL/3, 30s); `on_beat` runs on each beat too (agent health signal)."""
+        def _beat():
+            while True:
+                for fn in (self.heartbeat, on_beat):
+                    if fn is None:
+                        continue
+                    try:
+                        fn()
+                    except Exception as e:
+                        logger.error(f"Heartbeat {getattr(fn, '__name__', fn)} failed: {e}")
+                if self._stop.wait(max(min(self.ttl / 3, 30), 1)):
+                    return
+        self._heartbeat_thread = threading.Thread(target=_beat, name="lease-heartbeat", daemon=True)
+        self._heartbeat_thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def in_progress_count(self) -> int:
+        return len(list(self.dir.glob("*.md")))
 
 
 # ─── Draft Email Reply ────────────────────────────────────────────────────────
 
-def draft_email_reply(task_file: Path, dry_run: bool = False):
+def compose_email_reply(task_file: Path) -> dict:
     """
-    Read an email task, draft a reply, write approval request.
-    The Local Agent will execute the actual send after human approval.
+    Read an email task and draft the approval request for its reply. Pure — writes
+    nothing, so drafts can be composed in parallel; write_email_draft() persists them.
     """
     content = task_file.read_text(encoding="utf-8")
     ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
@@ -143,7 +328,8 @@ def draft_email_reply(task_file: Path, dry_run: bool = False):
     sender = from_line.replace("from:", "").strip()
     subject = subject_line.replace("subject:", "").strip()
 
-    approval_file = PENDING_APPROVAL / f"APPROVAL_cloud_email_reply_{ts}.md"
+    # Task stem in the name: many drafts are written within the same second
+    approval_name = f"APPROVAL_cloud_email_reply_{ts}_{task_file.stem}.md"
     approval_content = f"""---
 type: approval_request
 action: send_email
@@ -173,15 +359,146 @@ status: pending
 ---
 *Drafted by Cloud Agent {AGENT_ID} · Local Agent will execute send after approval · Handbook §3*
 """
-    if not dry_run:
-        approval_file.write_text(approval_content, encoding="utf-8")
-        # Write update signal for Local Agent
-        signal_file = UPDATES / f"UPDATE_email_draft_{ts}.md"
-        signal_file.write_text(f"cloud_agent drafted email reply: {approval_file.name}\n", encoding="utf-8")
-        log_action("draft_email_reply", sender, "success", {"approval_file": approval_file.name})
-        logger.info(f"Drafted reply → {approval_file.name}")
-    else:
-        logger.info(f"[DRY RUN] Would draft reply for: {subject}")
+    return {
+        "sender": sender,
+        "subject": subject,
+        "approval_name": approval_name,
+        "approval_content": approval_content,
+        "update_name": f"UPDATE_email_draft_{ts}_{task_file.stem}.md",
+    }
+
+
+def write_email_draft(draft: dict, dry_run: bool = False):
+    """Write a composed draft to /Pending_Approval/ plus its /Updates/ signal for the Local Agent."""
+    if dry_run:
+        logger.info(f"[DRY RUN] Would draft reply for: {draft['subject']}")
+        return
+    approval_file = PENDING_APPROVAL / draft["approval_name"]
+    approval_file.write_text(draft["approval_content"], encoding="utf-8")
+    # Write update signal for Local Agent
+    signal_file = UPDATES / draft["update_name"]
+    signal_file.write_text(f"cloud_agent drafted email reply: {approval_file.name}\n", encoding="utf-8")
+    log_action("draft_email_reply", draft["sender"], "success", {"approval_file": approval_file.name})
+    logger.info(f"Drafted reply → {approval_file.name}")
+
+
+def draft_email_reply(task_file: Path, dry_run: bool = False):
+    """
+    Read an email task, draft a reply, write approval request.
+    The Local Agent will execute the actual send after human approval.
+    """
+    write_email_draft(compose_email_reply(task_file), dry_run=dry_run)
+
+
+# ─── Draft Pipeline ───────────────────────────────────────────────────────────
+#
+#   producer (agent loop) ──claimed──▶ [bounded queue] ──▶ N draft workers
+#                                                              │ composed drafts
+#                                                              ▼
+#                                 single writer ──▶ /Pending_Approval/, /Updates/, release
+#
+# Workers only read the task and compose text, so drafts are produced in
+# parallel. All vault writes, audit-log appends and lease releases happen on
+# the one writer thread. The producer reserves a slot before each claim, so an
+# agent never holds more leases than it can work on (other agents take the rest).
+
+DRAFT_WORKERS = int(os.getenv("CLOUD_DRAFT_WORKERS", "4"))
+
+_STOP = object()
+
+
+class DraftPipeline:
+    """Bounded worker pool that drafts claimed email tasks, with a single writer."""
+
+    def __init__(self, lease_queue: "LeaseQueue", workers: int = DRAFT_WORKERS, dry_run: bool = False):
+        import queue
+
+        self.leases = lease_queue
+        self.workers = max(1, workers)
+        self.dry_run = dry_run
+        self._tasks = queue.Queue()
+        self._slots = threading.Semaphore(self.workers * 2)   # claimed-but-unstarted items, at most
+        self._results = queue.Queue()
+        self._threads: list[threading.Thread] = []
+        self.stats = {"drafted": 0, "failed": 0}
+        self.accepting = True
+
+    def start(self):
+        for i in range(self.workers):
+            t = threading.Thread(target=self._work, name=f"draft-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        self._writer = threading.Thread(target=self._write, name="draft-writer", daemon=True)
+        self._writer.start()
+
+    def reserve(self) -> bool:
+        """Block until the pipeline has room for one more item. Pair with submit() or unreserve()."""
+        while not self._slots.acquire(timeout=1):
+            if not self.accepting:
+                return False
+        return True
+
+    def unreserve(self):
+        self._slots.release()
+
+    def submit(self, claimed: Path):
+        """Queue a claimed item into a slot taken with reserve()."""
+        self._tasks.put(claimed)
+
+    def close(self):
+        """Finish queued items, then stop the workers and the writer."""
+        self.accepting = False
+        for _ in self._threads:
+            self._tasks.put(_STOP)
+        for t in self._threads:
+            t.join()
+        self._results.put(_STOP)
+        self._writer.join()
+
+    def _work(self):
+        while True:
+            claimed = self._tasks.get()
+            try:
+                if claimed is _STOP:
+                    return
+                self._slots.release()
+                if not self.leases.holds(claimed):
+                    logger.warning(f"Lost lease on {claimed.name} — skipping")
+                    continue
+                try:
+                    self._results.put((claimed, compose_email_reply(claimed), None))
+                except Exception as e:
+                    self._results.put((claimed, None, e))
+            finally:
+                self._tasks.task_done()
+
+    def _write(self):
+        while True:
+            item = self._results.get()
+            try:
+                if item is _STOP:
+                    return
+                claimed, draft, error = item
+                if not self.leases.holds(claimed):
+                    # Reclaimed by another agent since the worker checked — its draft wins
+                    logger.warning(f"Lost lease on {claimed.name} before writing — draft discarded")
+                    continue
+                if error is None:
+                    try:
+                        write_email_draft(draft, dry_run=self.dry_run)
+                    except Exception as e:
+                        error = e
+                if error is None:
+                    self.leases.release(claimed, "done")
+                    self.stats["drafted"] += 1
+                else:
+                    logger.error(f"Failed to draft reply for {claimed.name}: {error}")
+                    self.leases.release(claimed, "failed")
+                    self.stats["failed"] += 1
+            except Exception as e:
+                logger.error(f"Draft writer error: {e}")
+            finally:
+                self._results.task_done()
 
 
 # ─── Draft Social Post ────────────────────────────────────────────────────────
@@ -235,7 +552,7 @@ def write_health_signal():
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "status": "online",
         "vault_path": str(VAULT_PATH),
-        "in_progress_count": len(list(IN_PROGRESS_CLOUD.glob("*.md"))),
+        "in_progress_count": len(list((IN_PROGRESS_CLOUD / AGENT_ID).glob("*.md"))),
         "pending_approval_count": len(list(PENDING_APPROVAL.glob("*.md"))),
     }
     signal_file.write_text(json.dumps(health, indent=2), encoding="utf-8")
@@ -244,13 +561,18 @@ def write_health_signal():
 # ─── Main Poll Loop ───────────────────────────────────────────────────────────
 
 class CloudAgent:
-    def __init__(self, enable_gmail: bool = True, dry_run: bool = False, agent_id: str = "cloud-01"):
+    def __init__(self, enable_gmail: bool = True, dry_run: bool = False, agent_id: str = "cloud-01",
+                 workers: int = DRAFT_WORKERS):
         global AGENT_ID
         AGENT_ID = agent_id
         self.enable_gmail = enable_gmail
         self.dry_run = dry_run
         self.check_interval = int(os.getenv("CLOUD_AGENT_INTERVAL", "60"))
+        self.queue = LeaseQueue(agent_id)
+        self.pipeline = DraftPipeline(self.queue, workers=workers, dry_run=dry_run)
+        self.tasks = PriorityTaskQueue()
         self._running = True
+        self._wake = threading.Event()
 
         signal.signal(signal.SIGINT, self._shutdown)
         signal.signal(signal.SIGTERM, self._shutdown)
@@ -258,36 +580,50 @@ class CloudAgent:
     def _shutdown(self, *_):
         logger.info("Cloud Agent shutting down...")
         self._running = False
+        self.pipeline.accepting = False
+        self._wake.set()
+
+    def _process_email_tasks(self) -> int:
+        """
+        Producer: reclaim lapsed leases, then claim unclaimed email tasks in priority
+        order (urgent / nearly SLA-breached first) and hand them to the draft pipeline.
+        Returns how many items were submitted.
+        """
+        submitted = 0
+        reclaimed = self.queue.reclaim_expired()
+        for i, claimed in enumerate(reclaimed):
+            if not self.pipeline.reserve():
+                # Shutting down: the leases of the rest lapse and are reclaimed later
+                logger.info(f"Pipeline closed — {len(reclaimed) - i} reclaimed item(s) left to lapse")
+                return submitted
+            self.pipeline.submit(claimed)
+            submitted += 1
+
+        # Same name in several dirs: email/ (Gmail watcher writes here) wins over
+        # cloud/, then root Needs_Action (backwards-compat)
+        task_dirs = (NEEDS_ACTION_EMAIL, NEEDS_ACTION_CLOUD, NEEDS_ACTION_ROOT)
+        self.tasks.refresh(task_dirs, "EMAIL_*.md")
+        last_refresh = time.monotonic()
 
-    def _process_email_tasks(self):
-        """Check domain email/ dir first, then cloud/, then root for unclaimed email tasks."""
-        seen = set()
-        email_tasks = []
-        # Priority 1: Platinum domain dir (Gmail watcher writes here)
-        for f in NEEDS_ACTION_EMAIL.glob("EMAIL_*.md"):
-            if f.name not in seen:
-                seen.add(f.name)
-                email_tasks.append(f)
-        # Priority 2: cloud/ subdirectory
-        for f in NEEDS_ACTION_CLOUD.glob("EMAIL_*.md"):
-            if f.name not in seen:
-                seen.add(f.name)
-                email_tasks.append(f)
-        # Priority 3: root Needs_Action (backwards-compat)
-        for f in NEEDS_ACTION_ROOT.glob("EMAIL_*.md"):
-            if f.name not in seen and not (IN_PROGRESS_CLOUD / f.name).exists():
-                seen.add(f.name)
-                email_tasks.append(f)
-
-        for task_file in email_tasks:
-            claimed = claim_item(task_file)
+        while self._running:
+            # Claim only once the pipeline has room, so no lease sits idle in a
+            # queue while other agents could be working on the item
+            if not self.pipeline.reserve():
+                break
+            if time.monotonic() - last_refresh >= 1:
+                self.tasks.refresh(task_dirs, "EMAIL_*.md")   # urgent mail that arrived meanwhile
+                last_refresh = time.monotonic()
+            task_file = self.tasks.pop()   # highest priority / closest to SLA breach
+            if task_file is None:
+                self.pipeline.unreserve()
+                break
+            claimed = self.queue.claim(task_file)
             if claimed:
-                try:
-                    draft_email_reply(claimed, dry_run=self.dry_run)
-                    release_item(claimed, "done")
-                except Exception as e:
-                    logger.error(f"Failed to draft reply for {claimed.name}: {e}")
-                    release_item(claimed, "failed")
+                self.pipeline.submit(claimed)
+                submitted += 1
+            else:
+                self.pipeline.unreserve()
+        return submitted
 
     def _check_local_agent_health(self):
         """Read Local Agent's health signal if present."""
@@ -303,17 +639,27 @@ class CloudAgent:
                 pass
 
     def run(self):
-        logger.info(f"Cloud Agent {AGENT_ID} starting (interval={self.check_interval}s, dry_run={self.dry_run})")
+        logger.info(f"Cloud Agent {AGENT_ID} starting (interval={self.check_interval}s, "
+                    f"workers={self.pipeline.workers}, dry_run={self.dry_run})")
+        # Health is written by the heartbeat thread, so it stays fresh while a
+        # long backlog keeps the producer below busy
+        self.queue.start_heartbeat(on_beat=write_health_signal)
+        self.pipeline.start()
         consecutive_errors = 0
+        last_health = 0.0
 
         while self._running:
             try:
-                write_health_signal()
-                self._process_email_tasks()
-                self._check_local_agent_health()
+                if time.monotonic() - last_health >= min(self.check_interval, 30):
+                    self._check_local_agent_health()
+                    last_health = time.monotonic()
+
+                submitted = self._process_email_tasks()
 
                 consecutive_errors = 0
-                time.sleep(self.check_interval)
+                # Work through a backlog continuously; poll at the interval only once it is drained
+                if submitted == 0:
+                    self._wake.wait(self.check_interval)
 
             except KeyboardInterrupt:
                 break
@@ -323,9 +669,12 @@ class CloudAgent:
                 logger.error(f"Cloud Agent error (attempt {consecutive_errors}): {e}. Retry in {backoff}s")
                 log_action("agent_error", "cloud_agent", "error",
                            {"error": str(e), "consecutive_errors": consecutive_errors})
-                time.sleep(backoff)
+                self._wake.wait(backoff)
 
-        logger.info("Cloud Agent stopped.")
+        self.pipeline.close()
+        self.queue.stop()
+        logger.info(f"Cloud Agent stopped ({self.pipeline.stats['drafted']} drafted, "
+                    f"{self.pipeline.stats['failed']} failed).")
 
 
 def main():
@@ -333,12 +682,14 @@ def main():
     parser.add_argument("--no-gmail",   action="store_true", help="Skip Gmail watcher")
     parser.add_argument("--dry-run",    action="store_true", help="No external actions")
     parser.add_argument("--agent-id",   default="cloud-01",  help="Unique cloud agent identifier")
+    parser.add_argument("--workers",    type=int, default=DRAFT_WORKERS, help="Parallel draft workers")
     args = parser.parse_args()
 
     agent = CloudAgent(
         enable_gmail=not args.no_gmail,
         dry_run=args.dry_run,
         agent_id=args.agent_id,
+        workers=args.workers,
     )
     agent.run()
 
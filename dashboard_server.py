@@ -62,7 +62,7 @@ def get_vault_stats() -> dict:
         "drafts":             count("Drafts"),
         "scheduled":          count("Scheduled"),
         "in_progress_local":  count("In_Progress/local"),
-        "in_progress_cloud":  count("In_Progress/cloud"),
+        "in_progress_cloud":  count("In_Progress/cloud", "**/*.md"),   # one subdir per cloud agent
         "sla_breaches":       _count_sla_breaches(),
     }
 
@@ -0,0 +1,142 @@
+"""
+dashboard_writer.py — Write-if-changed Dashboard.md for the AI Employee.
+
+The orchestrator refreshes Dashboard.md every 30 seconds. Rewriting it
+unconditionally makes Obsidian re-index, wakes the filesystem watcher and
+leaves a diff for sync/sync_up.sh on every tick. This module makes the refresh
+nearly free on a quiet vault:
+
+  - InputCache     — vault reads (directory counts, parsed files) memoised on
+                     the (mtime_ns, size) signature; an unchanged input costs
+                     one stat() instead of a glob or a parse.
+  - volatile()     — marks values that change every render (last_updated,
+                     heartbeat timestamps). They are written into the file
+                     but excluded from the change hash.
+  - DashboardWriter — hashes each section, and writes (tmp → replace) only
+                     when the stable content changed or the file was edited
+                     or removed behind its back. The content hash is kept
+                     in the frontmatter, so a restart does not force a rewrite.
+
+Usage:
+    writer = DashboardWriter(vault / "Dashboard.md")
+    changed = writer.write(
+        [("header", f"---\\nlast_updated: {volatile('now')}\\ncontent_hash: {volatile('content_hash')}\\n---\\n"),
+         ("inbox",  f"## Inbox\\n\\n{count} pending\\n")],
+        values={"now": now},
+    )                                   # [] → nothing written
+"""
+
+from __future__ import annotations
+
+import re
+import hashlib
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+_VOLATILE_RE = re.compile("\x00(\\w+)\x00")
+_HASH_RE = re.compile(r"^content_hash:\s*(\w+)\s*$", re.MULTILINE)
+
+_Signature = Optional[tuple[int, int]]
+
+
+def volatile(name: str) -> str:
+    """Placeholder for a value rendered into the file but excluded from the change hash."""
+    return f"\x00{name}\x00"
+
+
+def _signature(path: Path) -> _Signature:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class InputCache:
+    """Dashboard inputs memoised on file/directory signatures."""
+
+    def __init__(self):
+        self._entries: dict[tuple, tuple[_Signature, Any]] = {}
+
+    def count(self, directory: Path, pattern: str) -> int:
+        """Number of entries in `directory` matching `pattern` (non-recursive)."""
+        sig = _signature(directory)
+        if sig is None:
+            return 0
+        key = ("count", str(directory), pattern)
+        hit = self._entries.get(key)
+        if hit is not None and hit[0] == sig:
+            return hit[1]
+        value = sum(1 for _ in directory.glob(pattern))
+        self._entries[key] = (sig, value)
+        return value
+
+    def load(self, path: Path, parse: Callable[[str], Any], default: Any = None) -> Any:
+        """`parse(text)` of a file, re-read only when it changes; `default` if missing or unparsable."""
+        sig = _signature(path)
+        if sig is None:
+            return default
+        key = ("load", str(path), getattr(parse, "__qualname__", repr(parse)))
+        hit = self._entries.get(key)
+        if hit is not None and hit[0] == sig:
+            return hit[1]
+        try:
+            value = parse(path.read_text(encoding="utf-8"))
+        except Exception:
+            value = default
+        self._entries[key] = (sig, value)
+        return value
+
+
+class DashboardWriter:
+    """Assembles named sections and writes the file only when their stable content changes."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._tmp = self.path.with_name(self.path.name + ".tmp")
+        self._section_hashes: dict[str, str] = {}
+        self._content_hash: Optional[str] = None
+        self._written_sig: _Signature = None
+        self.stats = {"renders": 0, "writes": 0}
+
+    def _stored_hash(self) -> Optional[str]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                m = _HASH_RE.search(f.read(2048))
+        except OSError:
+            return None
+        return m.group(1) if m else None
+
+    def write(self, sections: list[tuple[str, str]], values: dict[str, str]) -> list[str]:
+        """
+        Render `sections` (name, text-with-volatile-markers) and write the file if
+        anything but the volatile values changed. Returns the names of the sections
+        that changed — empty when nothing was written.
+        """
+        self.stats["renders"] += 1
+        hashes = {name: _digest(text) for name, text in sections}
+        content_hash = _digest("".join(f"{name}:{h}" for name, h in hashes.items()))
+
+        if self._content_hash is None:
+            # First render in this process — adopt the file on disk if it is current
+            if self._stored_hash() == content_hash:
+                self._section_hashes, self._content_hash = hashes, content_hash
+                self._written_sig = _signature(self.path)
+                return []
+        elif content_hash == self._content_hash and _signature(self.path) == self._written_sig:
+            return []
+
+        changed = [name for name, h in hashes.items() if self._section_hashes.get(name) != h] or ["external_edit"]
+        fill = {**values, "content_hash": content_hash}
+        text = _VOLATILE_RE.sub(lambda m: str(fill.get(m.group(1), "")), "".join(t for _, t in sections))
+        # Atomic write: temp → rename
+        self._tmp.write_text(text, encoding="utf-8")
+        self._tmp.replace(self.path)
+        self._section_hashes, self._content_hash = hashes, content_hash
+        self._written_sig = _signature(self.path)
+        self.stats["writes"] += 1
+        return changed
@@ -0,0 +1,332 @@
+"""
+deadline_monitor.py — Event-driven SLA breach and approval-expiry alerts.
+
+Replaces the scheduler's 30-minute `job_sla_monitor` / `job_approval_check`
+scans. Those read every EMAIL and Pending_Approval file in full, and for every
+overdue item re-globbed ALERT_*.md and substring-matched all of them, so an
+alert could fire up to 30 minutes late. This monitor does the following instead:
+
+  - Deadline heap — a min-heap of (due, kind, file): `received:` + SLA for
+    EMAIL_* tasks in /Needs_Action/ (and /Needs_Action/email/), and `expires:`
+    for /Pending_Approval/ requests. Only a file's frontmatter head is read,
+    once at startup and then only when a watchdog event reports that the file
+    was created or changed.
+  - Timer — one thread sleeps until the earliest deadline (or until an earlier
+    one is added), so an alert fires at breach / expiry.
+  - Alert index — ALERT_*.md names are indexed by every underscore-bounded run
+    of their stem. "Is this source already alerted?" is one dict lookup, and it
+    still catches Claude-created alerts that name the file (ALERT_x_<stem>_y).
+
+A file that leaves its folder (claimed, done, approved) is dropped from the heap
+lazily. Each breach is alerted once, unless the file changes and breaches again.
+
+Usage:
+    monitor = DeadlineMonitor(vault_path)
+    monitor.start()      # watchdog observer + initial scan + timer thread
+    ...
+    monitor.stop()
+"""
+
+from __future__ import annotations
+
+import os
+import heapq
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Optional
+
+from audit_logger import write_log_entry, infer_approval
+from task_priority import read_frontmatter, parse_timestamp
+
+logger = logging.getLogger("DeadlineMonitor")
+
+SLA_HOURS = float(os.getenv("TASK_SLA_HOURS", "24"))
+
+SLA = "sla"
+EXPIRY = "expired"
+_MAX_ALERT_TOKENS = 32
+
+
+def _now() -> float:
+    return datetime.now(timezone.utc).timestamp()
+
+
+def _alert_keys(stem: str) -> set[str]:
+    """Every underscore-bounded run of tokens in an alert stem (after the ALERT_ prefix)."""
+    tokens = stem.split("_")[1:][:_MAX_ALERT_TOKENS]
+    return {"_".join(tokens[i:j]) for i in range(len(tokens)) for j in range(i + 1, len(tokens) + 1)}
+
+
+class DeadlineMonitor:
+    """Min-heap of SLA / approval-expiry deadlines, fed by vault events, with an alert-by-source index."""
+
+    def __init__(self, vault_path: Path, sla_hours: float = SLA_HOURS):
+        self.vault_path = Path(vault_path).resolve()
+        self.needs_action = self.vault_path / "Needs_Action"
+        self.pending_approval = self.vault_path / "Pending_Approval"
+        self.sla_seconds = sla_hours * 3600
+        self._heap: list[tuple[float, int, str, str]] = []        # (due, seq, kind, path)
+        self._live: dict[tuple[str, str], tuple[int, float]] = {}  # (kind, path) → (seq, due)
+        self._alerts: dict[str, set[str]] = {}                     # source stem → alert file names
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._observer = None
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"tracked": 0, "fired": 0, "deduped": 0}
+
+    # ── Classification ────────────────────────────────────────────────────────
+
+    def _kind(self, path: Path) -> Optional[str]:
+        if path.suffix != ".md":
+            return None
+        if path.parent == self.pending_approval:
+            return EXPIRY
+        if path.name.startswith("EMAIL_") and path.parent in (self.needs_action, self.needs_action / "email"):
+            return SLA
+        return None
+
+    def _is_alert(self, path: Path) -> bool:
+        return path.parent == self.needs_action and path.name.startswith("ALERT_") and path.suffix == ".md"
+
+    # ── Heap ──────────────────────────────────────────────────────────────────
+
+    def track(self, path: Path) -> Optional[float]:
+        """(Re)read a file's deadline and queue it. Returns the due epoch, or None if it has none."""
+        kind = self._kind(path)
+        if kind is None:
+            return None
+        meta = read_frontmatter(path)
+        if kind == SLA:
+            received = parse_timestamp(meta.get("received", ""))
+            due = received + self.sla_seconds if received is not None else None
+        else:
+            due = parse_timestamp(meta.get("expires", ""))
+        with self._cond:
+            key = (kind, str(path))
+            if due is None:
+                self._live.pop(key, None)
+                return None
+            current = self._live.get(key)
+            if current is not None and current[1] == due:
+                return due                     # unchanged (e.g. a body edit)
+            self._seq += 1
+            self._live[key] = (self._seq, due)
+            heapq.heappush(self._heap, (due, self._seq, kind, str(path)))
+            self.stats["tracked"] += 1
+            if self._heap[0][1] == self._seq:
+                self._cond.notify()            # new earliest deadline — re-arm the timer
+        return due
+
+    def forget(self, path: Path):
+        kind = self._kind(path)
+        if kind is not None:
+            with self._cond:
+                self._live.pop((kind, str(path)), None)
+
+    # ── Alert index ───────────────────────────────────────────────────────────
+
+    def index_alert(self, alert: Path):
+        with self._cond:
+            for key in _alert_keys(alert.stem):
+                self._alerts.setdefault(key, set()).add(alert.name)
+
+    def unindex_alert(self, alert: Path):
+        with self._cond:
+            for key in _alert_keys(alert.stem):
+                names = self._alerts.get(key)
+                if names is not None:
+                    names.discard(alert.name)
+                    if not names:
+                        del self._alerts[key]
+
+    def is_alerted(self, source: Path) -> bool:
+        return source.stem in self._alerts
+
+    # ── Startup scan ──────────────────────────────────────────────────────────
+
+    def scan(self) -> int:
+        """Index existing alerts and queue every current deadline (once, at startup)."""
+        for alert in self.needs_action.glob("ALERT_*.md"):
+            self.index_alert(alert)
+        n = 0
+        for directory, pattern in ((self.needs_action, "EMAIL_*.md"),
+                                   (self.needs_action / "email", "EMAIL_*.md"),
+                                   (self.pending_approval, "*.md")):
+            if directory.exists():
+                for f in directory.glob(pattern):
+                    n += self.track(f) is not None
+        return n
+
+    # ── Firing ────────────────────────────────────────────────────────────────
+
+    def fire_due(self, now: Optional[float] = None) -> list[Path]:
+        """Alert every deadline that has passed. Returns the alert files written."""
+        now = now if now is not None else _now()
+        due_items = []
+        with self._cond:
+            while self._heap and self._heap[0][0] <= now:
+                due, seq, kind, path = heapq.heappop(self._heap)
+                if self._live.get((kind, path), (None,))[0] != seq:
+                    continue                   # stale: file left, or its deadline changed
+                del self._live[(kind, path)]
+                due_items.append((due, kind, Path(path)))
+        written = []
+        for due, kind, source in due_items:
+            if not source.exists():
+                continue
+            prefix = "ALERT_sla_" if kind == SLA else "ALERT_expired_"
+            if self.is_alerted(source) or (self.needs_action / f"{prefix}{source.name}").exists():
+                self.stats["deduped"] += 1
+                continue
+            try:
+                alert = self._write_alert(kind, source, due, now)
+            except Exception as e:
+                logger.error(f"Could not write {kind} alert for {source.name}: {e}")
+                continue
+            self.index_alert(alert)
+            self.stats["fired"] += 1
+            written.append(alert)
+        return written
+
+    def _write_alert(self, kind: str, source: Path, due: float, now: float) -> Path:
+        self.needs_action.mkdir(parents=True, exist_ok=True)
+        created = datetime.now(timezone.utc).isoformat()
+        if kind == SLA:
+            age_hours = round((now - (due - self.sla_seconds)) / 3600, 1)
+            alert = self.needs_action / f"ALERT_sla_{source.name}"
+            sla_hours = round(self.sla_seconds / 3600, 1)
+            alert.write_text(
+                f"""---
+type: alert
+severity: high
+created: {created}
+source: {source.name}
+status: pending
+---
+
+SLA Breach: {source.name}
+
+Email task is **{age_hours} hours old** (SLA = {sla_hours:g} hours).
+
+**Action required:** Review and respond to the client.
+
+Related: [{source.name}]({source.relative_to(self.needs_action).as_posix()})
+""",
+                encoding="utf-8",
+            )
+            logger.warning(f"SLA breach flagged: {source.name} ({age_hours}h)")
+            self._log("sla_breach_flagged", {"file": source.name, "age_hours": age_hours})
+        else:
+            alert = self.needs_action / f"ALERT_expired_{source.name}"
+            alert.write_text(
+                f"""---
+type: alert
+severity: high
+created: {created}
+source: {source.name}
+status: pending
+---
+
+Approval Request EXPIRED: {source.name}
+
+The approval window has closed. **Re-approve or reject** this request.
+
+Related file: [Pending_Approval/{source.name}](../Pending_Approval/{source.name})
+""",
+                encoding="utf-8",
+            )
+            logger.warning(f"Expired approval flagged: {source.name}")
+            self._log("approval_expired_flagged", {"file": source.name})
+        return alert
+
+    def _log(self, action_type: str, details: dict):
+        approval_status, approved_by = infer_approval(action_type)
+        write_log_entry(
+            logs_dir=self.vault_path / "Logs",
+            action_type=action_type,
+            actor="scheduler:deadline_monitor",
+            target=details.get("file", "deadline_monitor"),
+            result="success",
+            parameters=details,
+            approval_status=approval_status,
+            approved_by=approved_by,
+        )
+
+    # ── Vault events ──────────────────────────────────────────────────────────
+
+    def on_created(self, path: Path):
+        if self._is_alert(path):
+            self.index_alert(path)
+        else:
+            self.track(path)
+
+    def on_deleted(self, path: Path):
+        if self._is_alert(path):
+            self.unindex_alert(path)
+        else:
+            self.forget(path)
+
+    def on_moved(self, src: Path, dest: Path):
+        self.on_deleted(src)
+        self.on_created(dest)
+
+    # ── Daemon ────────────────────────────────────────────────────────────────
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._stopping:
+                    return
+                timeout = max(self._heap[0][0] - _now(), 0) if self._heap else None
+                if timeout is None or timeout > 0:
+                    self._cond.wait(timeout)
+                if self._stopping:
+                    return
+            try:
+                self.fire_due()
+            except Exception as e:
+                logger.error(f"Deadline monitor error: {e}")
+
+    def start(self):
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+
+        monitor = self
+
+        class _DeadlineHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                src = Path(event.src_path)
+                if event.event_type in ("created", "modified", "closed"):
+                    monitor.on_created(src)
+                elif event.event_type == "deleted":
+                    monitor.on_deleted(src)
+                elif event.event_type == "moved":
+                    monitor.on_moved(src, Path(event.dest_path))
+
+        for d in (self.needs_action / "email", self.pending_approval):
+            d.mkdir(parents=True, exist_ok=True)
+        self._observer = Observer()
+        self._observer.schedule(_DeadlineHandler(), str(self.needs_action), recursive=True)
+        self._observer.schedule(_DeadlineHandler(), str(self.pending_approval), recursive=False)
+        self._observer.start()
+        # Scan only once events flow, so nothing created in between is missed
+        # (a file seen by both is tracked once: track() is idempotent)
+        n = self.scan()
+        self._thread = threading.Thread(target=self._run, name="deadline-monitor", daemon=True)
+        self._thread.start()
+        logger.info(f"Deadline monitor tracking {n} deadline(s), {len(self._alerts)} alert key(s)")
+
+    def stop(self):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,383 @@
+"""
+email_queue.py — §7.3 Durable outbound email queue for the AI Employee.
+
+Emails that could not be sent (Gmail API down, quota or rate limit spent)
+are parked as /Queue/EMAIL_QUEUED_*.md files. Those files are the durable
+store, so a restart loses nothing and a human can read or delete any of them.
+
+The orchestrator drains the queue every tick. Draining never sends everything
+blindly:
+
+  - Next-attempt scheduling — each item keeps `retry_count` and
+    `next_attempt_at` in its frontmatter. An in-memory heap keyed on due time
+    means a drain only touches items that are actually due.
+  - Exponential backoff with full jitter — attempt n waits
+    uniform(0, min(EMAIL_RETRY_BASE * 2^n, EMAIL_RETRY_MAX)) seconds, so items
+    queued together in one outage do not all retry at the same moment.
+  - Send circuit breaker — after EMAIL_BREAKER_THRESHOLD consecutive failures
+    the queue stops sending for EMAIL_BREAKER_COOLDOWN seconds. Then ONE probe
+    is sent; only if it succeeds does draining resume.
+  - Bounded recovery — at most EMAIL_QUEUE_BURST sends per drain, so a
+    recovered provider sees a smooth ramp rather than a retry storm.
+  - After EMAIL_MAX_ATTEMPTS failures an item moves to /Quarantine/ with an alert.
+
+Usage:
+    from email_queue import enqueue, OutboundQueue
+
+    enqueue(vault, to, subject, body, reason="gmail_unavailable")
+    queue = OutboundQueue(vault, send=orchestrator._send_via_gmail)
+    queue.drain()            # call periodically
+
+    python email_queue.py status
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import heapq
+import random
+import logging
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+from audit_logger import write_log_entry, infer_approval
+from rate_limiter import get_limiter, RateLimitExceededError
+
+logger = logging.getLogger("EmailQueue")
+
+EMAIL_RETRY_BASE        = int(os.getenv("EMAIL_RETRY_BASE", "60"))          # seconds
+EMAIL_RETRY_MAX         = int(os.getenv("EMAIL_RETRY_MAX", "3600"))         # seconds
+EMAIL_MAX_ATTEMPTS      = int(os.getenv("EMAIL_MAX_ATTEMPTS", "8"))
+EMAIL_QUEUE_BURST       = int(os.getenv("EMAIL_QUEUE_BURST", "5"))          # sends per drain
+EMAIL_BREAKER_THRESHOLD = int(os.getenv("EMAIL_BREAKER_THRESHOLD", "3"))    # consecutive failures
+EMAIL_BREAKER_COOLDOWN  = int(os.getenv("EMAIL_BREAKER_COOLDOWN", "120"))   # seconds open
+
+QUEUE_GLOB = "EMAIL_QUEUED_*.md"
+_FOOTER = "*Queued by §7.3 graceful degradation"
+
+
+# ── Queue file format ─────────────────────────────────────────────────────────
+
+def enqueue(vault_path: Path, to: str, subject: str, body: str, cc: str = "",
+            reason: str = "", attachment: str = "", record_file: str = "",
+            name: str = "") -> Path:
+    """
+    Park one email in /Queue/. `attachment` / `record_file` are vault-relative
+    paths (a PDF to attach; an /Invoices/ record to mark sent on delivery).
+    The first retry is scheduled one jittered backoff step out.
+    """
+    queue_dir = Path(vault_path) / "Queue"
+    queue_dir.mkdir(parents=True, exist_ok=True)
+    now = datetime.now(timezone.utc)
+    stem = f"EMAIL_QUEUED_{name or now.strftime('%Y%m%dT%H%M%SZ')}"
+    queue_file = queue_dir / f"{stem}.md"
+    n = 1
+    while queue_file.exists():
+        queue_file = queue_dir / f"{stem}_{n}.md"
+        n += 1
+    next_attempt = now + timedelta(seconds=backoff_seconds(0))
+    queue_file.write_text(
+        f"""---
+type: queued_email
+to: {to}
+subject: {subject}
+cc: {cc or ""}
+attachment: {attachment}
+record_file: {record_file}
+queued_at: {now.isoformat()}
+queued_reason: {reason}
+status: queued
+retry_count: 0
+next_attempt_at: {next_attempt.isoformat()}
+last_error:
+---
+
+## Queued Email
+
+**To:** {to}
+**Subject:** {subject}
+
+{body}
+
+---
+{_FOOTER} — will be sent when the provider recovers.*
+*Orchestrator retry loop processes /Queue/EMAIL_QUEUED_*.md files.*
+""",
+        encoding="utf-8",
+    )
+    return queue_file
+
+
+def backoff_seconds(attempt: int) -> float:
+    """Full-jitter exponential backoff for retry number `attempt` (0-based)."""
+    return random.uniform(0, min(EMAIL_RETRY_BASE * (2 ** attempt), EMAIL_RETRY_MAX))
+
+
+def _field(content: str, name: str) -> str:
+    m = re.search(rf"^{name}:[ \t]*(.*)$", content, re.MULTILINE)
+    return m.group(1).strip() if m else ""
+
+
+def _body(content: str) -> str:
+    """Email body: the text after the Subject line, up to the queue footer."""
+    parts = content.split("---", 2)
+    text = parts[2] if len(parts) == 3 else content
+    m = re.search(r"^\*\*Subject:\*\*.*\n\n", text, re.MULTILINE)
+    if m:
+        text = text[m.end():]
+    footer = text.find(f"\n---\n{_FOOTER}")
+    if footer == -1:
+        footer = text.find("\n---\n*Queued by")
+    return (text[:footer] if footer != -1 else text).strip()
+
+
+def _set_fields(path: Path, **fields) -> None:
+    """Rewrite frontmatter fields in place (atomic replace), adding any that are missing."""
+    content = path.read_text(encoding="utf-8")
+    head, sep, rest = content.partition("\n---\n")
+    for name, value in fields.items():
+        line = f"{name}: {value}"
+        if re.search(rf"^{name}:", head, re.MULTILINE):
+            head = re.sub(rf"^{name}:.*$", lambda _: line, head, count=1, flags=re.MULTILINE)
+        else:
+            head += f"\n{line}"
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(head + sep + rest, encoding="utf-8")
+    tmp.replace(path)
+
+
+def _parse_time(value: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+# ── Circuit breaker ───────────────────────────────────────────────────────────
+
+class SendCircuitBreaker:
+    """closed → (threshold failures) → open → (cooldown) → half-open probe → closed/open."""
+
+    def __init__(self, threshold: int = EMAIL_BREAKER_THRESHOLD, cooldown: int = EMAIL_BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[datetime] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if datetime.now(timezone.utc) - self.opened_at >= timedelta(seconds=self.cooldown):
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        return self.state != "open"
+
+    def success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def failure(self) -> None:
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.threshold:
+            # A failed half-open probe re-opens for another full cooldown
+            self.opened_at = datetime.now(timezone.utc)
+
+
+# ── Queue ─────────────────────────────────────────────────────────────────────
+
+class OutboundQueue:
+    """Drains /Queue/ by due time with per-item backoff, under a circuit breaker."""
+
+    def __init__(self, vault_path: Path, send: Callable[..., bool], dry_run: bool = False,
+                 burst: int = EMAIL_QUEUE_BURST):
+        self.vault_path = Path(vault_path)
+        self.queue_dir = self.vault_path / "Queue"
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self.send = send
+        self.dry_run = dry_run
+        self.burst = burst
+        self.breaker = SendCircuitBreaker()
+        self._heap: list[tuple[float, str]] = []    # (due epoch, file name)
+        self._known: set[str] = set()
+
+    def log_action(self, action_type: str, target: str, result: str, details: dict = None):
+        approval_status, approved_by = infer_approval(action_type, self.dry_run)
+        write_log_entry(
+            logs_dir=self.vault_path / "Logs",
+            action_type=action_type,
+            actor="email_queue",
+            target=target,
+            result=result,
+            parameters=details or {},
+            approval_status=approval_status,
+            approved_by=approved_by,
+        )
+
+    def refresh(self) -> int:
+        """Index queue files not seen before (new enqueues, or a restart). Returns how many."""
+        added = 0
+        for path in self.queue_dir.glob(QUEUE_GLOB):
+            if path.name in self._known:
+                continue
+            content = path.read_text(encoding="utf-8")
+            if _field(content, "status") not in ("", "queued"):
+                continue
+            due = _parse_time(_field(content, "next_attempt_at")) or \
+                _parse_time(_field(content, "queued_at")) or datetime.now(timezone.utc)
+            heapq.heappush(self._heap, (due.timestamp(), path.name))
+            self._known.add(path.name)
+            added += 1
+        return added
+
+    def next_due(self) -> Optional[datetime]:
+        return datetime.fromtimestamp(self._heap[0][0], timezone.utc) if self._heap else None
+
+    def drain(self) -> dict:
+        """Send up to `burst` due items. Cheap when nothing is due (one heap peek)."""
+        self.refresh()
+        now = datetime.now(timezone.utc).timestamp()
+        stats = {"sent": 0, "failed": 0, "deferred": 0}
+        while self._heap and self._heap[0][0] <= now and stats["sent"] + stats["failed"] < self.burst:
+            if not self.breaker.allow():
+                break
+            probing = self.breaker.state == "half_open"
+            _, name = heapq.heappop(self._heap)
+            path = self.queue_dir / name
+            if not path.exists():                    # deleted by a human
+                self._known.discard(name)
+                continue
+            outcome = self._attempt(path)
+            stats[outcome] += 1
+            if outcome == "deferred" or (probing and outcome == "failed"):
+                break
+        return stats
+
+    def _attempt(self, path: Path) -> str:
+        content = path.read_text(encoding="utf-8")
+        to, subject = _field(content, "to"), _field(content, "subject")
+        attempt = int(_field(content, "retry_count") or 0)
+
+        if self.dry_run:
+            logger.info(f"[DRY RUN] Would send queued email to {to}: {subject}")
+            self._requeue(path, attempt, EMAIL_RETRY_MAX, "dry_run", count_attempt=False)
+            return "deferred"
+
+        try:
+            get_limiter(self.vault_path).check("email_send")
+        except RateLimitExceededError as e:
+            # Not the provider's fault — wait out the window, don't count an attempt
+            self._requeue(path, attempt, e.reset_in + random.uniform(0, EMAIL_RETRY_BASE),
+                          "rate_limited", count_attempt=False)
+            return "deferred"
+
+        attachment = _field(content, "attachment")
+        try:
+            ok = self.send(to, subject, _body(content), cc=_field(content, "cc") or None,
+                           attachment_path=(self.vault_path / attachment) if attachment else None)
+            error = "" if ok else "send returned failure"
+        except Exception as e:
+            ok, error = False, f"{type(e).__name__}: {e}"
+
+        if ok:
+            self.breaker.success()
+            self._delivered(path, content, attempt)
+            return "sent"
+
+        self.breaker.failure()
+        attempt += 1
+        if attempt >= EMAIL_MAX_ATTEMPTS:
+            self._give_up(path, to, subject, attempt, error)
+        else:
+            self._requeue(path, attempt, backoff_seconds(attempt), error)
+            logger.warning(f"Queued email to {to} failed (attempt {attempt}/{EMAIL_MAX_ATTEMPTS}) — "
+                           f"breaker {self.breaker.state}")
+        return "failed"
+
+    def _requeue(self, path: Path, attempt: int, delay: float, error: str,
+                 count_attempt: bool = True) -> None:
+        due = datetime.now(timezone.utc) + timedelta(seconds=delay)
+        fields = {"next_attempt_at": due.isoformat(), "last_error": error}
+        if count_attempt:
+            fields["retry_count"] = attempt
+        _set_fields(path, **fields)
+        heapq.heappush(self._heap, (due.timestamp(), path.name))
+
+    def _delivered(self, path: Path, content: str, attempt: int) -> None:
+        to, subject = _field(content, "to"), _field(content, "subject")
+        _set_fields(path, status="sent", sent_at=datetime.now(timezone.utc).isoformat())
+        done = self.vault_path / "Done"
+        done.mkdir(exist_ok=True)
+        path.replace(done / path.name.replace("EMAIL_QUEUED_", "EMAIL_SENT_"))
+        self._known.discard(path.name)
+
+        record = _field(content, "record_file")
+        if record and (self.vault_path / record).exists():
+            rec = self.vault_path / record
+            rec.write_text(rec.read_text(encoding="utf-8").replace(
+                "\nstatus: send_deferred\n", "\nstatus: sent\n", 1), encoding="utf-8")
+
+        logger.info(f"Queued email sent to {to}: {subject} (after {attempt} retr{'y' if attempt == 1 else 'ies'})")
+        self.log_action("email_send", to, "success",
+                        {"subject": subject, "queued": True, "retry_count": attempt, "file": path.name})
+
+    def _give_up(self, path: Path, to: str, subject: str, attempt: int, error: str) -> None:
+        _set_fields(path, status="failed", retry_count=attempt, last_error=error)
+        quarantine = self.vault_path / "Quarantine"
+        quarantine.mkdir(exist_ok=True)
+        path.replace(quarantine / path.name)
+        self._known.discard(path.name)
+        logger.error(f"Queued email to {to} failed {attempt} times — moved to /Quarantine/")
+        self.log_action("email_queue_failed", to, "error",
+                        {"subject": subject, "retry_count": attempt, "error": error, "file": path.name})
+
+        needs_action = self.vault_path / "Needs_Action"
+        needs_action.mkdir(exist_ok=True)
+        (needs_action / f"ALERT_email_undeliverable_{path.stem}.md").write_text(
+            f"""---
+type: alert
+severity: medium
+source: email_queue
+created: {datetime.now(timezone.utc).isoformat()}
+---
+
+## Email Could Not Be Delivered
+
+**To:** {to}
+**Subject:** {subject}
+**Attempts:** {attempt}
+**Last error:** {error}
+
+The message is in `/Quarantine/{path.name}`. Fix the cause, set `status: queued`
+and `retry_count: 0`, and move it back to `/Queue/` to retry.
+""",
+            encoding="utf-8",
+        )
+
+    def status(self) -> dict:
+        self.refresh()
+        nd = self.next_due()
+        return {
+            "queued": len(self._heap),
+            "next_due": nd.isoformat() if nd else None,
+            "breaker": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+        }
+
+
+# ── CLI ────────────────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    import sys
+    vault = Path(os.getenv("VAULT_PATH", "./AI_Employee_Vault")).resolve()
+    if len(sys.argv) > 1 and sys.argv[1] == "status":
+        q = OutboundQueue(vault, send=lambda *a, **k: False)
+        q.refresh()
+        for due, name in sorted(q._heap):
+            print(f"{datetime.fromtimestamp(due, timezone.utc).isoformat()}  {name}")
+        print(f"{len(q._heap)} queued")
+    else:
+        print("Usage: python email_queue.py status")
@@ -0,0 +1,262 @@
+"""
+google_quota.py — Cross-process Google API quota budget for the AI Employee.
+
+Gmail quota is spent by several independent processes (Gmail watcher, Gmail
+MCP, Email MCP, orchestrator sends, Calendar MCP). This module gives them one
+shared, file-backed token bucket per API, charged with Google's per-method
+quota-unit weights, so the processes stop racing each other into 429s.
+
+Priority classes — a reservation may only dip the bucket down to its floor:
+  send         → 0%  of capacity   (outbound email always goes first)
+  interactive  → 15% of capacity   (MCP reads a human is waiting on)
+  poll         → 40% of capacity   (background watchers defer first)
+
+A real 429 from Google calls record_error()/throttled(), which empties the bucket for every
+process until the Retry-After passes — one shared backoff instead of each
+caller's with_retry hammering the API independently.
+
+State file: {vault_path}/Logs/.google_quota.json (fcntl-locked where available)
+
+Defaults (overridable via .env):
+  GMAIL_QUOTA_UNITS_PER_MINUTE     6000   (Google's per-user limit is 15,000)
+  CALENDAR_QUOTA_UNITS_PER_MINUTE   300
+
+Usage:
+    from google_quota import get_quota, QuotaExhaustedError, PRIORITY_POLL
+
+    quota = get_quota(vault_path)
+    if not quota.try_reserve("gmail.messages.list", priority=PRIORITY_POLL):
+        return []                                    # defer this poll
+
+    quota.reserve("gmail.messages.send", priority=PRIORITY_SEND, timeout=60)
+"""
+
+import os
+import json
+import time
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from retry_handler import TransientError
+
+try:
+    import fcntl
+except ImportError:  # Windows — fall back to in-process best effort
+    fcntl = None
+
+logger = logging.getLogger("google_quota")
+
+# Google quota units per call (Gmail API usage limits; Calendar counts 1 per request)
+METHOD_COSTS: dict[str, int] = {
+    "gmail.messages.list":     5,
+    "gmail.messages.get":      5,
+    "gmail.messages.send":   100,
+    "gmail.messages.modify":   5,
+    "gmail.drafts.create":    10,
+    "gmail.threads.get":      10,
+    "calendar.events.list":    1,
+    "calendar.events.insert":  1,
+    "calendar.events.update":  1,
+    "calendar.events.delete":  1,
+}
+
+BUDGETS: dict[str, int] = {
+    "gmail":    int(os.getenv("GMAIL_QUOTA_UNITS_PER_MINUTE",    "6000")),
+    "calendar": int(os.getenv("CALENDAR_QUOTA_UNITS_PER_MINUTE", "300")),
+}
+
+PRIORITY_SEND        = "send"
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_POLL        = "poll"
+
+# Fraction of the bucket each class must leave untouched
+PRIORITY_FLOORS: dict[str, float] = {
+    PRIORITY_SEND:        0.0,
+    PRIORITY_INTERACTIVE: 0.15,
+    PRIORITY_POLL:        0.40,
+}
+
+DEFAULT_RETRY_AFTER = 60  # seconds to freeze an API after a 429 without Retry-After
+
+
+class QuotaExhaustedError(TransientError):
+    """The shared budget cannot cover this call within the allowed wait."""
+    def __init__(self, method: str, cost: int, available: float, wait: float):
+        self.method    = method
+        self.cost      = cost
+        self.available = available
+        self.wait      = wait
+        self.retry_after = wait   # honoured by with_retry — no blind retries
+        super().__init__(
+            f"Google API quota budget exhausted for '{method}' "
+            f"(needs {cost} units, {available:.0f} available above floor). "
+            f"Retry in {wait:.0f}s."
+        )
+
+
+class QuotaBudget:
+    """
+    File-backed token bucket per API, refilled continuously at
+    BUDGETS[api] units per minute and capped at one minute's worth.
+
+    Format: { "gmail": {"tokens": 5400.0, "updated": 1760000000.0, "blocked_until": 0} }
+    """
+
+    def __init__(self, vault_path: Path):
+        logs_dir = vault_path / "Logs"
+        logs_dir.mkdir(parents=True, exist_ok=True)
+        self._state_file = logs_dir / ".google_quota.json"
+
+    # ── State I/O (under an exclusive lock) ───────────────────────────────────
+
+    @contextmanager
+    def _locked_state(self):
+        with open(self._state_file, "a+", encoding="utf-8") as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or "{}")
+                except json.JSONDecodeError:
+                    state = {}
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state, indent=2))
+                f.flush()
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _refill(state: dict, api: str, now: float) -> dict:
+        capacity = BUDGETS[api]
+        bucket = state.setdefault(api, {"tokens": float(capacity), "updated": now, "blocked_until": 0})
+        elapsed = max(now - bucket["updated"], 0.0)
+        bucket["tokens"] = min(capacity, bucket["tokens"] + elapsed * capacity / 60.0)
+        bucket["updated"] = now
+        return bucket
+
+    @staticmethod
+    def _cost(method: str, count: int) -> tuple[str, int]:
+        if method not in METHOD_COSTS:
+            raise KeyError(f"Unknown Google API method '{method}' — add it to METHOD_COSTS")
+        return method.split(".", 1)[0], METHOD_COSTS[method] * count
+
+    # ── Public API ─────────────────────────────────────────────────────────────
+
+    def try_reserve(self, method: str, count: int = 1, priority: str = PRIORITY_INTERACTIVE) -> bool:
+        """Reserve `count` calls of `method` if the budget allows right now."""
+        return self._attempt(method, count, priority) == 0.0
+
+    def _attempt(self, method: str, count: int, priority: str) -> float:
+        """Reserve if possible. Returns 0.0 on success, else seconds until it would succeed."""
+        api, cost = self._cost(method, count)
+        capacity = BUDGETS[api]
+        floor = capacity * PRIORITY_FLOORS.get(priority, PRIORITY_FLOORS[PRIORITY_POLL])
+        now = time.time()
+        with self._locked_state() as state:
+            bucket = self._refill(state, api, now)
+            if bucket["blocked_until"] > now:
+                return bucket["blocked_until"] - now
+            available = bucket["tokens"] - floor
+            if available >= cost:
+                bucket["tokens"] -= cost
+                return 0.0
+            if cost > capacity - floor:
+                return float("inf")   # can never fit under this priority
+            return (cost - available) * 60.0 / capacity
+
+    def reserve(self, method: str, count: int = 1, priority: str = PRIORITY_INTERACTIVE,
+                timeout: float = 30.0) -> None:
+        """
+        Block up to `timeout` seconds for budget, then reserve it.
+        Raises QuotaExhaustedError if the wait would be longer.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            wait = self._attempt(method, count, priority)
+            if wait == 0.0:
+                return
+            remaining = deadline - time.monotonic()
+            if wait > remaining:
+                api, cost = self._cost(method, count)
+                raise QuotaExhaustedError(method, cost, self.available(api, priority), wait)
+            time.sleep(min(wait, remaining) + 0.05)
+
+    def throttled(self, api: str, retry_after: Optional[float] = None) -> None:
+        """Record a 429 from Google: drain the bucket and block all callers for a while."""
+        now = time.time()
+        with self._locked_state() as state:
+            bucket = self._refill(state, api, now)
+            bucket["tokens"] = 0.0
+            bucket["blocked_until"] = now + (retry_after or DEFAULT_RETRY_AFTER)
+        logger.warning(f"{api} API throttled by Google — all callers paused "
+                       f"for {retry_after or DEFAULT_RETRY_AFTER}s")
+
+    def record_error(self, api: str, exc: Exception) -> bool:
+        """If `exc` is a Google 429, throttle `api` for every process. Returns True if it was."""
+        if not is_rate_limited(exc):
+            return False
+        headers = getattr(exc, "resp", None) or {}
+        try:
+            retry_after = float(headers.get("retry-after", 0)) or None
+        except (TypeError, ValueError, AttributeError):
+            retry_after = None
+        self.throttled(api, retry_after)
+        return True
+
+    def available(self, api: str, priority: str = PRIORITY_SEND) -> float:
+        """Units currently usable by `priority` (0 while throttled)."""
+        now = time.time()
+        with self._locked_state() as state:
+            bucket = self._refill(state, api, now)
+            if bucket["blocked_until"] > now:
+                return 0.0
+            return max(bucket["tokens"] - BUDGETS[api] * PRIORITY_FLOORS.get(priority, 0.0), 0.0)
+
+    def status(self) -> dict:
+        """Return current budget for every API."""
+        now = time.time()
+        result = {}
+        with self._locked_state() as state:
+            for api, capacity in BUDGETS.items():
+                bucket = self._refill(state, api, now)
+                result[api] = {
+                    "tokens":        round(bucket["tokens"], 1),
+                    "capacity":      capacity,
+                    "blocked_for_s": max(0, round(bucket["blocked_until"] - now)),
+                }
+        return result
+
+
+def is_rate_limited(exc: Exception) -> bool:
+    """True if a Google API exception is a 429 / quota-exceeded response."""
+    status = getattr(getattr(exc, "resp", None), "status", None)
+    if status == 429:
+        return True
+    msg = str(exc).lower()
+    return "429" in msg or "ratelimitexceeded" in msg or "userratelimitexceeded" in msg
+
+
+# ── Module-level singleton (lazy-init) ────────────────────────────────────────
+_default_quota: Optional[QuotaBudget] = None
+
+
+def get_quota(vault_path: Optional[Path] = None) -> QuotaBudget:
+    """Return the module-level quota budget (creates if not yet initialised)."""
+    global _default_quota
+    if _default_quota is None:
+        vp = vault_path or Path(os.getenv("VAULT_PATH", "./AI_Employee_Vault")).resolve()
+        _default_quota = QuotaBudget(vp)
+    return _default_quota
+
+
+# ── CLI ────────────────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    for api, s in get_quota().status().items():
+        blocked = f"  (throttled {s['blocked_for_s']}s)" if s["blocked_for_s"] else ""
+        print(f"{api:<10} {s['tokens']:>8.0f} / {s['capacity']:<6} units{blocked}")
@@ -0,0 +1,574 @@
+"""
+invoice_batch.py — Month-end batch invoicing for the AI Employee.
+
+Runs many invoices as ONE job instead of one serial main-loop iteration each:
+
+  1. Collect jobs — every approved `create_invoice` request in /Approved/, or a
+     customer list (CSV, or the "Approved Clients" table in Accounting/Rates.md).
+  2. Write the /Invoices/ records, numbered INV-YYYYMMDD-NNN after the ones
+     already issued today.
+  3. Render the PDFs in parallel across a process pool. Each worker lays out
+     the static page (header, labels, table frame, footer) ONCE and fills only
+     the per-invoice fields into a copy of it.
+  4. Email them concurrently (INVOICE_SEND_CONCURRENCY) under the shared
+     `email_send` rate limit. Invoices over the limit, and sends that fail,
+     go to the outbound queue (email_queue.py) for retry.
+
+A customer list is never sent directly. It becomes one approval file
+(HITL — Handbook §6) in /Pending_Approval/, and the orchestrator runs the
+batch once a human moves that file to /Approved/.
+
+Usage:
+    uv run invoice-batch --rates                     # every client in Rates.md
+    uv run invoice-batch --csv customers.csv         # columns: customer,email,amount[,description]
+    uv run invoice-batch --rates --dry-run           # preview only
+
+Configure:
+    INVOICE_BATCH_WORKERS=0          # PDF render processes (0 = CPU count)
+    INVOICE_SEND_CONCURRENCY=4       # parallel email sends
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import csv
+import copy
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+from dotenv import load_dotenv
+
+from audit_logger import write_log_entry, infer_approval
+from email_queue import enqueue
+from rate_limiter import get_limiter, RateLimitExceededError
+
+load_dotenv()
+
+logger = logging.getLogger("InvoiceBatch")
+
+INVOICE_BATCH_WORKERS    = int(os.getenv("INVOICE_BATCH_WORKERS", "0")) or None
+INVOICE_SEND_CONCURRENCY = int(os.getenv("INVOICE_SEND_CONCURRENCY", "4"))
+_PARALLEL_MIN = 8   # below this, spinning up worker processes costs more than it saves
+
+DEFAULT_DESCRIPTION = "Professional Services"
+
+
+@dataclass
+class InvoiceJob:
+    """One invoice to create, render and (optionally) email."""
+    customer: str
+    amount: str
+    to: str = ""
+    description: str = DEFAULT_DESCRIPTION
+    source: str = ""                       # approval file name that requested it
+    invoice_no: str = ""
+    invoice_file: Optional[Path] = None
+    pdf_path: Optional[Path] = None
+    status: str = "pending"                # created | sent | send_failed | send_deferred
+
+
+# ── PDF layout (cached per process) ───────────────────────────────────────────
+
+# Per-process template: (FPDF with the static page drawn, {slot: geometry})
+_TEMPLATE: Optional[tuple] = None
+
+
+def _build_template() -> tuple:
+    """
+    Draw everything that is the same on every invoice and record where the
+    variable fields go. Same layout as the original single-invoice renderer.
+    """
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_margins(20, 20, 20)
+    slots: dict[str, tuple] = {}
+
+    def slot(name: str, w: float, h: float, ln: bool = False, align: str = "",
+             border: int = 0, color: tuple = (0, 0, 0)):
+        slots[name] = (pdf.get_x(), pdf.get_y(), w, h, align,
+                       (pdf.font_family, pdf.font_style, pdf.font_size_pt), color)
+        pdf.cell(w, h, "", border=border, ln=ln, align=align)
+
+    # Header
+    pdf.set_font("Helvetica", "B", 22)
+    pdf.set_text_color(30, 80, 160)
+    pdf.cell(0, 12, "INVOICE", ln=True, align="C")
+    pdf.set_draw_color(30, 80, 160)
+    pdf.set_line_width(0.8)
+    pdf.line(20, pdf.get_y(), 190, pdf.get_y())
+    pdf.ln(6)
+
+    # Meta row
+    pdf.set_font("Helvetica", "", 10)
+    pdf.set_text_color(80, 80, 80)
+    slot("date", 95, 7, color=(80, 80, 80))
+    slot("invoice_no", 95, 7, ln=True, align="R", color=(80, 80, 80))
+    pdf.ln(4)
+
+    # Bill To
+    pdf.set_font("Helvetica", "B", 11)
+    pdf.set_text_color(0, 0, 0)
+    pdf.cell(0, 7, "Bill To:", ln=True)
+    pdf.set_font("Helvetica", "", 11)
+    slot("customer", 0, 7, ln=True)
+    pdf.ln(6)
+
+    # Line items table header
+    pdf.set_fill_color(240, 244, 255)
+    pdf.set_font("Helvetica", "B", 10)
+    pdf.cell(110, 8, "Description", border=1, fill=True)
+    pdf.cell(40,  8, "Qty", border=1, fill=True, align="C")
+    pdf.cell(40,  8, "Amount", border=1, fill=True, align="R", ln=True)
+
+    # Line item
+    pdf.set_font("Helvetica", "", 10)
+    slot("description", 110, 8, border=1)
+    pdf.cell(40,  8, "1", border=1, align="C")
+    slot("line_amount", 40, 8, ln=True, align="R", border=1)
+    pdf.ln(2)
+
+    # Total
+    pdf.set_font("Helvetica", "B", 11)
+    pdf.cell(150, 9, "TOTAL DUE", align="R")
+    slot("total", 40, 9, ln=True, align="R", border=1)
+    pdf.ln(8)
+
+    # Footer note
+    pdf.set_font("Helvetica", "I", 9)
+    pdf.set_text_color(100, 100, 100)
+    pdf.cell(0, 6, "Payment due within 30 days. Thank you for your business.", ln=True, align="C")
+    return pdf, slots
+
+
+def render_invoice_pdf(customer: str, amount: str, date_str: str, pdf_path: Path,
+                       invoice_no: str = "", description: str = DEFAULT_DESCRIPTION) -> Path:
+    """Render one invoice PDF from the cached layout. Raises on failure."""
+    global _TEMPLATE
+    if _TEMPLATE is None:
+        _TEMPLATE = _build_template()
+    template, slots = _TEMPLATE
+
+    pdf = copy.deepcopy(template)
+    values = {
+        "date":        f"Date: {date_str}",
+        "invoice_no":  f"Invoice #: {invoice_no or 'INV-' + date_str.replace('-', '')}",
+        "customer":    customer,
+        "description": description,
+        "line_amount": f"${amount}",
+        "total":       f"${amount}",
+    }
+    for name, text in values.items():
+        x, y, w, h, align, font, color = slots[name]
+        pdf.set_font(*font)
+        pdf.set_text_color(*color)
+        pdf.set_xy(x, y)
+        pdf.cell(w, h, text, align=align)
+    pdf.output(str(pdf_path))
+    return pdf_path
+
+
+def _render_job(args: tuple) -> tuple[str, Optional[str], str]:
+    """Process-pool worker: returns (invoice_no, pdf path or None, error)."""
+    customer, amount, date_str, pdf_path, invoice_no, description = args
+    try:
+        render_invoice_pdf(customer, amount, date_str, Path(pdf_path), invoice_no, description)
+        return invoice_no, pdf_path, ""
+    except Exception as e:
+        return invoice_no, None, f"{type(e).__name__}: {e}"
+
+
+# ── Invoice records ───────────────────────────────────────────────────────────
+
+def invoice_email_body(customer: str, amount: str, date_str: str) -> str:
+    return f"""Dear {customer},
+
+Please find your invoice for services rendered.
+
+**Invoice Details**
+- Date: {date_str}
+- Amount Due: ${amount}
+
+Payment is due within 30 days. Thank you for your business.
+
+Best regards,
+AI Employee"""
+
+
+def invoice_subject(job: InvoiceJob, date_str: str) -> str:
+    return f"Invoice — {job.customer} — {date_str} — ${job.amount}"
+
+
+def write_invoice_record(vault_path: Path, job: InvoiceJob, date_str: str) -> Path:
+    """Create the /Invoices/ markdown record for `job` (unique name per batch)."""
+    invoices = vault_path / "Invoices"
+    invoices.mkdir(exist_ok=True)
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    stem = f"INVOICE_{timestamp}_{job.customer.replace(' ', '_')}"
+    invoice_file = invoices / f"{stem}.md"
+    n = 1
+    while invoice_file.exists():
+        invoice_file = invoices / f"{stem}_{n}.md"
+        n += 1
+
+    invoice_file.write_text(
+        f"""---
+type: invoice
+customer: {job.customer}
+amount: {job.amount}
+to: {job.to}
+invoice_no: {job.invoice_no}
+created: {datetime.now(timezone.utc).isoformat()}
+status: created
+source_approval: {job.source}
+---
+
+# Invoice — {job.customer}
+
+**Amount:** ${job.amount}
+**Date:** {date_str}
+**Status:** Created
+
+{invoice_email_body(job.customer, job.amount, date_str)}
+""",
+        encoding="utf-8",
+    )
+    job.invoice_file = invoice_file
+    job.status = "created"
+    return invoice_file
+
+
+def allocate_invoice_numbers(vault_path: Path, date_str: str, count: int) -> list[str]:
+    """
+    `count` fresh INV-YYYYMMDD-NNN numbers, continuing after the highest number
+    already used today. Today's records are the INVOICE_<YYYYMMDD>T*.md files
+    written by write_invoice_record, so only those are read.
+    """
+    compact = date_str.replace("-", "")
+    base_no = f"INV-{compact}"
+    used = re.compile(rf"^invoice_no: {base_no}(?:-(\d+))?\s*$", re.MULTILINE)
+    last = 0
+    for record in (vault_path / "Invoices").glob(f"INVOICE_{compact}T*.md"):
+        try:
+            head = record.read_text(encoding="utf-8")[:2048]
+        except OSError:
+            continue
+        for m in used.finditer(head):
+            last = max(last, int(m.group(1) or 1))   # pre-suffix records: INV-YYYYMMDD = 001
+    return [f"{base_no}-{n:03d}" for n in range(last + 1, last + 1 + count)]
+
+
+def _set_record_status(job: InvoiceJob, status: str) -> None:
+    job.status = status
+    if job.invoice_file and job.invoice_file.exists():
+        text = job.invoice_file.read_text(encoding="utf-8")
+        job.invoice_file.write_text(text.replace("\nstatus: created\n", f"\nstatus: {status}\n", 1),
+                                    encoding="utf-8")
+
+
+def _queue_deferred(vault_path: Path, job: InvoiceJob, date_str: str, reason: str) -> Path:
+    """§7.3 — park an invoice email in /Queue/ when the send budget is spent."""
+    return enqueue(
+        vault_path, job.to, invoice_subject(job, date_str),
+        invoice_email_body(job.customer, job.amount, date_str),
+        reason=reason,
+        attachment=str(job.pdf_path.relative_to(vault_path)) if job.pdf_path else "",
+        record_file=str(job.invoice_file.relative_to(vault_path)),
+        name=job.invoice_file.stem,
+    )
+
+
+# ── Batch run ─────────────────────────────────────────────────────────────────
+
+def render_all(jobs: list[InvoiceJob], date_str: str, workers: Optional[int] = None) -> int:
+    """Render every job's PDF; in a process pool when the batch is big enough. Returns failures."""
+    args = [(j.customer, j.amount, date_str, str(j.invoice_file.with_suffix(".pdf")),
+             j.invoice_no, j.description) for j in jobs]
+    if len(jobs) >= _PARALLEL_MIN and (workers or INVOICE_BATCH_WORKERS or os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor(max_workers=workers or INVOICE_BATCH_WORKERS) as pool:
+            results = list(pool.map(_render_job, args, chunksize=max(1, len(args) // 32)))
+    else:
+        results = [_render_job(a) for a in args]
+
+    failures = 0
+    for job, (_, pdf_path, error) in zip(jobs, results):
+        if pdf_path:
+            job.pdf_path = Path(pdf_path)
+        else:
+            failures += 1
+            logger.error(f"PDF generation failed for {job.customer}: {error}")
+    return failures
+
+
+def run_invoice_batch(vault_path: Path, jobs: list[InvoiceJob],
+                      send: Optional[Callable[..., bool]] = None,
+                      dry_run: bool = True, workers: Optional[int] = None,
+                      on_done: Optional[Callable[[InvoiceJob], None]] = None) -> dict:
+    """
+    Create, render and email every job. `send(to, subject, body, attachment_path=...)`
+    delivers one email and returns True on success (the orchestrator passes its
+    Gmail sender). `on_done(job)` is called as soon as a job reaches its final
+    status, so a crash later in the batch cannot make it run (and send) again.
+    Returns a summary dict; also writes one `invoice_batch` audit entry.
+    """
+    vault_path = Path(vault_path)
+    now = datetime.now(timezone.utc)
+    date_str = now.strftime("%Y-%m-%d")
+    numbers = iter(allocate_invoice_numbers(vault_path, date_str, sum(not j.invoice_no for j in jobs)))
+    for job in jobs:
+        job.invoice_no = job.invoice_no or next(numbers)
+        write_invoice_record(vault_path, job, date_str)
+        _log(vault_path, "invoice_created", job.customer, "success",
+             {"invoice_file": job.invoice_file.name, "amount": job.amount}, dry_run)
+
+    pdf_failures = render_all(jobs, date_str, workers) if jobs else 0
+
+    sent = failed = deferred = 0
+    to_send = [j for j in jobs if j.to]
+    for job in jobs:
+        if dry_run or not job.to or send is None:
+            _done(job, on_done)
+    if to_send and dry_run:
+        for job in to_send:
+            logger.info(f"[DRY RUN] Would email invoice to {job.to}: ${job.amount}"
+                        + (f" with PDF {job.pdf_path.name}" if job.pdf_path else ""))
+    elif to_send and send is not None:
+        # Reserve send slots up front (file-backed limiter, single thread), then
+        # deliver the allowed ones concurrently.
+        limiter, allowed = get_limiter(vault_path), []
+        for job in to_send:
+            try:
+                limiter.check("email_send")
+                allowed.append(job)
+            except RateLimitExceededError as e:
+                queue_file = _queue_deferred(vault_path, job, date_str, "rate_limited")
+                _set_record_status(job, "send_deferred")
+                deferred += 1
+                _log(vault_path, "invoice_email_deferred", job.to, "rate_limited",
+                     {"customer": job.customer, "queue_file": queue_file.name, "reset_in": e.reset_in},
+                     dry_run)
+                _done(job, on_done)
+
+        def _deliver(job: InvoiceJob) -> bool:
+            try:
+                return send(job.to, invoice_subject(job, date_str),
+                            invoice_email_body(job.customer, job.amount, date_str),
+                            attachment_path=job.pdf_path)
+            except Exception as e:
+                logger.error(f"Invoice email to {job.to} failed: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=max(1, INVOICE_SEND_CONCURRENCY)) as pool:
+            for job, ok in zip(allowed, pool.map(_deliver, allowed)):
+                details = {"customer": job.customer, "amount": job.amount,
+                           "pdf_attached": job.pdf_path is not None}
+                status = "sent" if ok else "send_failed"
+                if not ok:
+                    # Retried from the outbound queue, which marks the record sent on delivery
+                    try:
+                        details["queue_file"] = _queue_deferred(vault_path, job, date_str, "send_failed").name
+                        status = "send_deferred"
+                    except Exception as e:
+                        logger.error(f"Could not queue invoice email to {job.to}: {e}")
+                _set_record_status(job, status)
+                sent += ok
+                failed += not ok
+                _log(vault_path, "invoice_emailed", job.to, "success" if ok else "error", details, dry_run)
+                _done(job, on_done)
+
+    for job in jobs:
+        if not job.to:
+            logger.warning(f"No email address for invoice — {job.customer}. Record saved to /Invoices/")
+
+    summary = {
+        "invoices": len(jobs),
+        "total": round(sum(_amount(j.amount) for j in jobs), 2),
+        "pdf_failures": pdf_failures,
+        "emailed": sent,
+        "email_failed": failed,
+        "email_deferred": deferred,
+        "no_email": len(jobs) - len(to_send),
+        "dry_run": dry_run,
+        "elapsed_seconds": round((datetime.now(timezone.utc) - now).total_seconds(), 2),
+    }
+    _log(vault_path, "invoice_batch", f"{len(jobs)} invoices", "success" if not failed else "partial",
+         summary, dry_run)
+    logger.info(f"Invoice batch: {summary}")
+    return summary
+
+
+def _done(job: InvoiceJob, on_done: Optional[Callable[[InvoiceJob], None]]) -> None:
+    if on_done is not None:
+        on_done(job)
+
+
+# ── Job sources ───────────────────────────────────────────────────────────────
+
+def _amount(value: str) -> float:
+    try:
+        return float(re.sub(r"[^\d.\-]", "", value or "") or 0)
+    except ValueError:
+        return 0.0
+
+
+def _frontmatter_field(content: str, field: str) -> str:
+    for line in content.split("\n"):
+        if line.startswith(f"{field}:"):
+            return line.split(":", 1)[1].strip()
+    return ""
+
+
+def job_from_approval(approved_file: Path, content: str) -> InvoiceJob:
+    """Build a job from an approved `create_invoice` approval request."""
+    return InvoiceJob(
+        customer=_frontmatter_field(content, "customer"),
+        amount=_frontmatter_field(content, "amount"),
+        to=_frontmatter_field(content, "to") or _frontmatter_field(content, "email"),
+        description=_frontmatter_field(content, "description") or DEFAULT_DESCRIPTION,
+        source=approved_file.name,
+    )
+
+
+def jobs_from_csv(csv_path: Path) -> list[InvoiceJob]:
+    """Read `customer,email,amount[,description]` rows (header required)."""
+    jobs = []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            row = {(k or "").strip().lower(): (v or "").strip() for k, v in row.items()}
+            customer = row.get("customer") or row.get("client") or ""
+            amount = row.get("amount") or row.get("rate") or ""
+            if not customer or _amount(amount) <= 0:
+                continue
+            jobs.append(InvoiceJob(customer=customer, amount=f"{_amount(amount):.2f}",
+                                   to=row.get("email") or row.get("to") or "",
+                                   description=row.get("description") or DEFAULT_DESCRIPTION,
+                                   source=csv_path.name))
+    return jobs
+
+
+def jobs_from_rates(vault_path: Path) -> list[InvoiceJob]:
+    """Read the "Approved Clients" table in Accounting/Rates.md (placeholder rows skipped)."""
+    rates = vault_path / "Accounting" / "Rates.md"
+    if not rates.exists():
+        return []
+    jobs, header, in_clients = [], None, False
+    for line in rates.read_text(encoding="utf-8").splitlines():
+        if line.startswith("## "):
+            in_clients = line.strip().lower() == "## approved clients"
+            header = None
+            continue
+        if not in_clients or not line.startswith("|"):
+            continue
+        cells = [c.strip() for c in line.strip().strip("|").split("|")]
+        if header is None:
+            header = [c.lower() for c in cells]
+            continue
+        if set("".join(cells)) <= set("-: "):
+            continue
+        row = dict(zip(header, cells))
+        customer, amount = row.get("client", ""), row.get("rate", "")
+        if not customer or customer.startswith("_") or _amount(amount) <= 0:
+            continue
+        email = row.get("email", "")
+        jobs.append(InvoiceJob(customer=customer, amount=f"{_amount(amount):.2f}",
+                               to="" if email in ("", "—", "-") else email,
+                               source="Accounting/Rates.md"))
+    return jobs
+
+
+def request_batch_approval(vault_path: Path, jobs: list[InvoiceJob], source: str) -> Path:
+    """Write the customer list and ONE approval file covering the whole batch."""
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    batch_dir = vault_path / "Accounting" / "Invoice_Batches"
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    rows_file = batch_dir / f"BATCH_{ts}.csv"
+    with open(rows_file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["customer", "email", "amount", "description"])
+        for job in jobs:
+            writer.writerow([job.customer, job.to, job.amount, job.description])
+
+    total = sum(_amount(j.amount) for j in jobs)
+    table = "\n".join(f"| {j.customer} | {j.to or '—'} | ${j.amount} |" for j in jobs)
+    pending = vault_path / "Pending_Approval"
+    pending.mkdir(exist_ok=True)
+    approval = pending / f"APPROVAL_invoice_batch_{ts}.md"
+    approval.write_text(
+        f"""---
+type: invoice_batch_approval
+action: run_invoice_batch
+rows_file: {rows_file.relative_to(vault_path)}
+invoice_count: {len(jobs)}
+total: {total:.2f}
+source: {source}
+created: {datetime.now(timezone.utc).isoformat()}
+status: pending
+---
+
+## Month-End Invoice Batch — {len(jobs)} invoices, ${total:,.2f}
+
+| Customer | Email | Amount |
+|----------|-------|--------|
+{table}
+
+Move this file to `/Approved/` to create, render and email every invoice above.
+Customers without an email address get a record and PDF only.
+""",
+        encoding="utf-8",
+    )
+    _log(vault_path, "invoice_batch_requested", approval.name, "pending",
+         {"invoice_count": len(jobs), "total": round(total, 2), "source": source}, dry_run=False)
+    return approval
+
+
+def _log(vault_path: Path, action_type: str, target: str, result: str,
+         details: dict, dry_run: bool) -> None:
+    approval_status, approved_by = infer_approval(action_type, dry_run)
+    write_log_entry(
+        logs_dir=vault_path / "Logs",
+        action_type=action_type,
+        actor="invoice_batch",
+        target=target,
+        result=result,
+        parameters=details,
+        approval_status=approval_status,
+        approved_by=approved_by,
+    )
+
+
+# ── CLI ────────────────────────────────────────────────────────────────────────
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [InvoiceBatch] %(levelname)s: %(message)s",
+                        datefmt="%Y-%m-%dT%H:%M:%S")
+    parser = argparse.ArgumentParser(description="Request a month-end invoice batch (HITL)")
+    parser.add_argument("--vault", default=os.getenv("VAULT_PATH", "./AI_Employee_Vault"))
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--rates", action="store_true", help="Invoice every client in Accounting/Rates.md")
+    source.add_argument("--csv", type=Path, help="CSV with customer,email,amount[,description]")
+    parser.add_argument("--dry-run", action="store_true", help="List the batch without writing anything")
+    args = parser.parse_args()
+
+    vault_path = Path(args.vault).resolve()
+    jobs = jobs_from_rates(vault_path) if args.rates else jobs_from_csv(args.csv)
+    if not jobs:
+        print("No billable customers found.")
+        return
+    for job in jobs:
+        print(f"  {job.customer:<30} {job.to or '(no email)':<32} ${job.amount}")
+    if args.dry_run:
+        print(f"[DRY RUN] {len(jobs)} invoices — nothing written.")
+        return
+    approval = request_batch_approval(vault_path, jobs, "Accounting/Rates.md" if args.rates else args.csv.name)
+    print(f"{len(jobs)} invoices awaiting approval: Pending_Approval/{approval.name}")
+
+
+if __name__ == "__main__":
+    main()
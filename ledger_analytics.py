@@ -0,0 +1,248 @@
+"""
+ledger_analytics.py — Vectorized ledger analytics for the banking and audit tools.
+
+Loads the Running Ledger (via ledger_store) into columnar NumPy arrays once and
+answers every rollup with array operations instead of per-row Python loops and
+per-row datetime.strptime():
+
+  dates       datetime64[D]
+  amounts     float64          (positive = income, negative = expense)
+  cat_codes   int32            (index into .categories)
+
+Analytics:
+  - monthly_rollup()      → income / expenses / net per calendar month
+  - category_rollup()     → count / total / mean / percentiles per category
+  - rolling_sum()         → trailing N-day sum of spend or net, per day
+  - percentiles()         → expense size distribution (p50 / p90 / p99 ...)
+  - anomalies()           → leave-one-out per-category z-scores, flags outlying charges
+
+Optional dependency: numpy (`uv sync --extra analytics`).
+
+Usage:
+    from ledger_analytics import LedgerFrame
+
+    frame = LedgerFrame.load(vault_path, days=365)
+    frame.monthly_rollup()
+    frame.anomalies(z_threshold=3.0)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from ledger_store import get_ledger
+
+# Default anomaly threshold and minimum history before a category is scored
+ANOMALY_Z_THRESHOLD: float = 3.0
+ANOMALY_MIN_SAMPLES: int = 3
+
+
+class LedgerFrame:
+    """Columnar, read-only snapshot of the ledger."""
+
+    def __init__(self, dates: list[str], amounts: list[float],
+                 categories: list[str], descriptions: list[str]):
+        self.dates = np.array(dates, dtype="datetime64[D]")
+        self.amounts = np.array(amounts, dtype=np.float64)
+        labels = [c.strip().lower() or "uncategorized" for c in categories]
+        uniq, codes = np.unique(np.array(labels, dtype=str), return_inverse=True)
+        self.categories: list[str] = [str(c) for c in uniq]
+        self.cat_codes = codes.astype(np.int32).reshape(-1)
+        self.descriptions = np.array(descriptions, dtype=object)
+
+    @classmethod
+    def load(cls, vault_path: Path, days: int | None = None) -> "LedgerFrame":
+        """Snapshot the vault ledger, optionally limited to the last `days` days."""
+        frame = cls(*get_ledger(vault_path).columns())
+        if days is not None and len(frame):
+            cutoff = np.datetime64((datetime.now(timezone.utc) - timedelta(days=days)).date(), "D")
+            frame = frame._select(frame.dates > cutoff)
+        return frame
+
+    def _select(self, mask: np.ndarray) -> "LedgerFrame":
+        sub = LedgerFrame.__new__(LedgerFrame)
+        sub.dates = self.dates[mask]
+        sub.amounts = self.amounts[mask]
+        sub.categories = self.categories
+        sub.cat_codes = self.cat_codes[mask]
+        sub.descriptions = self.descriptions[mask]
+        return sub
+
+    def __len__(self) -> int:
+        return int(self.amounts.size)
+
+    # ── Rollups ────────────────────────────────────────────────────────────────
+
+    def monthly_rollup(self) -> list[dict]:
+        """Income, expenses, net and row count per calendar month (oldest first)."""
+        if not len(self):
+            return []
+        months, idx = np.unique(self.dates.astype("datetime64[M]"), return_inverse=True)
+        n = len(months)
+        income = np.bincount(idx, weights=np.where(self.amounts > 0, self.amounts, 0.0), minlength=n)
+        expenses = np.bincount(idx, weights=np.where(self.amounts < 0, self.amounts, 0.0), minlength=n)
+        counts = np.bincount(idx, minlength=n)
+        return [
+            {
+                "month": str(months[i]),
+                "income": round(float(income[i]), 2),
+                "expenses": round(float(expenses[i]), 2),
+                "net": round(float(income[i] + expenses[i]), 2),
+                "count": int(counts[i]),
+            }
+            for i in range(n)
+        ]
+
+    def category_rollup(self, q: tuple[float, ...] = (50, 90)) -> list[dict]:
+        """
+        Count, total, mean and amount percentiles per category, largest spend first.
+        Percentiles are computed on the absolute amount within each category.
+        """
+        if not len(self):
+            return []
+        k = len(self.categories)
+        counts = np.bincount(self.cat_codes, minlength=k)
+        totals = np.bincount(self.cat_codes, weights=self.amounts, minlength=k)
+
+        # Sort once by (category, |amount|) so each category is a contiguous sorted slice
+        order = np.lexsort((np.abs(self.amounts), self.cat_codes))
+        sorted_abs = np.abs(self.amounts)[order]
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+
+        result = []
+        for code in np.flatnonzero(counts):
+            chunk = sorted_abs[bounds[code]:bounds[code + 1]]
+            pct = np.percentile(chunk, q)
+            result.append({
+                "category": self.categories[code],
+                "count": int(counts[code]),
+                "total": round(float(totals[code]), 2),
+                "mean": round(float(totals[code] / counts[code]), 2),
+                "percentiles": {f"p{int(p)}": round(float(v), 2) for p, v in zip(q, pct)},
+            })
+        result.sort(key=lambda r: r["total"])
+        return result
+
+    def rolling_sum(self, window_days: int = 30, expenses_only: bool = True) -> list[dict]:
+        """
+        Trailing `window_days` sum per calendar day between the first and last row.
+        expenses_only=True sums spend as a positive number; False sums net flow.
+        Raises ValueError if window_days < 1.
+        """
+        if window_days < 1:
+            raise ValueError(f"window_days must be at least 1 (got {window_days})")
+        if not len(self):
+            return []
+        values = -np.minimum(self.amounts, 0.0) if expenses_only else self.amounts
+        start = self.dates.min()
+        offsets = (self.dates - start).astype(np.int64)
+        span = int(offsets.max()) + 1
+        daily = np.bincount(offsets, weights=values, minlength=span)
+        csum = np.concatenate(([0.0], np.cumsum(daily)))
+        lo = np.maximum(np.arange(1, span + 1) - window_days, 0)
+        window = csum[1:] - csum[lo]
+        days = start + np.arange(span)
+        return [
+            {"date": str(d), "sum": round(float(v), 2)}
+            for d, v in zip(days, window)
+        ]
+
+    def percentiles(self, q: tuple[float, ...] = (50, 90, 99), category: str = "") -> dict:
+        """Expense-size percentiles, optionally restricted to one category."""
+        mask = self.amounts < 0
+        if category:
+            code = self._code(category)
+            if code is None:
+                return {}
+            mask &= self.cat_codes == code
+        spend = -self.amounts[mask]
+        if not spend.size:
+            return {}
+        return {f"p{int(p)}": round(float(v), 2) for p, v in zip(q, np.percentile(spend, q))}
+
+    def anomalies(self, z_threshold: float = ANOMALY_Z_THRESHOLD,
+                  min_samples: int = ANOMALY_MIN_SAMPLES) -> list[dict]:
+        """
+        Leave-one-out z-score of every row against the OTHER rows of its category:
+        z = (amount - mean_others) / std_others. (A z that includes the row itself
+        can never exceed (n-1)/sqrt(n), so nothing under 11 rows could reach 3.)
+        Rows with |z| >= z_threshold in categories with at least `min_samples`
+        rows, whose other rows have non-zero spread, are returned, most extreme first.
+        `category_mean` is the mean of those other rows.
+        """
+        if not len(self):
+            return []
+        counts = np.bincount(self.cat_codes, minlength=len(self.categories))
+        order = np.lexsort((self.amounts, self.cat_codes))
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        mean = np.zeros(len(self))
+        std = np.zeros(len(self))
+        for code in np.flatnonzero(counts >= max(min_samples, 2)):
+            idx = order[bounds[code]:bounds[code + 1]]
+            # Centre on the median; prefix + suffix sums give each row the moments
+            # of the others without subtracting its own (possibly huge) square
+            d = self.amounts[idx] - self.amounts[idx[(len(idx) - 1) // 2]]
+            s1 = np.concatenate(([0.0], np.cumsum(d)))
+            s2 = np.concatenate(([0.0], np.cumsum(d ** 2)))
+            r1 = np.concatenate((np.cumsum(d[::-1])[::-1], [0.0]))
+            r2 = np.concatenate((np.cumsum((d ** 2)[::-1])[::-1], [0.0]))
+            n = len(idx) - 1
+            shift = (s1[:-1] + r1[1:]) / n
+            mean[idx] = self.amounts[idx] - d + shift
+            std[idx] = np.sqrt(np.maximum((s2[:-1] + r2[1:]) / n - shift ** 2, 0.0))
+        eligible = std > 1e-9
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = np.where(eligible, (self.amounts - mean) / np.where(eligible, std, 1.0), 0.0)
+        hits = np.flatnonzero(eligible & (np.abs(z) >= z_threshold))
+        hits = hits[np.argsort(-np.abs(z[hits]))]
+        return [
+            {
+                "date": str(self.dates[i]),
+                "description": str(self.descriptions[i]),
+                "amount": round(float(self.amounts[i]), 2),
+                "category": self.categories[self.cat_codes[i]],
+                "category_mean": round(float(mean[i]), 2),
+                "z_score": round(float(z[i]), 2),
+            }
+            for i in hits
+        ]
+
+    def _code(self, category: str) -> int | None:
+        try:
+            return self.categories.index(category.strip().lower())
+        except ValueError:
+            return None
+
+
+# ── One-pass summary (MCP tool payload) ────────────────────────────────────────
+
+def summarize(vault_path: Path, days: int | None = None,
+              z_threshold: float = ANOMALY_Z_THRESHOLD) -> dict:
+    """Monthly + category rollups, spend percentiles and anomalies from one snapshot."""
+    frame = LedgerFrame.load(vault_path, days=days)
+    return {
+        "generated": datetime.now(timezone.utc).isoformat(),
+        "days": days,
+        "row_count": len(frame),
+        "monthly": frame.monthly_rollup(),
+        "categories": frame.category_rollup(),
+        "expense_percentiles": frame.percentiles(),
+        "anomalies": frame.anomalies(z_threshold=z_threshold),
+    }
+
+
+# ── CLI ────────────────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    import os
+    import json
+    import argparse
+
+    parser = argparse.ArgumentParser(description="AI Employee — Ledger Analytics")
+    parser.add_argument("--vault", default=os.getenv("VAULT_PATH", "./AI_Employee_Vault"))
+    parser.add_argument("--days", type=int, default=None, help="Limit to the last N days")
+    args = parser.parse_args()
+
+    print(json.dumps(summarize(Path(args.vault).resolve(), days=args.days), indent=2))
@@ -0,0 +1,458 @@
+"""
+ledger_store.py — Structured ledger backend for Bank_Transactions.md.
+
+The Running Ledger used to live only as a markdown table: every read re-parsed
+the table and every append rewrote the whole file. This module keeps the rows
+in a local SQLite database (stdlib, no extra dependency) and treats the
+markdown table as a rendered view of it.
+
+  Source of truth:  {vault}/Accounting/.ledger.db     (local only — gitignored)
+  Rendered view:    {vault}/Accounting/Bank_Transactions.md  (## Running Ledger)
+
+Indexes:
+  - date                        → date-range filters (days back, since/until)
+  - category COLLATE NOCASE     → category filters
+  - (date, amount, description) → duplicate detection for importers
+
+Manual edits to the markdown view are still honoured: the store remembers the
+(mtime_ns, size) of the view it last wrote, and if the file changed behind its
+back the Running Ledger table is re-imported before the next read or write.
+The import is lossless. Every table line is kept verbatim, in file order.
+Rows whose amount cannot be parsed ("TBD", "—") are stored with a NULL amount,
+so queries skip them but the view never loses them.
+
+Appends do not re-render the table. The new line is spliced in after the last
+table row, at a byte offset the store remembers, and only the text after the
+table (Subscriptions Inventory etc.) is rewritten. Rows the user never touched
+are never re-sorted or reformatted.
+
+Usage:
+    from ledger_store import get_ledger
+
+    ledger = get_ledger(vault_path)
+    rows = ledger.query(since="2026-01-01", category="subscription")
+    ledger.append("2026-03-05", "Slack Pro subscription", -12.50, "expense", "subscription")
+    ledger.render()   # rewrite the table from the store (repair only — append() splices in place)
+"""
+
+from __future__ import annotations
+
+import re
+import logging
+import sqlite3
+import threading
+from datetime import date as _date
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger("ledger_store")
+
+_DB_FILE   = "Accounting/.ledger.db"
+_BANK_FILE = "Accounting/Bank_Transactions.md"
+
+_LEDGER_HEADING = "## Running Ledger"
+_TABLE_HEADER = (
+    "| Date | Description | Amount | Type | Category | Status |\n"
+    "|------|-------------|--------|------|----------|--------|"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    date        TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    amount      REAL,                          -- NULL: unparseable row, kept only for the view
+    type        TEXT NOT NULL DEFAULT '',
+    category    TEXT NOT NULL DEFAULT '',
+    status      TEXT NOT NULL DEFAULT 'pending',
+    raw         TEXT NOT NULL DEFAULT ''       -- the markdown line exactly as it appears in the view
+);
+CREATE INDEX IF NOT EXISTS idx_tx_date     ON transactions(date);
+CREATE INDEX IF NOT EXISTS idx_tx_category ON transactions(category COLLATE NOCASE, date);
+CREATE INDEX IF NOT EXISTS idx_tx_dedupe   ON transactions(date, amount, description);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Rows whose date column is a real calendar YYYY-MM-DD value (hand-edited rows may
+# not be — "2026-13-45", "2026-02-30"). SQLite's date() does not reject every
+# impossible day, so the check is a Python function registered on the connection.
+_VALID_DATE = "is_iso_date(date)"
+
+
+def _is_iso_date(value: str) -> bool:
+    try:
+        return len(value) == 10 and _date.fromisoformat(value) is not None
+    except (TypeError, ValueError):
+        return False
+
+_SEPARATOR_RE = re.compile(r"^\|[\s:|-]*-[\s:|-]*$")
+
+
+def format_amount(amount: float) -> str:
+    """Render an amount the way the ledger table shows it: +$2,000.00 / -$16.00."""
+    return f"+${abs(amount):,.2f}" if amount >= 0 else f"-${abs(amount):,.2f}"
+
+
+def format_row(date: str, description: str, amount: float, tx_type: str, category: str, status: str) -> str:
+    return f"| {date} | {description} | {format_amount(amount)} | {tx_type} | {category} | {status} |"
+
+
+def _parse_row(line: str) -> dict:
+    """One table line → row dict. Never drops a line: unparseable amounts become None."""
+    parts = [p.strip() for p in line.strip().strip("|").split("|")]
+    complete = len(parts) >= 6
+    parts += [""] * (6 - len(parts))
+    date, description, amount_str, tx_type, category, status = parts[:6]
+    amount_clean = amount_str.replace("$", "").replace(",", "").replace(" ", "")
+    try:
+        amount = float(amount_clean) if complete else None
+    except ValueError:
+        amount = None
+    return {"date": date, "description": description, "amount": amount, "type": tx_type,
+            "category": category, "status": status, "raw": line}
+
+
+def _scan_ledger(data: bytes) -> tuple[list[dict], Optional[int]]:
+    """
+    Rows of the ## Running Ledger table (header and separator excluded) and the
+    byte offset just past its last line; offset None if the section has no table.
+    """
+    rows: list[dict] = []
+    offset = 0
+    in_section = False
+    table_lines: list[tuple[str, int]] = []   # (line, end offset) of the first contiguous "|" block
+    for raw_line in data.splitlines(keepends=True):
+        line = raw_line.decode("utf-8").rstrip("\r\n")
+        offset += len(raw_line)
+        if line.startswith(_LEDGER_HEADING):
+            in_section = True
+            continue
+        if not in_section:
+            continue
+        if line.startswith("## "):
+            break
+        if line.startswith("|"):
+            table_lines.append((line, offset))
+        elif table_lines:
+            break
+    if not table_lines:
+        return rows, None
+    sep = next((i for i, (l, _) in enumerate(table_lines) if _SEPARATOR_RE.match(l)), None)
+    body = table_lines[sep + 1:] if sep is not None else table_lines
+    rows = [_parse_row(l) for l, _ in body]
+    return rows, table_lines[-1][1]
+
+
+class LedgerStore:
+    """
+    SQLite-backed Running Ledger with the markdown table as a rendered view.
+
+    Appends are an INSERT plus an in-place splice of the new table line. Reads go
+    through the date / category indexes instead of re-parsing Bank_Transactions.md.
+    """
+
+    def __init__(self, vault_path: Path):
+        self.vault_path = Path(vault_path)
+        self.bank_file  = self.vault_path / _BANK_FILE
+        self.db_file    = self.vault_path / _DB_FILE
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.create_function("is_iso_date", 1, _is_iso_date, deterministic=True)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        columns = {r["name"] for r in self._conn.execute("PRAGMA table_info(transactions)")}
+        if columns and "raw" not in columns:
+            # Store from before verbatim rows — rebuild it from the markdown view on first use
+            self._conn.executescript("DROP TABLE transactions; DELETE FROM meta WHERE key = 'view_signature';")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    # ── Markdown view sync ─────────────────────────────────────────────────────
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT INTO meta(key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def _view_signature(self) -> Optional[str]:
+        try:
+            st = self.bank_file.stat()
+        except FileNotFoundError:
+            return None
+        return f"{st.st_mtime_ns}:{st.st_size}"
+
+    def _remember_view(self, table_end: Optional[int]) -> None:
+        self._set_meta("view_signature", self._view_signature() or "")
+        self._set_meta("table_end", "" if table_end is None else str(table_end))
+
+    def refresh(self) -> bool:
+        """
+        Re-import the markdown table if it was edited outside the store.
+        Returns True if an import happened.
+        """
+        with self._lock:
+            signature = self._view_signature()
+            if signature is None or signature == self._get_meta("view_signature"):
+                return False
+            rows, table_end = _scan_ledger(self.bank_file.read_bytes())
+            with self._conn:
+                self._conn.execute("DELETE FROM transactions")
+                self._conn.executemany(
+                    "INSERT INTO transactions(date, description, amount, type, category, status, raw) "
+                    "VALUES (:date, :description, :amount, :type, :category, :status, :raw)",
+                    rows,
+                )
+                self._set_meta("view_signature", signature)
+                self._set_meta("table_end", "" if table_end is None else str(table_end))
+            skipped = sum(r["amount"] is None for r in rows)
+            logger.info(f"Imported {len(rows)} ledger row(s) from {self.bank_file.name}"
+                        + (f" ({skipped} kept verbatim — amount not parseable)" if skipped else ""))
+            return True
+
+    def _splice(self, lines: list[str]) -> bool:
+        """
+        Insert `lines` after the last table row, in place: only the bytes after
+        the table are rewritten. False if the table position is unknown.
+        """
+        end = self._get_meta("table_end")
+        if not end or not self.bank_file.exists():
+            return False
+        end = int(end)
+        with open(self.bank_file, "r+b") as f:
+            f.seek(0, 2)
+            if end > f.tell():
+                return False
+            f.seek(max(end - 1, 0))
+            before = f.read(1) if end else b"\n"
+            tail = f.read()
+            text = "".join(l + "\n" for l in lines).encode("utf-8")
+            if before != b"\n":
+                text = b"\n" + text
+            f.seek(end)
+            f.write(text + tail)
+            f.truncate()
+        with self._conn:
+            self._remember_view(end + len(text))
+        return True
+
+    def render(self) -> bool:
+        """
+        Rewrite the ## Running Ledger table in Bank_Transactions.md from the store,
+        each row exactly as stored, in file order. Other sections are kept as-is.
+        Only needed to repair the view; appends splice their line in place.
+        Returns False if the markdown file or its ledger section is missing.
+        """
+        with self._lock:
+            if not self.bank_file.exists():
+                return False
+            content = self.bank_file.read_text(encoding="utf-8")
+            lines = content.splitlines()
+
+            start = next((i for i, l in enumerate(lines) if l.startswith(_LEDGER_HEADING)), None)
+            if start is None:
+                logger.warning(f"No '{_LEDGER_HEADING}' section in {self.bank_file.name} — view not rendered")
+                return False
+            section_end = next(
+                (i for i in range(start + 1, len(lines)) if lines[i].startswith("## ")), len(lines)
+            )
+            # Table spans from the first "|" line after the heading to the first non-"|" line
+            table_start = next(
+                (i for i in range(start + 1, section_end) if lines[i].startswith("|")), None
+            )
+            if table_start is None:
+                table_start = table_end = start + 1
+            else:
+                table_end = table_start
+                while table_end < len(lines) and lines[table_end].startswith("|"):
+                    table_end += 1
+
+            table = [_TABLE_HEADER] + [
+                r["raw"] for r in self._conn.execute("SELECT raw FROM transactions ORDER BY id")
+            ]
+            new_content = "\n".join(lines[:table_start] + table + lines[table_end:])
+            if content.endswith("\n"):
+                new_content += "\n"
+
+            tmp = self.bank_file.with_suffix(".md.tmp")
+            tmp.write_text(new_content, encoding="utf-8")
+            tmp.replace(self.bank_file)
+            _, table_end_offset = _scan_ledger(new_content.encode("utf-8"))
+            with self._conn:
+                self._remember_view(table_end_offset)
+            return True
+
+    # ── Writes ─────────────────────────────────────────────────────────────────
+
+    def _write_rows(self, rows: list[dict]) -> int:
+        """INSERT rows and splice their lines into the view (full render only if the table is missing)."""
+        with self._lock:
+            self.refresh()
+            for r in rows:
+                r.setdefault("status", "pending")
+                r["raw"] = format_row(r["date"], r["description"], r["amount"],
+                                      r["type"], r["category"], r["status"])
+            with self._conn:
+                cur = self._conn.executemany(
+                    "INSERT INTO transactions(date, description, amount, type, category, status, raw) "
+                    "VALUES (:date, :description, :amount, :type, :category, :status, :raw)",
+                    rows,
+                )
+            if rows and not self._splice([r["raw"] for r in rows]):
+                self.render()
+            return cur.rowcount
+
+    def append(
+        self,
+        date: str,
+        description: str,
+        amount: float,
+        tx_type: str,
+        category: str,
+        status: str = "pending",
+    ) -> int:
+        """
+        Insert one row and splice its line in after the last table row. Cost is
+        one INSERT plus rewriting the text below the table, independent of ledger size.
+        Returns the row id.
+        """
+        with self._lock:
+            self._write_rows([{"date": date, "description": description, "amount": amount,
+                               "type": tx_type, "category": category, "status": status}])
+            return self._conn.execute("SELECT MAX(id) FROM transactions").fetchone()[0]
+
+    def append_many(self, rows: Iterable[dict]) -> int:
+        """
+        Insert many rows in one transaction (keys: date, description, amount,
+        type, category, status?) and splice them into the view in one write.
+        Returns the count.
+        """
+        return self._write_rows([dict(r) for r in rows])
+
+    # ── Reads ──────────────────────────────────────────────────────────────────
+
+    def _matching_values(self, column: str, needle: str) -> list[str]:
+        """
+        Distinct column values containing `needle` (case-insensitive).
+        Preserves the substring semantics of the old markdown filters while
+        letting the main query use an indexed IN (...) lookup.
+        """
+        needle = needle.lower()
+        return [
+            r[0] for r in self._conn.execute(
+                f"SELECT DISTINCT {column} FROM transactions WHERE amount IS NOT NULL")
+            if needle in r[0].lower()
+        ]
+
+    def query(
+        self,
+        since: str = "",
+        until: str = "",
+        category: str = "",
+        tx_type: str = "",
+    ) -> list[dict]:
+        """
+        Return ledger rows (oldest first) filtered by date range and substring
+        matches on category / type. since/until are inclusive YYYY-MM-DD bounds.
+        """
+        with self._lock:
+            self.refresh()
+            clauses: list[str] = ["amount IS NOT NULL"]
+            params: list = []
+            if since or until:
+                clauses.append(_VALID_DATE)
+            if since:
+                clauses.append("date >= ?")
+                params.append(since)
+            if until:
+                clauses.append("date <= ?")
+                params.append(until)
+            for column, needle in (("category", category), ("type", tx_type)):
+                if not needle:
+                    continue
+                values = self._matching_values(column, needle)
+                if not values:
+                    return []
+                clauses.append(f"{column} IN ({','.join('?' * len(values))})")
+                params.extend(values)
+
+            sql = "SELECT date, description, amount, type, category, status FROM transactions"
+            sql += " WHERE " + " AND ".join(clauses)
+            sql += " ORDER BY date, id"
+            return [dict(r) for r in self._conn.execute(sql, params)]
+
+    def all_rows(self) -> list[dict]:
+        """Every parseable ledger row, oldest first — drop-in for _parse_ledger_rows(content)."""
+        return self.query()
+
+    def columns(self) -> tuple[list, list, list, list]:
+        """
+        Dated rows as parallel (dates, amounts, categories, descriptions) lists,
+        oldest first — the input for ledger_analytics' columnar loader.
+        Rows whose date is not a valid YYYY-MM-DD value are skipped.
+        """
+        with self._lock:
+            self.refresh()
+            rows = self._conn.execute(
+                f"SELECT date, amount, category, description FROM transactions "
+                f"WHERE amount IS NOT NULL AND {_VALID_DATE} ORDER BY date, id"
+            ).fetchall()
+        if not rows:
+            return [], [], [], []
+        dates, amounts, categories, descriptions = map(list, zip(*rows))
+        return dates, amounts, categories, descriptions
+
+    def exists(self, date: str, amount: float, description: str) -> bool:
+        """True if an identical (date, amount, description) row is already stored."""
+        with self._lock:
+            self.refresh()
+            return self._conn.execute(
+                "SELECT 1 FROM transactions WHERE date = ? AND amount = ? AND description = ? LIMIT 1",
+                (date, amount, description),
+            ).fetchone() is not None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ── Module-level registry (one store per vault) ────────────────────────────────
+_stores: dict[Path, LedgerStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_ledger(vault_path: Path) -> LedgerStore:
+    """Return the shared LedgerStore for a vault (creates it on first use)."""
+    key = Path(vault_path).resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = LedgerStore(key)
+        return store
+
+
+# ── CLI ────────────────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    import os
+    import sys
+
+    vault = Path(os.getenv("VAULT_PATH", "./AI_Employee_Vault")).resolve()
+    ledger = get_ledger(vault)
+
+    if len(sys.argv) > 1 and sys.argv[1] == "render":
+        ok = ledger.render()
+        print("Rendered Bank_Transactions.md" if ok else "Bank_Transactions.md / Running Ledger not found")
+    else:
+        rows = ledger.all_rows()
+        print(f"Ledger: {ledger.db_file}  ({len(rows)} rows)")
+        for r in rows[-10:]:
+            print(f"  {r['date']}  {format_amount(r['amount']):>12}  {r['category']:<16} {r['description']}")
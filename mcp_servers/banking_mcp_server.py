@@ -1,13 +1,17 @@
 """
 banking_mcp_server.py — Banking MCP Server for the AI Employee.
 
-Exposes 4 MCP tools to Claude:
+Exposes 7 MCP tools to Claude:
   - banking_get_transactions(days?, category?, type?)   → read from Bank_Transactions.md
   - banking_add_transaction(date, description, amount, type, category) → append to ledger
   - banking_get_summary()                               → MTD income/expenses/net/progress
   - banking_get_subscription_report()                   → run full subscription audit
+  - banking_get_analytics(days?)                        → monthly/category rollups + percentiles
+  - banking_get_rolling_spend(window_days?, days?)      → trailing N-day spend per day
+  - banking_get_anomalies(z_threshold?, days?)          → per-category z-score outliers
 
-Reads/writes: {VAULT_PATH}/Accounting/Bank_Transactions.md
+Reads/writes: {VAULT_PATH}/Accounting/Bank_Transactions.md via ledger_store
+(SQLite source of truth; the markdown Running Ledger is regenerated as a view)
 Also delegates subscription audit to audit_logic.run_subscription_audit()
 
 Run as MCP server (stdio transport):
@@ -27,12 +31,14 @@ import os
 import sys
 import json
 import asyncio
+import sqlite3
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from dotenv import load_dotenv
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from audit_logic import run_subscription_audit, _parse_ledger_rows
+from audit_logic import run_subscription_audit
+from ledger_store import get_ledger
 from rate_limiter import get_limiter, RateLimitExceededError
 from permission_guard import check as permission_check, add_known_payee
 
@@ -46,34 +52,15 @@ PENDING_DIR  = VAULT_PATH / "Pending_Approval"
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def _read_bank_file() -> str:
-    if not BANK_FILE.exists():
-        return ""
-    return BANK_FILE.read_text(encoding="utf-8")
-
-
 def _get_transactions(days: int = 90, category: str = "", tx_type: str = "") -> dict:
-    """Parse ledger rows and apply optional filters."""
-    content = _read_bank_file()
-    if not content:
+    """Query ledger rows through the store's date / category indexes."""
+    if not BANK_FILE.exists():
         return {"error": "Bank_Transactions.md not found"}
 
-    rows = _parse_ledger_rows(content)
+    # A row is in range when its midnight-UTC date is on/after the cutoff instant
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-
-    filtered = []
-    for row in rows:
-        try:
-            row_date = datetime.strptime(row["date"], "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        except ValueError:
-            continue
-        if row_date < cutoff:
-            continue
-        if category and category.lower() not in row.get("category", "").lower():
-            continue
-        if tx_type and tx_type.lower() not in row.get("type", "").lower():
-            continue
-        filtered.append(row)
+    since = (cutoff + timedelta(days=1)).strftime("%Y-%m-%d")
+    filtered = get_ledger(VAULT_PATH).query(since=since, category=category, tx_type=tx_type)
 
     total_income   = sum(r["amount"] for r in filtered if r["amount"] > 0)
     total_expenses = sum(r["amount"] for r in filtered if r["amount"] < 0)
@@ -93,11 +80,10 @@ def _add_transaction(
     date: str, description: str, amount: float, tx_type: str, category: str
 ) -> dict:
     """
-    Append a new row to the Running Ledger table in Bank_Transactions.md.
+    Append a new row to the Running Ledger (ledger_store insert + one line spliced into the view).
     amount: positive for income, negative for expenses (e.g. -54.99).
     """
-    content = _read_bank_file()
-    if not content:
+    if not BANK_FILE.exists():
         return {"error": "Bank_Transactions.md not found"}
 
     # Validate date
@@ -106,25 +92,6 @@ def _add_transaction(
     except ValueError:
         return {"error": f"Invalid date format '{date}'. Use YYYY-MM-DD."}
 
-    sign = "+" if amount >= 0 else ""
-    amount_str = f"{sign}${abs(amount):.2f}" if amount >= 0 else f"-${abs(amount):.2f}"
-    new_row = f"| {date} | {description} | {amount_str} | {tx_type} | {category} | pending |"
-
-    # Insert after the table header row (| Date | Description | ...)
-    lines = content.splitlines()
-    insert_at = None
-    in_ledger = False
-    for i, line in enumerate(lines):
-        if line.startswith("## Running Ledger"):
-            in_ledger = True
-            continue
-        if in_ledger and line.startswith("| Date"):
-            insert_at = i + 2  # after header + separator
-            break
-
-    if insert_at is None:
-        return {"error": "Could not find Running Ledger table in Bank_Transactions.md"}
-
     # §6.4 Permission check — expenses only (positive income is always auto-approved)
     if amount < 0:
         recurring = category.lower() in ("subscription", "recurring", "infrastructure")
@@ -188,9 +155,8 @@ Move this file to `/Rejected/`.
         return {"error": str(e), "rate_limited": True}
 
     try:
-        lines.insert(insert_at, new_row)
-        BANK_FILE.write_text("\n".join(lines), encoding="utf-8")
-    except OSError as e:
+        get_ledger(VAULT_PATH).append(date, description, amount, tx_type, category)
+    except (OSError, sqlite3.Error) as e:
         # Vault write failed — do NOT retry; return error requiring fresh approval
         return {
             "error": f"Bank ledger write failed: {e}",
@@ -214,6 +180,33 @@ Move this file to `/Rejected/`.
     }
 
 
+def _get_analytics(tool: str, arguments: dict) -> dict:
+    """Dispatch the vectorized ledger_analytics tools (numpy is an optional extra)."""
+    if not BANK_FILE.exists():
+        return {"error": "Bank_Transactions.md not found"}
+    try:
+        import ledger_analytics
+    except ImportError:
+        return {"error": "numpy not installed. Run: uv sync --extra analytics"}
+
+    if tool == "banking_get_analytics":
+        return ledger_analytics.summarize(VAULT_PATH, days=arguments.get("days"))
+
+    if tool == "banking_get_rolling_spend":
+        # Full history so the first returned day still has a complete window behind it
+        window = int(arguments.get("window_days", 30))
+        if window < 1:
+            return {"error": f"window_days must be at least 1 (got {window})"}
+        days = max(int(arguments.get("days", 90)), 0)
+        series = ledger_analytics.LedgerFrame.load(VAULT_PATH).rolling_sum(window_days=window)
+        return {"window_days": window, "days": days, "series": series[-days:] if days else []}
+
+    days = arguments.get("days")
+    z = float(arguments.get("z_threshold", ledger_analytics.ANOMALY_Z_THRESHOLD))
+    frame = ledger_analytics.LedgerFrame.load(VAULT_PATH, days=days)
+    return {"z_threshold": z, "days": days, "anomalies": frame.anomalies(z_threshold=z)}
+
+
 def _get_summary() -> dict:
     """Aggregate MTD income, expenses, and goal progress from Current_Month.md."""
     result = {
@@ -318,6 +311,46 @@ def main():
                 ),
                 inputSchema={"type": "object", "properties": {}},
             ),
+            types.Tool(
+                name="banking_get_analytics",
+                description=(
+                    "Summarize the ledger in one pass: income/expenses/net per month, "
+                    "count/total/mean/percentiles per category, expense-size percentiles "
+                    "and per-category anomalies."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "days": {"type": "integer", "description": "Limit to the last N days (default: all)"},
+                    },
+                },
+            ),
+            types.Tool(
+                name="banking_get_rolling_spend",
+                description="Trailing N-day expense total for each day in the ledger (e.g. 30-day burn rate).",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "window_days": {"type": "integer", "description": "Rolling window in days (default: 30)"},
+                        "days":        {"type": "integer", "description": "How many days to return, ending at the latest transaction (default: 90)"},
+                    },
+                },
+            ),
+            types.Tool(
+                name="banking_get_anomalies",
+                description=(
+                    "Flag transactions whose amount is unusual for their category "
+                    "(|z-score| against the category's other rows above the threshold, "
+                    "categories with 3+ rows)."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "z_threshold": {"type": "number",  "description": "Z-score threshold (default: 3.0)"},
+                        "days":        {"type": "integer", "description": "Limit to the last N days (default: all)"},
+                    },
+                },
+            ),
         ]
 
     @server.call_tool()
@@ -340,6 +373,8 @@ def main():
             result = _get_summary()
         elif name == "banking_get_subscription_report":
             result = run_subscription_audit(VAULT_PATH)
+        elif name in ("banking_get_analytics", "banking_get_rolling_spend", "banking_get_anomalies"):
+            result = _get_analytics(name, arguments)
         else:
             result = {"error": f"Unknown tool: {name}"}
 
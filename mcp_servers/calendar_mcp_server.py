@@ -33,6 +33,7 @@ from dotenv import load_dotenv
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from audit_logger import write_log_entry, infer_approval
+from google_quota import get_quota, QuotaExhaustedError, PRIORITY_INTERACTIVE
 
 load_dotenv()
 
@@ -107,6 +108,7 @@ def _list_events(days_ahead: int = 7) -> dict:
         now = datetime.now(timezone.utc)
         time_max = now + timedelta(days=days_ahead)
 
+        get_quota(VAULT_PATH).reserve("calendar.events.list", priority=PRIORITY_INTERACTIVE, timeout=10)
         result = service.events().list(
             calendarId=CALENDAR_ID,
             timeMin=now.isoformat(),
@@ -132,7 +134,11 @@ def _list_events(days_ahead: int = 7) -> dict:
         _log("calendar_list_events", CALENDAR_ID, "success", {"days_ahead": days_ahead, "count": len(events)})
         return {"events": events, "count": len(events), "period_days": days_ahead}
 
+    except QuotaExhaustedError as e:
+        _log("calendar_list_events", CALENDAR_ID, "quota_exhausted", {"error": str(e)})
+        return {"error": str(e), "events": [], "quota_exhausted": True}
     except Exception as e:
+        get_quota(VAULT_PATH).record_error("calendar", e)
         _log("calendar_list_events", CALENDAR_ID, "error", {"error": str(e)})
         return {"error": str(e), "events": []}
 
@@ -14,6 +14,7 @@ Security (Handbook §3 & §6):
 Setup:
   Set in .env:
     SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASSWORD, SMTP_FROM_NAME
+    EMAIL_TRANSPORT=smtp   → pooled keep-alive SMTP (smtp_transport.py) instead of the Gmail API
 
 Run as MCP server (stdio transport):
     uv run email-mcp
@@ -47,6 +48,9 @@ from rate_limiter import get_limiter, RateLimitExceededError
 from audit_logger import write_log_entry, infer_approval
 from permission_guard import check as permission_check, add_known_contact
 from retry_handler import with_retry_async, classify_error
+from google_quota import get_quota, QuotaExhaustedError, PRIORITY_SEND
+from email_queue import enqueue
+from smtp_transport import smtp_enabled, get_pool as get_smtp_pool
 
 load_dotenv()
 
@@ -83,7 +87,8 @@ def _log(action_type: str, target: str, result: str, details: dict = None):
 @with_retry_async(max_attempts=3, base_delay=2, max_delay=30)
 async def _send_gmail_api(to: str, subject: str, body: str, cc: str = None,
                           attachment: str = None) -> dict:
-    """Send an email via Gmail API (OAuth2) — retries on transient network errors.
+    """Send an email via Gmail API (OAuth2), or the pooled SMTP transport when
+    EMAIL_TRANSPORT=smtp — retries on transient network errors.
     attachment: optional path to a file (e.g. PDF invoice) to attach.
     """
     if DRY_RUN:
@@ -97,34 +102,47 @@ async def _send_gmail_api(to: str, subject: str, body: str, cc: str = None,
         _log("email_send", to, "rate_limited", {"error": str(e)})
         return {"success": False, "error": str(e), "rate_limited": True}
 
+    msg = MIMEMultipart("alternative")
+    msg["From"]    = f"{FROM_NAME} <{SMTP_USER}>"
+    msg["To"]      = to
+    msg["Subject"] = subject
+    if cc:
+        msg["Cc"] = cc
+
+    full_body = f"{body}\n\n---\n*This email was drafted with AI assistance.*"
+    msg.attach(MIMEText(full_body, "plain"))
+
+    if attachment:
+        attach_path = Path(attachment)
+        if attach_path.exists():
+            with open(attach_path, "rb") as f:
+                part = MIMEApplication(f.read(), _subtype="pdf")
+                part.add_header("Content-Disposition", "attachment", filename=attach_path.name)
+                msg.attach(part)
+
+    # SMTP deployments send over a pooled keep-alive connection — no Gmail quota involved
+    quota = None if smtp_enabled() else get_quota(VAULT_PATH)
+    if quota is not None:
+        # Shared Gmail quota — sends outrank every poll/read, so wait briefly for budget
+        try:
+            await asyncio.to_thread(quota.reserve, "gmail.messages.send", 1, PRIORITY_SEND, 20)
+        except QuotaExhaustedError as e:
+            _log("email_send", to, "quota_exhausted", {"error": str(e)})
+            return {"success": False, "error": str(e), "quota_exhausted": True}
+
     try:
-        from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
-
-        token_data = json.loads(Path(GMAIL_TOKEN).read_text(encoding="utf-8"))
-        creds = Credentials.from_authorized_user_info(token_data)
-        service = build("gmail", "v1", credentials=creds)
-
-        msg = MIMEMultipart("alternative")
-        msg["From"]    = f"{FROM_NAME} <{SMTP_USER}>"
-        msg["To"]      = to
-        msg["Subject"] = subject
-        if cc:
-            msg["Cc"] = cc
-
-        full_body = f"{body}\n\n---\n*This email was drafted with AI assistance.*"
-        msg.attach(MIMEText(full_body, "plain"))
-
-        if attachment:
-            attach_path = Path(attachment)
-            if attach_path.exists():
-                with open(attach_path, "rb") as f:
-                    part = MIMEApplication(f.read(), _subtype="pdf")
-                    part.add_header("Content-Disposition", "attachment", filename=attach_path.name)
-                    msg.attach(part)
-
-        raw = base64.urlsafe_b64encode(msg.as_bytes()).decode()
-        service.users().messages().send(userId="me", body={"raw": raw}).execute()
+        if quota is None:
+            await get_smtp_pool().send(msg)
+        else:
+            from google.oauth2.credentials import Credentials
+            from googleapiclient.discovery import build
+
+            token_data = json.loads(Path(GMAIL_TOKEN).read_text(encoding="utf-8"))
+            creds = Credentials.from_authorized_user_info(token_data)
+            service = build("gmail", "v1", credentials=creds)
+
+            raw = base64.urlsafe_b64encode(msg.as_bytes()).decode()
+            service.users().messages().send(userId="me", body={"raw": raw}).execute()
 
         # §6.4 — register as known contact after successful send
         add_known_contact(to, VAULT_PATH)
@@ -132,6 +150,10 @@ async def _send_gmail_api(to: str, subject: str, body: str, cc: str = None,
         return {"success": True, "message": f"Email sent to {to}"}
 
     except Exception as e:
+        # A 429 pauses every Gmail caller; the QuotaExhaustedError it causes on the
+        # next attempt carries retry_after, so with_retry_async won't hammer the API.
+        if quota is not None:
+            quota.record_error("gmail", e)
         # Classify before logging — lets the @with_retry_async decorator retry if transient
         raise classify_error(e) from e
 
@@ -196,35 +218,10 @@ def _queue_email(to: str, subject: str, body: str, cc: str, error: str) -> dict:
     """
     §7.3 Graceful Degradation — Gmail API down.
     Queue the email locally so it can be sent when the API is restored.
-    Writes to /Queue/EMAIL_QUEUED_*.md — orchestrator retry loop picks these up.
+    Writes to /Queue/EMAIL_QUEUED_*.md — the orchestrator drains these with
+    per-message backoff (email_queue.py).
     """
-    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    queue_file = QUEUE_DIR / f"EMAIL_QUEUED_{ts}.md"
-    queue_file.write_text(
-        f"""---
-type: queued_email
-to: {to}
-subject: {subject}
-cc: {cc or ""}
-queued_at: {datetime.now(timezone.utc).isoformat()}
-queued_reason: {error}
-status: queued
-retry_count: 0
----
-
-## Queued Email (Gmail API Unavailable)
-
-**To:** {to}
-**Subject:** {subject}
-
-{body}
-
----
-*Queued by §7.3 graceful degradation — will be sent when Gmail API is restored.*
-*Orchestrator retry loop processes /Queue/EMAIL_QUEUED_*.md files.*
-""",
-        encoding="utf-8",
-    )
+    queue_file = enqueue(VAULT_PATH, to, subject, body, cc=cc, reason=error)
     _log("email_queued", to, "queued", {
         "subject": subject, "queue_file": queue_file.name, "queued_reason": error,
     })
@@ -23,6 +23,7 @@ Configure in .claude/mcp.json:
 """
 
 import os
+import sys
 import json
 import base64
 import asyncio
@@ -30,6 +31,9 @@ from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from google_quota import get_quota, QuotaExhaustedError, PRIORITY_INTERACTIVE
+
 load_dotenv()
 
 VAULT_PATH       = Path(os.getenv("VAULT_PATH", "./AI_Employee_Vault")).resolve()
@@ -44,6 +48,7 @@ GMAIL_SCOPES = [
 ]
 
 MAX_BODY_CHARS = 500  # truncate long email bodies for privacy
+QUOTA_WAIT     = 10   # seconds a tool call may wait for shared Gmail quota
 
 
 # ── Gmail API helpers ─────────────────────────────────────────────────────────
@@ -87,12 +92,18 @@ def _get_recent(max_results: int = 10, label: str = "INBOX") -> dict:
     service, err = _build_gmail_service()
     if err:
         return {"error": err}
+    quota = get_quota(VAULT_PATH)
     try:
+        quota.reserve("gmail.messages.list", priority=PRIORITY_INTERACTIVE, timeout=QUOTA_WAIT)
         resp = service.users().messages().list(
             userId="me", labelIds=[label.upper()], maxResults=max_results
         ).execute()
+        ids = resp.get("messages", [])
+        if ids:
+            quota.reserve("gmail.messages.get", count=len(ids),
+                          priority=PRIORITY_INTERACTIVE, timeout=QUOTA_WAIT)
         messages = []
-        for m in resp.get("messages", []):
+        for m in ids:
             full = service.users().messages().get(
                 userId="me", id=m["id"], format="metadata",
                 metadataHeaders=["From", "To", "Subject", "Date"]
@@ -103,7 +114,10 @@ def _get_recent(max_results: int = 10, label: str = "INBOX") -> dict:
             "count": len(messages),
             "messages": messages,
         }
+    except QuotaExhaustedError as e:
+        return {"error": str(e), "quota_exhausted": True}
     except Exception as e:
+        quota.record_error("gmail", e)
         return {"error": str(e)}
 
 
@@ -111,12 +125,18 @@ def _search(query: str, max_results: int = 10) -> dict:
     service, err = _build_gmail_service()
     if err:
         return {"error": err}
+    quota = get_quota(VAULT_PATH)
     try:
+        quota.reserve("gmail.messages.list", priority=PRIORITY_INTERACTIVE, timeout=QUOTA_WAIT)
         resp = service.users().messages().list(
             userId="me", q=query, maxResults=max_results
         ).execute()
+        ids = resp.get("messages", [])
+        if ids:
+            quota.reserve("gmail.messages.get", count=len(ids),
+                          priority=PRIORITY_INTERACTIVE, timeout=QUOTA_WAIT)
         messages = []
-        for m in resp.get("messages", []):
+        for m in ids:
             full = service.users().messages().get(
                 userId="me", id=m["id"], format="metadata",
                 metadataHeaders=["From", "To", "Subject", "Date"]
@@ -127,7 +147,10 @@ def _search(query: str, max_results: int = 10) -> dict:
             "count": len(messages),
             "messages": messages,
         }
+    except QuotaExhaustedError as e:
+        return {"error": str(e), "quota_exhausted": True}
     except Exception as e:
+        quota.record_error("gmail", e)
         return {"error": str(e)}
 
 
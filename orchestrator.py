@@ -20,6 +20,8 @@ Usage:
     uv run python orchestrator.py --no-whatsapp   # skip WhatsApp
     uv run python orchestrator.py --no-social     # skip Social watcher
     uv run python orchestrator.py --dry-run       # dry-run mode (no external actions)
+    uv run python orchestrator.py --in-process    # watchers as threads in one process
+    uv run python orchestrator.py --forkserver    # watchers forked from a preloaded zygote
 """
 
 import os
@@ -34,6 +36,8 @@ from pathlib import Path
 from datetime import datetime, timezone
 from dotenv import load_dotenv
 from audit_logger import write_log_entry, infer_approval
+from dashboard_writer import DashboardWriter, InputCache, volatile
+from task_priority import PriorityTaskQueue
 
 load_dotenv()
 
@@ -53,7 +57,8 @@ class Orchestrator:
 
     def __init__(self, vault_path: str, enable_gmail: bool = True,
                  enable_linkedin: bool = True, enable_scheduler: bool = True,
-                 enable_social: bool = True, enable_whatsapp: bool = True):
+                 enable_social: bool = True, enable_whatsapp: bool = True,
+                 in_process: bool = False, forkserver: bool = False):
         self.vault_path        = Path(vault_path).resolve()
         self.needs_action      = self.vault_path / "Needs_Action"
         self.approved          = self.vault_path / "Approved"
@@ -70,9 +75,28 @@ class Orchestrator:
         self.enable_whatsapp   = enable_whatsapp
 
         self._processes: dict[str, subprocess.Popen] = {}
+        # Optional single-process mode: watchers run as supervised threads
+        self.runtime = None
+        if in_process:
+            from watcher_runtime import WatcherRuntime
+            self.runtime = WatcherRuntime(self.vault_path)
+        # Optional forkserver mode: watchers forked from a preloaded zygote
+        self.forkserver = None
+        if forkserver and not in_process:
+            from watcher_forkserver import WatcherForkServer
+            if WatcherForkServer.available():
+                self.forkserver = WatcherForkServer(self.vault_path)
+            else:
+                logger.warning("forkserver start method unavailable on this platform — using subprocesses")
         self._running = True
         self._notified_tasks: set[str] = set()
         self._notified_triggers: set[str] = set()
+        self._task_queue = PriorityTaskQueue()   # Needs_Action by (priority, SLA deadline)
+        self.email_queue = None   # §7.3 outbound queue, built on first drain
+        self._active_campaigns: dict[str, Path] = {}   # approved file name → campaign dir (rate-limited)
+        # Dashboard.md is rewritten only when a section changes; inputs are stat-cached
+        self._dashboard_inputs = InputCache()
+        self.dashboard_writer  = DashboardWriter(self.vault_path / "Dashboard.md")
 
         self._ensure_dirs()
         self._setup_signal_handlers()
@@ -115,6 +139,10 @@ class Orchestrator:
             "needs_action_count": len(list(self.needs_action.glob("*.md"))),
             "pending_approval_count": len(list((self.vault_path / "Pending_Approval").glob("*.md"))),
         }
+        if self.runtime:
+            health["watchers"] = self.runtime.status()
+        elif self.forkserver:
+            health["watchers"] = self.forkserver.status()
         try:
             signal_file.write_text(json.dumps(health, indent=2), encoding="utf-8")
         except Exception as e:
@@ -127,6 +155,10 @@ class Orchestrator:
     def _shutdown(self, signum, frame):
         logger.info("Shutdown signal — stopping all processes...")
         self._running = False
+        if self.runtime:
+            self.runtime.stop_all()
+        if self.forkserver:
+            self.forkserver.stop_all()
         for name, proc in self._processes.items():
             if proc.poll() is None:
                 logger.info(f"Stopping {name} (PID {proc.pid})")
@@ -167,6 +199,12 @@ class Orchestrator:
 
     def _start_process(self, name: str, module: str, extra_args: list[str] = None):
         """Start a Python module as a subprocess using the venv Python."""
+        if self.runtime and name in self._runtime_factories():
+            self.runtime.start(name)
+            return
+        if self.forkserver and name in self._forkserver_targets():
+            self.forkserver.start(name)
+            return
         python = self._find_venv_python()
         cmd = [python, "-m", module, "--vault", str(self.vault_path)]
         if extra_args:
@@ -178,6 +216,16 @@ class Orchestrator:
         logger.info(f"Started {name} (PID {proc.pid})")
         self.log_action("process_start", name, "success", {"pid": proc.pid})
 
+    @staticmethod
+    def _runtime_factories() -> dict:
+        from watcher_runtime import WATCHER_FACTORIES
+        return WATCHER_FACTORIES
+
+    @staticmethod
+    def _forkserver_targets() -> list:
+        from watcher_forkserver import TARGETS
+        return TARGETS
+
     def start_all_watchers(self):
         """Launch all enabled watchers and scheduler."""
         # Always start file system watcher
@@ -223,6 +271,14 @@ class Orchestrator:
 
     def _start_social_watcher(self):
         """Start the Social Media watcher for all platforms (Gold Tier)."""
+        if self.runtime:
+            for name in self._runtime_factories():
+                if name.startswith("social_"):
+                    self.runtime.start(name)
+            return
+        if self.forkserver:
+            self.forkserver.start("social_watcher")
+            return
         python = self._find_venv_python()
         cmd = [python, "-m", "watchers.social_watcher", "--vault", str(self.vault_path), "--platform", "all"]
         env = os.environ.copy()
@@ -233,7 +289,11 @@ class Orchestrator:
         self.log_action("process_start", "social_watcher", "success", {"pid": proc.pid})
 
     def check_and_restart_processes(self):
-        """Restart any crashed processes (watchdog pattern)."""
+        """Restart any crashed processes (watchdog pattern).
+
+        Watchers hosted by the in-process runtime or the forkserver are
+        supervised there (restarted immediately); this covers subprocess children.
+        """
         for name, proc in list(self._processes.items()):
             if proc.poll() is not None:
                 logger.warning(f"{name} exited (code {proc.returncode}), restarting...")
@@ -256,29 +316,22 @@ class Orchestrator:
 
     def process_queued_emails(self):
         """
-        §7.3 Graceful Degradation — retry queued emails when Gmail API recovers.
-        Picks up EMAIL_QUEUED_*.md files from /Queue/ and re-queues them as
-        approved actions so the existing email execution path handles them.
+        §7.3 Graceful Degradation — drain /Queue/EMAIL_QUEUED_*.md as Gmail recovers.
+
+        Each queued email carries its own attempt count and next-attempt time
+        (jittered exponential backoff); a circuit breaker stops sending while the
+        provider keeps failing. See email_queue.py. Cheap to call every tick.
         """
-        queue_dir = self.vault_path / "Queue"
-        for queued_file in sorted(queue_dir.glob("EMAIL_QUEUED_*.md")):
-            if queued_file.name in self._notified_tasks:
-                continue
-            try:
-                content = queued_file.read_text(encoding="utf-8")
-                to      = self._extract_frontmatter_field(content, "to")
-                subject = self._extract_frontmatter_field(content, "subject")
-                if not to or not subject:
-                    continue
-                # Re-route as an approved action (HITL already happened before original send)
-                dest = self.approved / queued_file.name.replace("EMAIL_QUEUED_", "APPROVED_queued_")
-                queued_file.rename(dest)
-                logger.info(f"Queue: moved {queued_file.name} to /Approved/ for retry")
-                self.log_action("email_queue_retry", to, "queued_to_approved",
-                                {"subject": subject, "file": queued_file.name})
-                self._notified_tasks.add(queued_file.name)
-            except Exception as e:
-                logger.error(f"Queue retry error for {queued_file.name}: {e}")
+        if self.email_queue is None:
+            from email_queue import OutboundQueue
+            self.email_queue = OutboundQueue(self.vault_path, send=self._send_via_gmail, dry_run=self.dry_run)
+        try:
+            stats = self.email_queue.drain()
+            if stats["sent"] or stats["failed"]:
+                logger.info(f"Queue: sent {stats['sent']}, failed {stats['failed']} "
+                            f"(breaker {self.email_queue.breaker.state})")
+        except Exception as e:
+            logger.error(f"Queue drain error: {e}")
 
     # ── HITL Approval Execution Loop (Silver Tier) ────────────────────────────
 
@@ -289,6 +342,7 @@ class Orchestrator:
         This is the Silver Tier HITL loop:
           User moves file to /Approved/ → orchestrator executes → logs → moves to /Done/
         """
+        invoice_approvals: list[tuple[Path, str]] = []
         for approved_file in sorted(self.approved.glob("*.md")):
             if approved_file.name in self._notified_tasks:
                 continue
@@ -306,7 +360,14 @@ class Orchestrator:
                 elif file_type == "approval_request" and action_type == "send_email":
                     self._execute_email_action(approved_file, content)
                 elif file_type == "approval_request" and action_type == "create_invoice":
-                    self._execute_invoice_action(approved_file, content)
+                    # Collected and run together below as one batch
+                    invoice_approvals.append((approved_file, content))
+                elif file_type == "invoice_batch_approval":
+                    self._execute_invoice_batch(approved_file, content)
+                elif file_type == "statement_import_approval":
+                    self._execute_statement_import(approved_file, content)
+                elif file_type == "campaign_approval":
+                    self._execute_campaign(approved_file, content)
                 elif file_type == "linkedin_post" or approved_file.name.startswith("LINKEDIN_POST_"):
                     self._execute_linkedin_action(approved_file, content)
                 elif file_type == "email_draft":
@@ -326,6 +387,13 @@ class Orchestrator:
                 logger.error(f"Error processing approved file {approved_file.name}: {e}")
                 self.log_action("approval_execution_error", approved_file.name, "error", {"error": str(e)})
 
+        if invoice_approvals:
+            try:
+                self._execute_invoice_actions(invoice_approvals)
+            except Exception as e:
+                logger.error(f"Error processing invoice batch: {e}")
+                self.log_action("approval_execution_error", "invoice_batch", "error", {"error": str(e)})
+
     def _extract_frontmatter_field(self, content: str, field: str) -> str:
         for line in content.split("\n"):
             if line.startswith(f"{field}:"):
@@ -399,85 +467,49 @@ class Orchestrator:
             logger.error(f"WhatsApp reply failed: {e}")
             self.log_action("whatsapp_reply_error", to, "error", {"error": str(e)})
 
-    def _generate_invoice_pdf(self, customer: str, amount: str, date_str: str,
-                               invoice_file: Path) -> Path | None:
-        """Generate a PDF invoice using fpdf2. Returns the PDF path or None on failure."""
-        try:
-            from fpdf import FPDF
-
-            pdf = FPDF()
-            pdf.add_page()
-            pdf.set_margins(20, 20, 20)
-
-            # Header
-            pdf.set_font("Helvetica", "B", 22)
-            pdf.set_text_color(30, 80, 160)
-            pdf.cell(0, 12, "INVOICE", ln=True, align="C")
-            pdf.set_draw_color(30, 80, 160)
-            pdf.set_line_width(0.8)
-            pdf.line(20, pdf.get_y(), 190, pdf.get_y())
-            pdf.ln(6)
-
-            # Meta row
-            pdf.set_font("Helvetica", "", 10)
-            pdf.set_text_color(80, 80, 80)
-            pdf.cell(95, 7, f"Date: {date_str}", ln=False)
-            pdf.cell(95, 7, f"Invoice #: INV-{date_str.replace('-', '')}", ln=True, align="R")
-            pdf.ln(4)
-
-            # Bill To
-            pdf.set_font("Helvetica", "B", 11)
-            pdf.set_text_color(0, 0, 0)
-            pdf.cell(0, 7, "Bill To:", ln=True)
-            pdf.set_font("Helvetica", "", 11)
-            pdf.cell(0, 7, customer, ln=True)
-            pdf.ln(6)
-
-            # Line items table header
-            pdf.set_fill_color(240, 244, 255)
-            pdf.set_font("Helvetica", "B", 10)
-            pdf.cell(110, 8, "Description", border=1, fill=True)
-            pdf.cell(40,  8, "Qty", border=1, fill=True, align="C")
-            pdf.cell(40,  8, "Amount", border=1, fill=True, align="R", ln=True)
-
-            # Line item
-            pdf.set_font("Helvetica", "", 10)
-            pdf.cell(110, 8, "Professional Services", border=1)
-            pdf.cell(40,  8, "1", border=1, align="C")
-            pdf.cell(40,  8, f"${amount}", border=1, align="R", ln=True)
-            pdf.ln(2)
-
-            # Total
-            pdf.set_font("Helvetica", "B", 11)
-            pdf.cell(150, 9, "TOTAL DUE", align="R")
-            pdf.cell(40,  9, f"${amount}", border=1, align="R", ln=True)
-            pdf.ln(8)
-
-            # Footer note
-            pdf.set_font("Helvetica", "I", 9)
-            pdf.set_text_color(100, 100, 100)
-            pdf.cell(0, 6, "Payment due within 30 days. Thank you for your business.", ln=True, align="C")
-
-            pdf_path = invoice_file.with_suffix(".pdf")
-            pdf.output(str(pdf_path))
-            logger.info(f"Invoice PDF generated: {pdf_path.name}")
-            return pdf_path
-        except Exception as e:
-            logger.error(f"PDF generation failed: {e}")
-            return None
-
     def _send_via_gmail(self, to: str, subject: str, body: str, cc: str = None,
                         attachment_path: "Path | None" = None) -> bool:
-        """Send an email via Gmail API (OAuth2), with optional PDF attachment. Returns True on success."""
+        """
+        Send an email via Gmail API (OAuth2), or over the pooled SMTP transport when
+        EMAIL_TRANSPORT=smtp, with optional PDF attachment. Returns True on success.
+        """
         import base64
         from email.mime.text import MIMEText
         from email.mime.multipart import MIMEMultipart
         from email.mime.application import MIMEApplication
+        from google_quota import get_quota, QuotaExhaustedError, PRIORITY_SEND
+        from smtp_transport import smtp_enabled, send_message_sync
 
         gmail_token = os.getenv("GMAIL_TOKEN_PATH", "./secrets/gmail_token.json")
         smtp_user   = os.getenv("SMTP_USER", "")
         from_name   = os.getenv("SMTP_FROM_NAME", "AI Employee")
 
+        msg = MIMEMultipart("alternative")
+        msg["From"]    = f"{from_name} <{smtp_user}>"
+        msg["To"]      = to
+        msg["Subject"] = subject
+        if cc:
+            msg["Cc"] = cc
+        msg.attach(MIMEText(f"{body}\n\n---\n*Sent via AI Employee.*", "plain"))
+
+        if attachment_path and Path(attachment_path).exists():
+            with open(attachment_path, "rb") as f:
+                part = MIMEApplication(f.read(), _subtype="pdf")
+                part.add_header(
+                    "Content-Disposition", "attachment",
+                    filename=Path(attachment_path).name,
+                )
+                msg.attach(part)
+
+        if smtp_enabled():
+            # Keep-alive pooled connection — no per-message TLS/AUTH handshake
+            try:
+                send_message_sync(msg)
+                return True
+            except Exception as e:
+                logger.error(f"SMTP send failed: {e}")
+                return False
+
         token_path = Path(gmail_token)
         if not token_path.exists():
             logger.error(f"Gmail token not found at {token_path}")
@@ -490,27 +522,15 @@ class Orchestrator:
             creds   = Credentials.from_authorized_user_file(str(token_path))
             service = build("gmail", "v1", credentials=creds, cache_discovery=False)
 
-            msg = MIMEMultipart("alternative")
-            msg["From"]    = f"{from_name} <{smtp_user}>"
-            msg["To"]      = to
-            msg["Subject"] = subject
-            if cc:
-                msg["Cc"] = cc
-            msg.attach(MIMEText(f"{body}\n\n---\n*Sent via AI Employee.*", "plain"))
-
-            if attachment_path and Path(attachment_path).exists():
-                with open(attachment_path, "rb") as f:
-                    part = MIMEApplication(f.read(), _subtype="pdf")
-                    part.add_header(
-                        "Content-Disposition", "attachment",
-                        filename=Path(attachment_path).name,
-                    )
-                    msg.attach(part)
-
             raw = base64.urlsafe_b64encode(msg.as_bytes()).decode()
+            get_quota(self.vault_path).reserve("gmail.messages.send", priority=PRIORITY_SEND, timeout=20)
             service.users().messages().send(userId="me", body={"raw": raw}).execute()
             return True
+        except QuotaExhaustedError as e:
+            logger.warning(f"Gmail send deferred: {e}")
+            return False
         except Exception as e:
+            get_quota(self.vault_path).record_error("gmail", e)
             logger.error(f"Gmail send failed: {e}")
             return False
 
@@ -551,80 +571,87 @@ class Orchestrator:
         self._archive_approved(approved_file, result)
         logger.info(f"Email {'sent' if ok else 'FAILED'}: {to} / {subject}")
 
-    def _execute_invoice_action(self, approved_file: Path, content: str):
-        """Handle an approved invoice creation request, then email it to the customer."""
-        customer = self._extract_frontmatter_field(content, "customer")
-        amount   = self._extract_frontmatter_field(content, "amount")
-        to_email = self._extract_frontmatter_field(content, "to") or \
-                   self._extract_frontmatter_field(content, "email")
-
-        logger.info(f"Invoice approved: {customer} ${amount}")
-        self.log_action("invoice_approved", customer, "success", {
-            "amount": amount, "file": approved_file.name
-        })
-
-        # Step 1 — Create invoice record in /Invoices/
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        date_str  = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        (self.vault_path / "Invoices").mkdir(exist_ok=True)
-        invoice_file = self.vault_path / "Invoices" / f"INVOICE_{timestamp}_{customer.replace(' ', '_')}.md"
-        invoice_body = f"""Dear {customer},
-
-Please find your invoice for services rendered.
-
-**Invoice Details**
-- Date: {date_str}
-- Amount Due: ${amount}
-
-Payment is due within 30 days. Thank you for your business.
-
-Best regards,
-AI Employee"""
-
-        invoice_file.write_text(
-            f"""---
-type: invoice
-customer: {customer}
-amount: {amount}
-to: {to_email}
-created: {datetime.now(timezone.utc).isoformat()}
-status: created
-source_approval: {approved_file.name}
----
-
-# Invoice — {customer}
+    def _execute_invoice_actions(self, approvals: list[tuple[Path, str]]):
+        """
+        Handle every approved invoice creation request found this pass as ONE batch:
+        records → PDFs rendered in parallel → emails sent concurrently (invoice_batch.py).
+        Each approval is archived as soon as its own invoice is finished, so a
+        failure mid-batch never re-sends the ones already delivered.
+        """
+        from invoice_batch import job_from_approval, run_invoice_batch
+
+        jobs, approval_of = [], {}
+        for approved_file, content in approvals:
+            job = job_from_approval(approved_file, content)
+            logger.info(f"Invoice approved: {job.customer} ${job.amount}")
+            self.log_action("invoice_approved", job.customer, "success", {
+                "amount": job.amount, "file": approved_file.name
+            })
+            jobs.append(job)
+            approval_of[id(job)] = approved_file
+
+        def _archive(job):
+            self._archive_approved(approval_of[id(job)], "invoice_created")
+
+        summary = run_invoice_batch(self.vault_path, jobs, send=self._send_via_gmail,
+                                    dry_run=self.dry_run, on_done=_archive)
+        logger.info(f"Invoices created: {summary['invoices']} — emailed {summary['emailed']}, "
+                    f"deferred {summary['email_deferred']}, failed {summary['email_failed']}")
+
+    def _execute_campaign(self, approved_file: Path, content: str):
+        """Start an approved mail-merge campaign (one approval covers every recipient)."""
+        dir_rel = self._extract_frontmatter_field(content, "campaign_dir")
+        campaign_dir = self.vault_path / dir_rel if dir_rel else None
+        if campaign_dir is None or not (campaign_dir / "recipients.csv").exists():
+            logger.error(f"Campaign directory missing: {dir_rel or '(none)'}")
+            self.log_action("campaign_error", approved_file.name, "error",
+                            {"error": "campaign_dir missing", "campaign_dir": dir_rel})
+            return
+        self._active_campaigns[approved_file.name] = campaign_dir
+        self.process_campaigns()
 
-**Amount:** ${amount}
-**Date:** {date_str}
-**Status:** Created
+    def process_campaigns(self):
+        """
+        Send the next part of every active campaign. A campaign that hits the
+        email rate limit keeps its approval in /Approved/ and resumes from its
+        saved cursor on a later tick — or after a restart, when the approval is
+        picked up again.
+        """
+        from campaign import run_campaign
 
-{invoice_body}
-""",
-            encoding='utf-8',
-        )
-        logger.info(f"Invoice record created: {invoice_file.name}")
-        self.log_action("invoice_created", customer, "success", {"invoice_file": invoice_file.name})
-
-        # Step 2 — Generate PDF
-        pdf_path = self._generate_invoice_pdf(customer, amount, date_str, invoice_file)
-
-        # Step 3 — Email invoice to customer (if email address known)
-        if to_email and not self.dry_run:
-            subject = f"Invoice — {customer} — {date_str} — ${amount}"
-            ok = self._send_via_gmail(to_email, subject, invoice_body, attachment_path=pdf_path)
-            self.log_action("invoice_emailed", to_email, "success" if ok else "error", {
-                "customer": customer, "amount": amount,
-                "pdf_attached": pdf_path is not None,
-            })
-            logger.info(f"Invoice email {'sent' if ok else 'FAILED'} to {to_email}"
-                        + (f" (PDF: {pdf_path.name})" if pdf_path else " (no PDF)"))
-        elif to_email and self.dry_run:
-            logger.info(f"[DRY RUN] Would email invoice to {to_email}: ${amount}"
-                        + (f" with PDF {pdf_path.name}" if pdf_path else ""))
-        else:
-            logger.warning(f"No email address for invoice — {customer}. Record saved to /Invoices/")
+        for name, campaign_dir in list(self._active_campaigns.items()):
+            try:
+                summary = run_campaign(self.vault_path, campaign_dir, send=self._send_via_gmail,
+                                       dry_run=self.dry_run)
+            except Exception as e:
+                logger.error(f"Campaign {campaign_dir.name} failed: {e}")
+                self.log_action("campaign_error", name, "error", {"error": str(e)})
+                del self._active_campaigns[name]
+                continue
+            if summary["done"]:
+                del self._active_campaigns[name]
+                approved_file = self.approved / name
+                if approved_file.exists():
+                    self._archive_approved(approved_file, "dry_run_success" if self.dry_run else "campaign_completed")
+
+    def _execute_invoice_batch(self, approved_file: Path, content: str):
+        """Run an approved month-end invoice batch (customer list from invoice-batch CLI)."""
+        from invoice_batch import jobs_from_csv, run_invoice_batch
+
+        rows_rel  = self._extract_frontmatter_field(content, "rows_file")
+        rows_file = self.vault_path / rows_rel if rows_rel else None
+        if rows_file is None or not rows_file.exists():
+            logger.error(f"Invoice batch rows file missing: {rows_rel or '(none)'}")
+            self.log_action("invoice_batch_error", approved_file.name, "error",
+                            {"error": "rows_file missing", "rows_file": rows_rel})
+            return
 
-        self._archive_approved(approved_file, "invoice_created")
+        jobs = jobs_from_csv(rows_file)
+        for job in jobs:
+            job.source = approved_file.name
+        summary = run_invoice_batch(self.vault_path, jobs, send=self._send_via_gmail, dry_run=self.dry_run)
+        logger.info(f"Invoice batch done: {summary}")
+        self._archive_approved(approved_file, "dry_run_success" if self.dry_run else "invoice_batch_completed")
 
     def _execute_linkedin_action(self, approved_file: Path, content: str):
         """
@@ -774,6 +801,37 @@ Navigate to: {platform_url}
             logger.info(f"Ralph Wiggum loop ended: {reason}")
             self.log_action("ralph_loop_ended", reason, "success")
 
+    def _execute_statement_import(self, approved_file: Path, content: str):
+        """Commit the rows a statement import held back for payment approval."""
+        rows_rel = self._extract_frontmatter_field(content, "rows_file")
+        rows_file = self.vault_path / rows_rel
+        if not rows_rel or not rows_file.exists():
+            logger.error(f"Statement import rows file missing: {rows_rel or '(none)'}")
+            self.log_action("statement_import_error", approved_file.name, "error",
+                            {"error": f"rows file not found: {rows_rel}"})
+            return
+
+        if self.dry_run:
+            logger.info(f"[DRY RUN] Would import held statement rows from {rows_rel}")
+            self._archive_approved(approved_file, "dry_run_success")
+            return
+
+        from statement_importer import import_approved_rows
+        from rate_limiter import RateLimitExceededError
+        try:
+            result = import_approved_rows(self.vault_path, rows_file)
+        except RateLimitExceededError as e:
+            # Left in /Approved/ — retried on next restart, never auto-retried (§7.3)
+            logger.warning(f"Statement import deferred: {e}")
+            self.log_action("statement_import_deferred", approved_file.name, "rate_limited",
+                            {"error": str(e)})
+            return
+
+        logger.info(f"Statement import approved: {result['imported']} rows added "
+                    f"({result['duplicates_skipped']} duplicates skipped)")
+        self.log_action("statement_import", approved_file.name, "success", result)
+        self._archive_approved(approved_file, "statement_rows_imported")
+
     def _notify_unknown_action(self, approved_file: Path):
         """Log unknown approved action for operator review."""
         logger.warning(f"Unknown approved action: {approved_file.name}")
@@ -819,67 +877,64 @@ Navigate to: {platform_url}
 
     # ── Dashboard ─────────────────────────────────────────────────────────────
 
-    def _read_accounting_summary(self) -> dict:
-        """Read Accounting/Current_Month.md for bank balance and MTD revenue."""
+    @staticmethod
+    def _parse_accounting_summary(content: str) -> dict:
+        """Parse Accounting/Current_Month.md for MTD revenue, expenses and goal progress."""
         result = {"income": "—", "expenses": "—", "net": "—", "mtd_goal": "—", "progress": "—"}
-        acct_file = self.vault_path / "Accounting" / "Current_Month.md"
-        if not acct_file.exists():
-            return result
-        try:
-            content = acct_file.read_text(encoding="utf-8")
-            for line in content.splitlines():
-                if "**Income**" in line or "| **Income**" in line:
+        labels = {"**Income**": "income", "**Expenses**": "expenses", "**Net**": "net",
+                  "**MTD Goal**": "mtd_goal", "**Progress**": "progress"}
+        for line in content.splitlines():
+            for label, key in labels.items():
+                if label in line:
                     parts = line.split("|")
-                    result["income"] = parts[2].strip() if len(parts) > 2 else "—"
-                elif "**Expenses**" in line or "| **Expenses**" in line:
-                    parts = line.split("|")
-                    result["expenses"] = parts[2].strip() if len(parts) > 2 else "—"
-                elif "**Net**" in line or "| **Net**" in line:
-                    parts = line.split("|")
-                    result["net"] = parts[2].strip() if len(parts) > 2 else "—"
-                elif "**MTD Goal**" in line or "| **MTD Goal**" in line:
-                    parts = line.split("|")
-                    result["mtd_goal"] = parts[2].strip() if len(parts) > 2 else "—"
-                elif "**Progress**" in line or "| **Progress**" in line:
-                    parts = line.split("|")
-                    result["progress"] = parts[2].strip() if len(parts) > 2 else "—"
-        except Exception:
-            pass
+                    result[key] = parts[2].strip() if len(parts) > 2 else "—"
+                    break
         return result
 
-    def _read_active_projects(self) -> list[str]:
-        """Read Business_Goals.md for active project list."""
+    def _read_accounting_summary(self) -> dict:
+        """Read Accounting/Current_Month.md for bank balance and MTD revenue (cached until it changes)."""
+        return self._dashboard_inputs.load(
+            self.vault_path / "Accounting" / "Current_Month.md", self._parse_accounting_summary,
+            {"income": "—", "expenses": "—", "net": "—", "mtd_goal": "—", "progress": "—"},
+        )
+
+    @staticmethod
+    def _parse_active_projects(content: str) -> list[str]:
         projects = []
-        goals_file = self.vault_path / "Business_Goals.md"
-        if not goals_file.exists():
-            return ["_No active projects_"]
-        try:
-            content = goals_file.read_text(encoding="utf-8")
-            in_projects = False
-            for line in content.splitlines():
-                if "### Active Projects" in line:
-                    in_projects = True
-                    continue
-                if in_projects:
-                    if line.startswith("###") or line.startswith("---"):
-                        break
-                    if line.strip() and not line.startswith("_No active"):
-                        projects.append(line.strip())
-        except Exception:
-            pass
+        in_projects = False
+        for line in content.splitlines():
+            if "### Active Projects" in line:
+                in_projects = True
+                continue
+            if in_projects:
+                if line.startswith("###") or line.startswith("---"):
+                    break
+                if line.strip() and not line.startswith("_No active"):
+                    projects.append(line.strip())
         return projects if projects else ["_No active projects_"]
 
+    def _read_active_projects(self) -> list[str]:
+        """Read Business_Goals.md for active project list (cached until it changes)."""
+        return self._dashboard_inputs.load(self.vault_path / "Business_Goals.md",
+                                           self._parse_active_projects, ["_No active projects_"])
+
     def update_dashboard(self):
-        """Write a fresh Dashboard.md with live vault counts."""
+        """
+        Refresh Dashboard.md with live vault counts — written only when a section
+        actually changed. Timestamps that move on every refresh (last_updated, agent
+        heartbeats) are volatile(): rendered, but not part of the change hash.
+        """
+        inputs = self._dashboard_inputs
         try:
-            # Domain-aware counts
-            email_count = len(list((self.needs_action / "email").glob("EMAIL_*.md"))) if (self.needs_action / "email").exists() else 0
-            na_count    = len(list(self.needs_action.glob("*.md"))) + email_count
-            done_count  = len(list(self.done.glob("*")))
-            pa_count    = len(list((self.vault_path / "Pending_Approval").glob("*.md")))
-            draft_count = len(list(self.drafts_dir.glob("DRAFT_*.md")))
-            sched_count = len(list(self.scheduled_dir.glob("TRIGGER_*.md")))
+            # Domain-aware counts (directory counts re-glob only when the directory changes)
+            email_count = inputs.count(self.needs_action / "email", "EMAIL_*.md")
+            na_count    = inputs.count(self.needs_action, "*.md") + email_count
+            done_count  = inputs.count(self.done, "*")
+            pa_count    = inputs.count(self.vault_path / "Pending_Approval", "*.md")
+            draft_count = inputs.count(self.drafts_dir, "DRAFT_*.md")
+            sched_count = inputs.count(self.scheduled_dir, "TRIGGER_*.md")
             now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+            values = {"now": now}
 
             # Financial summary
             acct = self._read_accounting_summary()
@@ -889,91 +944,88 @@ Navigate to: {platform_url}
             projects_md = "\n".join(f"  {p}" for p in active_projects)
 
             active = {n: "Running" for n, p in self._processes.items() if p.poll() is None}
+            # --in-process / --forkserver watchers are not in _processes
+            watchers = (self.runtime.status() if self.runtime
+                        else self.forkserver.status() if self.forkserver else {})
+            active.update({
+                n: "Running" if w["alive"] else f"Restarting (restart #{w['restarts']})"
+                for n, w in watchers.items()
+            })
             system_rows = "\n".join(
-                f"| {n.replace('_', ' ').title()} | {s} | {now} |"
+                f"| {n.replace('_', ' ').title()} | {s} | {volatile('now')} |"
                 for n, s in (active or {"file_system_watcher": "Running"}).items()
             )
 
             # Ralph state summary
-            ralph_file = self.ralph_state_dir / "ralph_current.json"
             ralph_status = "Idle"
-            if ralph_file.exists():
-                try:
-                    rs = json.loads(ralph_file.read_text(encoding="utf-8"))
-                    if rs.get("active"):
-                        ralph_status = f"Active ({rs.get('iterations', 0)}/{rs.get('max_iterations', 10)} iterations)"
-                    else:
-                        ralph_status = "Done"
-                except Exception:
-                    pass
+            rs = inputs.load(self.ralph_state_dir / "ralph_current.json", json.loads)
+            if isinstance(rs, dict):
+                if rs.get("active"):
+                    ralph_status = f"Active ({rs.get('iterations', 0)}/{rs.get('max_iterations', 10)} iterations)"
+                else:
+                    ralph_status = "Done"
 
             # Social counts
-            social_counts = {}
-            for platform in ["Facebook", "Instagram", "Twitter"]:
-                p_dir = self.vault_path / "To_Post" / platform
-                social_counts[platform] = len(list(p_dir.glob("POST_*.md"))) if p_dir.exists() else 0
+            social_counts = {
+                platform: inputs.count(self.vault_path / "To_Post" / platform, "POST_*.md")
+                for platform in ["Facebook", "Instagram", "Twitter"]
+            }
 
             # WhatsApp stats
-            wa_processed = 0
-            wa_file = self.vault_path / ".whatsapp_processed_ids.json"
-            if wa_file.exists():
-                try:
-                    wa_processed = len(json.loads(wa_file.read_text(encoding="utf-8")))
-                except Exception:
-                    pass
+            wa_processed = len(inputs.load(self.vault_path / ".whatsapp_processed_ids.json", json.loads, []) or [])
             wa_auto_reply = os.getenv("WHATSAPP_AUTO_REPLY", "false").lower() == "true"
             wa_daily_report = os.getenv("WHATSAPP_DAILY_REPORT_ENABLED", "false").lower() == "true"
             wa_report_time = os.getenv("WHATSAPP_DAILY_REPORT_TIME", "08:00")
             wa_report_to = os.getenv("WHATSAPP_DAILY_REPORT_TO", "—")
 
-            # Local agent signal
-            signal_file = self.vault_path / "Signals" / "HEALTH_local-01.json"
+            # Local agent signal (heartbeat timestamp is volatile; the status is not)
             agent_status = "Unknown"
             agent_ts = "—"
-            if signal_file.exists():
-                try:
-                    sig = json.loads(signal_file.read_text(encoding="utf-8"))
-                    agent_status = sig.get("status", "unknown").title()
-                    agent_ts = sig.get("timestamp", "—")[:16].replace("T", " ") + " UTC"
-                except Exception:
-                    pass
+            sig = inputs.load(self.vault_path / "Signals" / "HEALTH_local-01.json", json.loads)
+            if isinstance(sig, dict):
+                agent_status = sig.get("status", "unknown").title()
+                values["agent_ts"] = sig.get("timestamp", "—")[:16].replace("T", " ") + " UTC"
+                agent_ts = volatile("agent_ts")
 
             # Cloud agent signal
-            cloud_signal_file = self.vault_path / "Signals" / "HEALTH_cloud-01.json"
             cloud_agent_status = "Not deployed"
             cloud_agent_ts = "—"
             cloud_pending = 0
-            if cloud_signal_file.exists():
+            csig = inputs.load(self.vault_path / "Signals" / "HEALTH_cloud-01.json", json.loads)
+            if isinstance(csig, dict):
                 try:
-                    csig = json.loads(cloud_signal_file.read_text(encoding="utf-8"))
                     age_s = (datetime.now(timezone.utc) -
                              datetime.fromisoformat(csig["timestamp"])).total_seconds()
-                    cloud_agent_status = "Offline (>" + str(int(age_s)) + "s)" if age_s > 300 else csig.get("status", "unknown").title()
-                    cloud_agent_ts = csig.get("timestamp", "—")[:16].replace("T", " ") + " UTC"
+                    values["cloud_age"] = str(int(age_s))
+                    cloud_agent_status = ("Offline (>" + volatile("cloud_age") + "s)" if age_s > 300
+                                          else csig.get("status", "unknown").title())
+                    values["cloud_agent_ts"] = csig.get("timestamp", "—")[:16].replace("T", " ") + " UTC"
+                    cloud_agent_ts = volatile("cloud_agent_ts")
                     cloud_pending = csig.get("in_progress_count", 0)
                 except Exception:
                     pass
 
             # Pending cloud updates
-            updates_pending = len(list((self.vault_path / "Updates").glob("UPDATE_*.md")))
+            updates_pending = inputs.count(self.vault_path / "Updates", "UPDATE_*.md")
 
             inbox_status = "✅ Clear" if na_count == 0 else f"⚠️ {na_count} pending"
             approval_status = "✅ Clear" if pa_count == 0 else f"📋 {pa_count} waiting"
             email_status = "✅ Clear" if email_count == 0 else f"📧 {email_count} unread"
             wa_status = "✅ Clear" if wa_processed == 0 else f"💬 {wa_processed} received"
 
-            dashboard = self.vault_path / "Dashboard.md"
-            dashboard_tmp = self.vault_path / "Dashboard.md.tmp"
-            content = f"""# AI Employee Dashboard
+            sections = [
+                ("header", f"""# AI Employee Dashboard
 ---
-last_updated: {now}
+last_updated: {volatile('now')}
 status: active
 version: 0.4.0
 tier: Platinum
 written_by: local-01
+content_hash: {volatile('content_hash')}
 ---
 
-## 💰 Financial Overview
+"""),
+                ("financial", f"""## 💰 Financial Overview
 
 | Metric | Value |
 |--------|-------|
@@ -985,13 +1037,15 @@ written_by: local-01
 
 ---
 
-## 📋 Active Projects
+"""),
+                ("projects", f"""## 📋 Active Projects
 
 {projects_md}
 
 ---
 
-## 📬 Pending Messages
+"""),
+                ("messages", f"""## 📬 Pending Messages
 
 | Channel | Status |
 |---------|--------|
@@ -1002,7 +1056,8 @@ written_by: local-01
 
 ---
 
-## System Status
+"""),
+                ("system", f"""## System Status
 
 | Component | Status | Last Check |
 |-----------|--------|------------|
@@ -1013,7 +1068,8 @@ written_by: local-01
 
 ---
 
-## Inbox Summary
+"""),
+                ("inbox", f"""## Inbox Summary
 
 - **Needs Action:** {inbox_status}
 - **Emails:** {email_status}
@@ -1029,7 +1085,8 @@ _Check `/Logs/` for detailed action history._
 
 ---
 
-## Platinum Tier
+"""),
+                ("platinum", f"""## Platinum Tier
 
 | Feature | Status |
 |---------|--------|
@@ -1046,7 +1103,8 @@ _Check `/Logs/` for detailed action history._
 
 ---
 
-## WhatsApp Channel
+"""),
+                ("whatsapp", f"""## WhatsApp Channel
 
 | Metric | Value |
 |--------|-------|
@@ -1056,7 +1114,8 @@ _Check `/Logs/` for detailed action history._
 
 ---
 
-## Quick Links
+"""),
+                ("footer", """## Quick Links
 
 - [Company Handbook](Company_Handbook.md)
 - [Business Goals](Business_Goals.md)
@@ -1067,13 +1126,27 @@ _Check `/Logs/` for detailed action history._
 ---
 
 _Updated automatically by AI Employee v0.4 Platinum · Local Agent local-01 · [Company Handbook](Company_Handbook.md)_
-"""
-            # Atomic write: temp → rename (single-writer rule — Local Agent only)
-            dashboard_tmp.write_text(content, encoding='utf-8')
-            dashboard_tmp.replace(dashboard)
+"""),
+            ]
+            # Single-writer rule — Local Agent only; atomic tmp → rename, skipped when unchanged
+            changed = self.dashboard_writer.write(sections, values)
+            if changed:
+                logger.debug(f"Dashboard.md rewritten (changed: {', '.join(changed)})")
         except Exception as e:
             logger.error(f"Dashboard update failed: {e}")
 
+    # ── Needs_Action ──────────────────────────────────────────────────────────
+
+    def notify_new_tasks(self):
+        """Announce tasks that arrived in /Needs_Action/, highest priority and closest to SLA breach first."""
+        new = self._task_queue.refresh([self.needs_action], "*.md")
+        for task in self._task_queue.ordered(new):
+            if task.name not in self._notified_tasks:
+                priority = self._task_queue.priority_of(task.name)
+                logger.info(f"NEW TASK [{priority}]: {task.name}")
+                self._notified_tasks.add(task.name)
+                self.log_action("task_detected", task.name, "notified", {"priority": priority})
+
     # ── Main Loop ─────────────────────────────────────────────────────────────
 
     def run(self):
@@ -1089,23 +1162,22 @@ _Updated automatically by AI Employee v0.4 Platinum · Local Agent local-01 · [
         tick = 0
 
         while self._running:
-            # Check for new tasks (every 5s)
-            for task in self.needs_action.glob("*.md"):
-                if task.name not in self._notified_tasks:
-                    logger.info(f"NEW TASK: {task.name}")
-                    self._notified_tasks.add(task.name)
-                    self.log_action("task_detected", task.name, "notified")
+            # Check for new tasks (every 5s) — announced urgent / nearly-breached first
+            self.notify_new_tasks()
 
             # HITL approval loop (every 5s)
             self.process_approved_actions()
 
-            # §7.3 Queue retry — re-send emails queued during Gmail outage (every 60s)
-            if tick % 12 == 0:
-                self.process_queued_emails()
+            # §7.3 Queue drain — only items whose backoff has expired (every 5s)
+            self.process_queued_emails()
 
             # Scheduled triggers (every 5s)
             self.process_scheduled_triggers()
 
+            # Rate-limited campaigns resume from their cursor (every 60s)
+            if tick % 12 == 0 and self._active_campaigns:
+                self.process_campaigns()
+
             # Health check + restart (every 60s)
             if tick % 12 == 0:
                 self.check_and_restart_processes()
@@ -1135,6 +1207,12 @@ def main():
     parser.add_argument("--no-social",     action="store_true", help="Disable Social Watcher (FB/IG/Twitter)")
     parser.add_argument("--no-scheduler",  action="store_true", help="Disable Scheduler")
     parser.add_argument("--dry-run",       action="store_true", help="Dry-run mode (no external actions)")
+    parser.add_argument("--in-process",    action="store_true",
+                        default=os.getenv("WATCHER_RUNTIME", "subprocess").lower() == "inprocess",
+                        help="Run watchers as supervised threads in this process (saves memory)")
+    parser.add_argument("--forkserver",    action="store_true",
+                        default=os.getenv("WATCHER_RUNTIME", "subprocess").lower() == "forkserver",
+                        help="Fork watchers from a preloaded zygote; restart them the instant they exit")
     args = parser.parse_args()
 
     if args.dry_run:
@@ -1147,6 +1225,8 @@ def main():
         enable_scheduler=not args.no_scheduler,
         enable_social=not args.no_social,
         enable_whatsapp=not args.no_whatsapp,
+        in_process=args.in_process,
+        forkserver=args.forkserver,
     )
     orchestrator.run()
 
@@ -20,14 +20,20 @@ Usage:
 
     # After a human-approved send, register the contact:
     add_known_contact("client@example.com", vault_path)
+
+    # Bulk paths — registries are loaded once for the whole batch:
+    results = check_many("email", vault_path, [{"to": addr} for addr in recipients])
+    blocked = opted_out(recipients, vault_path)
 """
 
 from __future__ import annotations
 
+import re
 import json
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Iterable, Literal
 
 # ── Result type ────────────────────────────────────────────────────────────────
 
@@ -56,134 +62,285 @@ _CONTACTS_FILE  = "Contacts/known_contacts.json"
 _PAYEES_FILE    = "Accounting/known_payees.json"
 _OPT_OUT_FILE   = "Contacts/opt_out_human_only.json"  # contacts who requested human-only comms
 
-# Keywords that signal sensitive/high-risk context — always escalate to approval
-_SENSITIVE_KEYWORDS = (
-    # Emotional
-    "condolence", "condolences", "sympathy", "bereavement", "grief", "sorry for your loss",
-    "passed away", "deceased", "funeral",
-    # Legal
-    "contract", "legal", "attorney", "lawyer", "sue", "lawsuit", "litigation",
-    "regulatory", "compliance", "gdpr", "subpoena", "arbitration",
-    # Medical
-    "medical", "diagnosis", "prescription", "treatment", "health condition",
-    "disability", "insurance claim",
-    # Conflict
-    "conflict", "dispute", "complaint", "terminate", "termination", "fired",
-    "harassment", "discriminat",
-)
+# Keywords that signal sensitive/high-risk context — always escalate to approval.
+# Matched as whole words (plus common inflections), so "sue" no longer fires on "issue".
+_SENSITIVE_CATEGORIES: dict[str, tuple[str, ...]] = {
+    "emotional": ("condolence", "condolences", "sympathy", "bereavement", "grief", "sorry for your loss",
+                  "passed away", "deceased", "funeral"),
+    "legal":     ("contract", "legal", "illegal", "attorney", "lawyer", "sue", "lawsuit", "litigation",
+                  "regulatory", "compliance", "gdpr", "subpoena", "arbitration"),
+    "medical":   ("medical", "diagnosis", "prescription", "treatment", "health condition",
+                  "disability", "insurance claim"),
+    "conflict":  ("conflict", "dispute", "complaint", "terminate", "termination", "fired",
+                  "harassment", "discriminat"),
+}
+_SENSITIVE_KEYWORDS = tuple(kw for kws in _SENSITIVE_CATEGORIES.values() for kw in kws)
+_SENSITIVE_STEMS = {"discriminat", "contract"}   # match any word starting with these (contractual, contractor)
 
 PAYMENT_AUTO_MAX    = 50.0    # USD — recurring payments below this are auto-approved
 PAYMENT_HARD_MAX    = 100.0   # USD — above this ALWAYS requires approval
 
 
-# ── Contacts helpers ───────────────────────────────────────────────────────────
+# ── Contact / payee registries ─────────────────────────────────────────────────
+#
+# Each registry is a JSON base file plus an append-only journal beside it
+# (one entry per line). Reads are served from an in-memory set that is only
+# rebuilt when the (mtime_ns, size) of either file changes, so a check costs
+# two stat() calls instead of a JSON parse. Writes append one line; every
+# COMPACT_EVERY journal lines the journal is folded back into the JSON file.
+
+COMPACT_EVERY = 100   # journal lines before the JSON base file is rewritten
+
+_Signature = tuple[int, int] | None
+
 
-def _load_known_contacts(vault_path: Path) -> set[str]:
-    contacts_file = vault_path / _CONTACTS_FILE
-    if not contacts_file.exists():
-        return set()
+def _signature(path: Path) -> _Signature:
     try:
-        data = json.loads(contacts_file.read_text(encoding="utf-8"))
-        return {c.lower().strip() for c in data.get("contacts", [])}
-    except Exception:
-        return set()
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class _Registry:
+    """A set of strings persisted as `{key: [...]}` JSON + `<name>.journal`."""
+
+    def __init__(self, rel_path: str, key: str, note: str, preserve_case: bool = False):
+        self.rel_path = rel_path
+        self.key = key
+        self.note = note
+        self.preserve_case = preserve_case   # payees keep their display casing on disk
+        self._lock = threading.Lock()
+        # resolved base path → (base sig, journal sig, lowercase member set, journal lines)
+        self._cache: dict[Path, tuple[_Signature, _Signature, frozenset[str], int]] = {}
+
+    def _paths(self, vault_path: Path) -> tuple[Path, Path, Path]:
+        base = (vault_path / self.rel_path).resolve()
+        journal = base.with_suffix(".journal")
+        return base, journal, journal.with_suffix(".journal.compacting")
+
+    def _read_entries(self, vault_path: Path) -> tuple[list[str], list[str]]:
+        """Return (base entries, journal entries incl. an interrupted compaction)."""
+        base, journal, compacting = self._paths(vault_path)
+        entries: list[str] = []
+        if base.exists():
+            try:
+                entries = json.loads(base.read_text(encoding="utf-8")).get(self.key, [])
+            except Exception:
+                entries = []
+        pending: list[str] = []
+        for path in (compacting, journal):
+            if path.exists():
+                try:
+                    pending += [ln.strip() for ln in path.read_text(encoding="utf-8").splitlines() if ln.strip()]
+                except OSError:
+                    pass
+        return entries, pending
+
+    def members(self, vault_path: Path) -> frozenset[str]:
+        """Lowercased member set; re-read only when either file has changed."""
+        base, journal, _ = self._paths(vault_path)
+        base_sig, journal_sig = _signature(base), _signature(journal)
+        cached = self._cache.get(base)
+        if cached and cached[0] == base_sig and cached[1] == journal_sig:
+            return cached[2]
+        with self._lock:
+            entries, pending = self._read_entries(vault_path)
+            members = frozenset(e.lower().strip() for e in entries + pending)
+            self._cache[base] = (base_sig, journal_sig, members, len(pending))
+            return members
+
+    def add(self, value: str, vault_path: Path) -> None:
+        """O(1) append to the journal; compacts every COMPACT_EVERY additions."""
+        value = value.strip() if self.preserve_case else value.lower().strip()
+        if not value or value.lower() in self.members(vault_path):
+            return
+        base, journal, _ = self._paths(vault_path)
+        base.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            with open(journal, "a", encoding="utf-8") as f:
+                f.write(value + "\n")
+        self.members(vault_path)   # refresh cache with the new signature
+        if self._cache[base][3] >= COMPACT_EVERY:
+            self.compact(vault_path)
+
+    def compact(self, vault_path: Path) -> None:
+        """Fold the journal into the sorted JSON base file (atomic replace)."""
+        base, journal, compacting = self._paths(vault_path)
+        with self._lock:
+            if journal.exists() and not compacting.exists():
+                # Claim the journal first so concurrent appends start a fresh one
+                journal.rename(compacting)
+            entries, pending = self._read_entries(vault_path)
+            seen = {e.lower().strip() for e in entries}
+            for value in pending:
+                if value.lower() not in seen:
+                    entries.append(value)
+                    seen.add(value.lower())
+            data: dict = {}
+            if base.exists():
+                try:
+                    data = json.loads(base.read_text(encoding="utf-8"))
+                except Exception:
+                    data = {}
+            data[self.key] = sorted(entries)
+            data.setdefault("_note", self.note)
+            tmp = base.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            tmp.replace(base)
+            compacting.unlink(missing_ok=True)
+            self._cache.pop(base, None)
+
+
+_CONTACTS = _Registry(
+    _CONTACTS_FILE, "contacts",
+    "Auto-maintained by permission_guard.add_known_contact(). Add contacts here after first human-approved email send.",
+)
+_OPT_OUT = _Registry(
+    _OPT_OUT_FILE, "opt_out",
+    "Contacts who requested human-only communication — AI must never auto-send to these addresses",
+)
+_PAYEES = _Registry(
+    _PAYEES_FILE, "payees",
+    "Auto-maintained by permission_guard.add_known_payee().",
+    preserve_case=True,
+)
+
+
+def _load_known_contacts(vault_path: Path) -> frozenset[str]:
+    return _CONTACTS.members(vault_path)
 
 
-def _load_opt_out(vault_path: Path) -> set[str]:
+def _load_opt_out(vault_path: Path) -> frozenset[str]:
     """Return emails of contacts who requested human-only communication."""
-    opt_out_file = vault_path / _OPT_OUT_FILE
-    if not opt_out_file.exists():
-        return set()
-    try:
-        data = json.loads(opt_out_file.read_text(encoding="utf-8"))
-        return {e.lower().strip() for e in data.get("opt_out", [])}
-    except Exception:
-        return set()
+    return _OPT_OUT.members(vault_path)
+
+
+def _load_known_payees(vault_path: Path) -> frozenset[str]:
+    return _PAYEES.members(vault_path)
 
 
 def add_opt_out(email: str, vault_path: Path) -> None:
     """Register a contact as requiring human-only communication (no AI-sent emails)."""
-    opt_out_file = vault_path / _OPT_OUT_FILE
-    opt_out_file.parent.mkdir(parents=True, exist_ok=True)
-    entries: list[str] = []
-    if opt_out_file.exists():
-        try:
-            entries = json.loads(opt_out_file.read_text(encoding="utf-8")).get("opt_out", [])
-        except Exception:
-            entries = []
-    email = email.lower().strip()
-    if email not in [e.lower() for e in entries]:
-        entries.append(email)
-        opt_out_file.write_text(
-            json.dumps({"opt_out": sorted(entries),
-                        "_note": "Contacts who requested human-only communication — AI must never auto-send to these addresses"},
-                       indent=2),
-            encoding="utf-8",
-        )
+    _OPT_OUT.add(email, vault_path)
 
 
-def is_sensitive_content(text: str) -> str | None:
+def opted_out(addresses: Iterable[str], vault_path: Path) -> set[str]:
+    """Bulk opt-out filter — the subset of `addresses` that requested human-only communication."""
+    opt_out = _load_opt_out(vault_path)
+    return {addr for addr in addresses if addr.lower().strip() in opt_out}
+
+
+def add_known_contact(email: str, vault_path: Path) -> None:
+    """Register an email address as a known contact (call after human-approved send)."""
+    _CONTACTS.add(email, vault_path)
+
+
+def add_known_payee(payee: str, vault_path: Path) -> None:
+    """Register a payee as known (call after human-approved payment)."""
+    _PAYEES.add(payee, vault_path)
+
+
+def compact_registries(vault_path: Path) -> None:
+    """Fold all pending journal entries into their JSON files (e.g. before sync)."""
+    for registry in (_CONTACTS, _OPT_OUT, _PAYEES):
+        registry.compact(vault_path)
+
+
+# ── Sensitive content ──────────────────────────────────────────────────────────
+
+def _trie_pattern(node: dict) -> str:
+    """Render a character trie as a regex; shared prefixes are matched only once."""
+    branches = [
+        (r"\s+" if ch == " " else re.escape(ch)) + _trie_pattern(child)
+        for ch, child in sorted(node.items()) if ch not in ("", "*")
+    ]
+    if "*" in node:
+        branches.append(r"\w*")
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return f"(?:{body})?" if "" in node else body
+
+
+def _build_sensitive_re() -> re.Pattern:
     """
-    Scan text for sensitive keywords that require human review.
-    Returns the matched keyword (for logging), or None if clean.
-    Ethics principle: emotional, legal, medical, conflict contexts → always escalate.
+    One regex for every keyword, compiled from a prefix trie so the engine does
+    not retry ~45 alternatives at each word start. Whole words only, plus
+    common inflections (contracts, disputed, terminated).
     """
-    lower = text.lower()
+    trie: dict = {}
     for kw in _SENSITIVE_KEYWORDS:
-        if kw in lower:
-            return kw
-    return None
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node["*" if kw in _SENSITIVE_STEMS else ""] = {}
+    return re.compile(
+        r"\b(?=[a-z])(" + _trie_pattern(trie) + r")(?:s|es|d|ed|ing|ly)?\b",
+        re.IGNORECASE,
+    )
 
 
-def add_known_contact(email: str, vault_path: Path) -> None:
-    """Register an email address as a known contact (call after human-approved send)."""
-    contacts_file = vault_path / _CONTACTS_FILE
-    contacts_file.parent.mkdir(parents=True, exist_ok=True)
-    contacts: list[str] = []
-    if contacts_file.exists():
-        try:
-            contacts = json.loads(contacts_file.read_text(encoding="utf-8")).get("contacts", [])
-        except Exception:
-            contacts = []
-    email = email.lower().strip()
-    if email not in [c.lower() for c in contacts]:
-        contacts.append(email)
-        contacts_file.write_text(
-            json.dumps({"contacts": sorted(contacts)}, indent=2),
-            encoding="utf-8",
-        )
+_SENSITIVE_RE = _build_sensitive_re()
+_SENSITIVE_CATEGORY_OF = {kw: cat for cat, kws in _SENSITIVE_CATEGORIES.items() for kw in kws}
+_SENSITIVE_MAX_LEN = max(len(kw) for kw in _SENSITIVE_KEYWORDS) + 8
 
 
-# ── Payees helpers ─────────────────────────────────────────────────────────────
+def _keyword_of(match: str) -> str:
+    word = " ".join(match.lower().split())
+    if word in _SENSITIVE_CATEGORY_OF:
+        return word
+    return next(stem for stem in _SENSITIVE_STEMS if word.startswith(stem))
 
-def _load_known_payees(vault_path: Path) -> set[str]:
-    payees_file = vault_path / _PAYEES_FILE
-    if not payees_file.exists():
-        return set()
-    try:
-        data = json.loads(payees_file.read_text(encoding="utf-8"))
-        return {p.lower().strip() for p in data.get("payees", [])}
-    except Exception:
-        return set()
 
+def _collect(text: str, found: dict[str, list[str]]) -> None:
+    for m in _SENSITIVE_RE.finditer(text):
+        kw = _keyword_of(m.group(1))
+        hits = found.setdefault(_SENSITIVE_CATEGORY_OF[kw], [])
+        if kw not in hits:
+            hits.append(kw)
+
+
+def scan_sensitive(text: str) -> dict[str, list[str]]:
+    """
+    Return every sensitive category present in `text` with its matched keywords,
+    e.g. {"legal": ["lawsuit"], "conflict": ["dispute"]}. Empty dict if clean.
+    """
+    found: dict[str, list[str]] = {}
+    _collect(text, found)
+    return found
+
+
+def scan_sensitive_stream(chunks: Iterable[str]) -> dict[str, list[str]]:
+    """
+    scan_sensitive() over an iterable of text chunks (file lines, attachment pages)
+    without joining them. Each chunk is scanned up to its last whitespace and a
+    short word-aligned tail is carried over, so phrases split across chunks match.
+    """
+    found: dict[str, list[str]] = {}
+    carry = ""
+    for chunk in chunks:
+        buf = carry + chunk
+        cut = max(buf.rfind(" "), buf.rfind("\n"), buf.rfind("\t"))
+        if cut <= 0:
+            carry = buf
+            continue
+        _collect(buf[:cut], found)
+        tail_start = max(buf.rfind(" ", 0, max(cut - _SENSITIVE_MAX_LEN, 0)), 0)
+        carry = buf[tail_start:]
+    if carry:
+        _collect(carry, found)
+    return found
 
-def add_known_payee(payee: str, vault_path: Path) -> None:
-    """Register a payee as known (call after human-approved payment)."""
-    payees_file = vault_path / _PAYEES_FILE
-    payees_file.parent.mkdir(parents=True, exist_ok=True)
-    payees: list[str] = []
-    if payees_file.exists():
-        try:
-            payees = json.loads(payees_file.read_text(encoding="utf-8")).get("payees", [])
-        except Exception:
-            payees = []
-    payee = payee.strip()
-    if payee not in payees:
-        payees.append(payee)
-        payees_file.write_text(
-            json.dumps({"payees": sorted(payees)}, indent=2),
-            encoding="utf-8",
-        )
+
+def is_sensitive_content(text: str) -> str | None:
+    """
+    Scan text for sensitive keywords that require human review.
+    Returns the first matched keyword (for logging), or None if clean.
+    Ethics principle: emotional, legal, medical, conflict contexts → always escalate.
+    """
+    m = _SENSITIVE_RE.search(text)
+    return _keyword_of(m.group(1)) if m else None
 
 
 # ── Rule: Email ────────────────────────────────────────────────────────────────
@@ -200,10 +357,22 @@ def check_email(
     Auto-approve: reply to a single known contact, no CC, no sensitive content.
     Require approval: new contact, bulk, CC, opt-out recipient, or sensitive keywords.
     """
+    return _email_rule(to, _load_opt_out(vault_path), _load_known_contacts(vault_path),
+                       bulk=bulk, cc=cc, subject=subject, body=body)
+
+
+def _email_rule(
+    to: str,
+    opt_out: frozenset[str],
+    known: frozenset[str],
+    bulk: bool = False,
+    cc: str = "",
+    subject: str = "",
+    body: str = "",
+) -> PermissionResult:
     recipients = [r.strip() for r in to.split(",") if r.strip()]
 
     # Opt-out check — contacts who requested human-only comms
-    opt_out = _load_opt_out(vault_path)
     for addr in recipients:
         if addr.lower().strip() in opt_out:
             return PermissionResult(
@@ -213,12 +382,12 @@ def check_email(
             )
 
     # Sensitive content detection (subject + body)
-    combined = f"{subject} {body}"
-    matched_kw = is_sensitive_content(combined)
-    if matched_kw:
+    sensitive = scan_sensitive(f"{subject} {body}")
+    if sensitive:
+        keywords = ", ".join(kw for kws in sensitive.values() for kw in kws)
         return PermissionResult(
             mode="approval",
-            reason=f"sensitive context detected ('{matched_kw}') — emotional/legal/medical content requires human review",
+            reason=f"sensitive context detected ('{keywords}') — {'/'.join(sensitive)} content requires human review",
             category="email",
         )
 
@@ -235,7 +404,6 @@ def check_email(
             category="email",
         )
 
-    known = _load_known_contacts(vault_path)
     if to.lower().strip() in known:
         return PermissionResult(
             mode="auto",
@@ -262,6 +430,15 @@ def check_payment(
     Auto-approve: recurring payment < $50 to a known payee.
     Require approval: new payee, or any amount > $100.
     """
+    return _payment_rule(amount, payee, _load_known_payees(vault_path), recurring=recurring)
+
+
+def _payment_rule(
+    amount: float,
+    payee: str,
+    known: frozenset[str],
+    recurring: bool = False,
+) -> PermissionResult:
     abs_amount = abs(amount)
 
     if abs_amount > PAYMENT_HARD_MAX:
@@ -271,7 +448,6 @@ def check_payment(
             category="payment",
         )
 
-    known = _load_known_payees(vault_path)
     if payee.lower().strip() not in known:
         return PermissionResult(
             mode="approval",
@@ -419,6 +595,27 @@ def check(
     )
 
 
+def check_many(
+    category: Literal["email", "payment", "social", "file"],
+    vault_path: Path,
+    items: Iterable[dict],
+) -> list[PermissionResult]:
+    """
+    Batch permission check for bulk paths (mail merge, statement import).
+    Registries are snapshotted once, so each item is a pure in-memory check.
+
+    Example:
+        check_many("email", vault, [{"to": "a@b.com"}, {"to": "c@d.com", "subject": "Hi"}])
+    """
+    if category == "email":
+        opt_out, known = _load_opt_out(vault_path), _load_known_contacts(vault_path)
+        return [_email_rule(opt_out=opt_out, known=known, **kw) for kw in items]
+    if category == "payment":
+        payees = _load_known_payees(vault_path)
+        return [_payment_rule(known=payees, **kw) for kw in items]
+    return [check(category, vault_path, **kw) for kw in items]
+
+
 # ── CLI — quick boundary test ──────────────────────────────────────────────────
 
 if __name__ == "__main__":
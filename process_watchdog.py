@@ -5,20 +5,36 @@ Monitors the orchestrator process and restarts it if it crashes.
 This is the safety net that catches orchestrator failures — the orchestrator's
 own `check_and_restart_processes()` only works while it's alive.
 
+Modes:
+  poll (default)  — checks the PID file (/tmp/ai_employee_orchestrator.pid)
+                    every WATCHDOG_INTERVAL seconds with os.kill(pid, 0).
+  supervise       — the watchdog launches and OWNS the orchestrator, blocking on
+                    a pidfd (Linux) or waitpid until it exits: zero detection
+                    latency, no idle wake-ups, immune to PID reuse. Stopping the
+                    watchdog also stops its orchestrator.
+
 Features:
-  - Monitors orchestrator via PID file (/tmp/ai_employee_orchestrator.pid)
-  - Exponential back-off between restarts (30s → 60s → 120s, max 5min)
+  - Supervise mode restarts on a backoff curve: immediately after a healthy
+    run, then WATCHDOG_BACKOFF_BASE * 2^(n-1) seconds (max WATCHDOG_BACKOFF_MAX)
+    while it keeps crashing; the curve resets after WATCHDOG_HEALTHY_AFTER seconds up
   - Writes its own health signal to AI_Employee_Vault/Signals/HEALTH_watchdog.json
+    (only when it changes)
   - Creates ALERT in /Needs_Action/ after MAX_RESTARTS_PER_HOUR restarts
-  - Pauses restarts once the hourly limit is reached (human must fix root cause)
+  - Pauses restarts once the hourly limit is reached, until the oldest restart
+    leaves the one-hour window (human should fix root cause)
 
 Run:
     uv run watchdog-service
     uv run watchdog-service --vault ./AI_Employee_Vault --interval 30
+    uv run watchdog-service --supervise
 
 Configure:
-    WATCHDOG_INTERVAL=30              # seconds between checks
+    WATCHDOG_MODE=poll                # "poll" or "supervise"
+    WATCHDOG_INTERVAL=30              # seconds between checks (poll mode)
     WATCHDOG_MAX_RESTARTS=5           # max auto-restarts per hour
+    WATCHDOG_BACKOFF_BASE=2           # supervise mode restart backoff (seconds)
+    WATCHDOG_BACKOFF_MAX=300
+    WATCHDOG_HEALTHY_AFTER=600        # uptime that resets the backoff curve
     VAULT_PATH=./AI_Employee_Vault
 """
 
@@ -26,6 +42,7 @@ import os
 import sys
 import json
 import time
+import select
 import signal
 import logging
 import argparse
@@ -49,6 +66,9 @@ PID_FILE      = Path("/tmp/ai_employee_orchestrator.pid")
 STATE_FILE    = Path("/tmp/ai_employee_watchdog.json")
 CHECK_INTERVAL       = int(os.getenv("WATCHDOG_INTERVAL", "30"))
 MAX_RESTARTS_PER_HOUR = int(os.getenv("WATCHDOG_MAX_RESTARTS", "5"))
+BACKOFF_BASE         = int(os.getenv("WATCHDOG_BACKOFF_BASE", "2"))
+BACKOFF_MAX          = int(os.getenv("WATCHDOG_BACKOFF_MAX", "300"))
+HEALTHY_AFTER        = int(os.getenv("WATCHDOG_HEALTHY_AFTER", "600"))
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -87,6 +107,31 @@ def _save_state(state: dict) -> None:
         logger.error(f"Could not save watchdog state: {e}")
 
 
+def _prune_restarts(state: dict) -> int:
+    """Drop restart timestamps older than one hour; return how many remain."""
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=1)
+    state["restarts"] = [
+        r for r in state.get("restarts", [])
+        if datetime.fromisoformat(r) > cutoff
+    ]
+    return len(state["restarts"])
+
+
+def _pause_seconds(state: dict) -> float:
+    """Seconds until the oldest restart leaves the one-hour window."""
+    if not state.get("restarts"):
+        return 0.0
+    oldest = min(datetime.fromisoformat(r) for r in state["restarts"])
+    return max((oldest + timedelta(hours=1) - datetime.now(timezone.utc)).total_seconds(), 1.0)
+
+
+def _backoff(failures: int) -> int:
+    """Restart delay after `failures` consecutive short-lived runs (0 = restart now)."""
+    if failures == 0:
+        return 0
+    return min(BACKOFF_BASE * (2 ** (failures - 1)), BACKOFF_MAX)
+
+
 def _orchestrator_cmd(vault_path: Path) -> list[str]:
     """Build the command to launch orchestrator.py via uv or plain python."""
     project_root = Path(__file__).parent
@@ -101,9 +146,12 @@ def _orchestrator_cmd(vault_path: Path) -> list[str]:
 
 # ── Vault notifications ────────────────────────────────────────────────────────
 
-def _write_health(vault_path: Path, state: dict) -> None:
-    signals_dir = vault_path / "Signals"
-    signals_dir.mkdir(parents=True, exist_ok=True)
+_last_health: dict = {}
+
+
+def _write_health(vault_path: Path, state: dict, status: str = "online", **extra) -> None:
+    """Write HEALTH_watchdog.json — skipped when nothing but the timestamp would change."""
+    global _last_health
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(hours=1)
     restarts_last_hour = sum(
@@ -112,12 +160,18 @@ def _write_health(vault_path: Path, state: dict) -> None:
     )
     health = {
         "agent_id": "watchdog",
-        "status": "online",
-        "timestamp": now.isoformat(),
+        "status": status,
         "total_restarts": state.get("total_restarts", 0),
         "restarts_last_hour": restarts_last_hour,
         "max_restarts_per_hour": MAX_RESTARTS_PER_HOUR,
+        **extra,
     }
+    if health == _last_health:
+        return
+    _last_health = dict(health)
+    health["timestamp"] = now.isoformat()
+    signals_dir = vault_path / "Signals"
+    signals_dir.mkdir(parents=True, exist_ok=True)
     try:
         (signals_dir / "HEALTH_watchdog.json").write_text(
             json.dumps(health, indent=2), encoding="utf-8"
@@ -218,14 +272,7 @@ def run(vault_path: Path) -> None:
             alive = pid is not None and _is_running(pid)
 
             if not alive:
-                now = datetime.now(timezone.utc)
-                cutoff = now - timedelta(hours=1)
-                # Prune old entries
-                state["restarts"] = [
-                    r for r in state.get("restarts", [])
-                    if datetime.fromisoformat(r) > cutoff
-                ]
-                restarts_last_hour = len(state["restarts"])
+                restarts_last_hour = _prune_restarts(state)
 
                 logger.warning(
                     f"Orchestrator not running "
@@ -242,8 +289,8 @@ def run(vault_path: Path) -> None:
                         "reason": "restart_limit_reached",
                         "restarts_last_hour": restarts_last_hour,
                     })
-                    # Wait 5 minutes before re-checking (instead of rapid loops)
-                    time.sleep(300)
+                    # Wait until the oldest restart leaves the window (instead of rapid loops)
+                    time.sleep(_pause_seconds(state))
                     continue
 
                 _start_orchestrator(vault_path, state)
@@ -256,7 +303,124 @@ def run(vault_path: Path) -> None:
     logger.info("Watchdog exited cleanly.")
 
 
-def _start_orchestrator(vault_path: Path, state: dict) -> None:
+def _wait_for_exit(pid: int, wake_fd: int, proc: subprocess.Popen | None = None) -> bool:
+    """
+    Block until `pid` exits (True) or a stop is requested via `wake_fd` (False).
+
+    Uses a pidfd where the platform has one — the kernel wakes us the instant
+    the process dies, and a pidfd can never refer to a recycled PID.
+    """
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        try:
+            ready, _, _ = select.select([pidfd, wake_fd], [], [])
+            return pidfd in ready
+        finally:
+            os.close(pidfd)
+    # No pidfd (macOS, old kernels): fall back to polling, still interruptible
+    while (proc.poll() is None) if proc is not None else _is_running(pid):
+        if select.select([wake_fd], [], [], CHECK_INTERVAL)[0]:
+            return False
+    return True
+
+
+def _wait(wake_fd: int, seconds: float) -> bool:
+    """Sleep up to `seconds`; returns True if a stop was requested meanwhile."""
+    return bool(select.select([wake_fd], [], [], seconds)[0])
+
+
+def supervise(vault_path: Path) -> None:
+    """Supervision mode — own the orchestrator process and block on its exit."""
+    logger.info(f"Watchdog supervising (max_restarts/hr={MAX_RESTARTS_PER_HOUR}, "
+                f"backoff {BACKOFF_BASE}s..{BACKOFF_MAX}s)")
+    logger.info(f"Vault: {vault_path}")
+
+    state = _load_state()
+    wake_r, wake_w = os.pipe()
+    stopping = False
+
+    def _handle_signal(sig, frame):
+        nonlocal stopping
+        logger.info("Watchdog stopping...")
+        stopping = True
+        os.write(wake_w, b"x")
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
+    # An orchestrator started elsewhere is not our child — wait it out, then take over
+    existing_pid = _read_pid()
+    if existing_pid and _is_running(existing_pid):
+        logger.info(f"Orchestrator already running (PID {existing_pid}) — taking over when it exits")
+        _write_health(vault_path, state, "monitoring", child_pid=existing_pid)
+        if not _wait_for_exit(existing_pid, wake_r):
+            _write_health(vault_path, state, "stopped")
+            return
+
+    proc = None
+    failures = 0
+    while not stopping:
+        restarts_last_hour = _prune_restarts(state)
+        if restarts_last_hour >= MAX_RESTARTS_PER_HOUR:
+            pause = _pause_seconds(state)
+            logger.error(
+                f"Restart limit reached ({restarts_last_hour}/{MAX_RESTARTS_PER_HOUR}/hr). "
+                f"Pausing auto-restarts for {pause:.0f}s — human intervention required."
+            )
+            _write_restart_alert(vault_path, restarts_last_hour)
+            _write_log(vault_path, "watchdog_pause", "error", {
+                "reason": "restart_limit_reached",
+                "restarts_last_hour": restarts_last_hour,
+                "resume_in_seconds": round(pause),
+            })
+            _write_health(vault_path, state, "paused")
+            if _wait(wake_r, pause):
+                break
+            continue
+
+        proc = _start_orchestrator(vault_path, state)
+        started = time.monotonic()
+        if proc is None:
+            exit_code, uptime = None, 0.0
+        else:
+            _write_health(vault_path, state, "online", child_pid=proc.pid)
+            if not _wait_for_exit(proc.pid, wake_r, proc):
+                break
+            exit_code, uptime = proc.wait(), time.monotonic() - started
+            proc = None
+
+        if uptime >= HEALTHY_AFTER:
+            failures = 0
+        delay = _backoff(failures)
+        failures += 1
+        logger.warning(f"Orchestrator exited (code {exit_code}) after {uptime:.0f}s — "
+                       f"restarting in {delay}s")
+        _write_log(vault_path, "orchestrator_exit", "warning", {
+            "exit_code": exit_code,
+            "uptime_seconds": round(uptime),
+            "backoff_seconds": delay,
+        })
+        _write_health(vault_path, state, "restarting", last_exit_code=exit_code)
+        if delay and _wait(wake_r, delay):
+            break
+
+    # The watchdog owns its child — take it down with us
+    if proc is not None and proc.poll() is None:
+        logger.info(f"Stopping orchestrator (PID {proc.pid})")
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    _write_health(vault_path, state, "stopped")
+    logger.info("Watchdog exited cleanly.")
+
+
+def _start_orchestrator(vault_path: Path, state: dict) -> subprocess.Popen | None:
     """Start the orchestrator process and record the restart."""
     cmd = _orchestrator_cmd(vault_path)
     env = os.environ.copy()
@@ -279,9 +443,11 @@ def _start_orchestrator(vault_path: Path, state: dict) -> None:
             "pid": proc.pid,
             "total_restarts": state["total_restarts"],
         })
+        return proc
     except Exception as e:
         logger.error(f"Failed to start orchestrator: {e}")
         _write_log(vault_path, "orchestrator_restart", "error", {"error": str(e)})
+        return None
 
 
 # ── Entry point ───────────────────────────────────────────────────────────────
@@ -299,12 +465,21 @@ def main():
         default=CHECK_INTERVAL,
         help="Seconds between health checks (default: 30)",
     )
+    parser.add_argument(
+        "--supervise",
+        action="store_true",
+        default=os.getenv("WATCHDOG_MODE", "poll").lower() == "supervise",
+        help="Own the orchestrator process and react to its exit immediately",
+    )
     args = parser.parse_args()
 
     vault_path = Path(args.vault).resolve()
     vault_path.mkdir(parents=True, exist_ok=True)
 
-    run(vault_path)
+    if args.supervise:
+        supervise(vault_path)
+    else:
+        run(vault_path)
 
 
 if __name__ == "__main__":
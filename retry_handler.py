@@ -28,7 +28,7 @@ from __future__ import annotations
 import time
 import logging
 from functools import wraps
-from typing import Type
+from typing import Optional, Type
 
 logger = logging.getLogger("retry_handler")
 
@@ -123,6 +123,23 @@ def classify_error(exc: Exception) -> AIEmployeeError:
     return LogicError(str(exc))
 
 
+def _retry_delay(exc: Exception, attempt: int, base_delay: float, max_delay: float) -> Optional[float]:
+    """
+    Backoff before the next attempt, or None to give up now.
+
+    An error carrying `retry_after` (e.g. google_quota.QuotaExhaustedError) is
+    honoured instead of the blind exponential curve — and if the server-side
+    wait exceeds max_delay, retrying sooner would only feed a 429 storm.
+    """
+    delay = min(base_delay * (2 ** attempt), max_delay)
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        if retry_after > max_delay:
+            return None
+        delay = max(delay, retry_after)
+    return delay
+
+
 # ── §7.2 Retry decorator (sync) ────────────────────────────────────────────────
 
 def with_retry(
@@ -150,9 +167,9 @@ def with_retry(
                 try:
                     return func(*args, **kwargs)
                 except retryable as e:
-                    if attempt == max_attempts - 1:
+                    delay = _retry_delay(e, attempt, base_delay, max_delay)
+                    if attempt == max_attempts - 1 or delay is None:
                         raise
-                    delay = min(base_delay * (2 ** attempt), max_delay)
                     logger.warning(
                         f"[{func.__name__}] Attempt {attempt + 1}/{max_attempts} failed "
                         f"({type(e).__name__}): {e}. Retrying in {delay:.1f}s"
@@ -197,9 +214,9 @@ def with_retry_async(
                 try:
                     return await func(*args, **kwargs)
                 except retryable as e:
-                    if attempt == max_attempts - 1:
+                    delay = _retry_delay(e, attempt, base_delay, max_delay)
+                    if attempt == max_attempts - 1 or delay is None:
                         raise
-                    delay = min(base_delay * (2 ** attempt), max_delay)
                     logger.warning(
                         f"[{func.__name__}] Async attempt {attempt + 1}/{max_attempts} failed "
                         f"({type(e).__name__}): {e}. Retrying in {delay:.1f}s"
@@ -4,7 +4,8 @@ scheduler.py — Cron-style scheduler for the AI Employee.
 Scheduled jobs:
   - Daily 08:00  → Morning briefing (trigger Claude to update Dashboard)
   - Sunday 22:00 → Weekly audit + CEO Briefing generation
-  - Every 30 min → Check /Needs_Action for stale items (SLA monitor)
+  - Continuous   → SLA breach / approval expiry alerts at the deadline
+                   (deadline_monitor.py — event-driven, no periodic vault scans)
 
 Usage:
     uv run scheduler
@@ -21,6 +22,7 @@ import urllib.error
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from dotenv import load_dotenv
+from deadline_monitor import DeadlineMonitor
 
 load_dotenv()
 
@@ -160,104 +162,6 @@ def job_weekly_audit():
     _log("weekly_audit_triggered", "success", {"period": f"{period_start} to {period_end}"})
 
 
-def job_sla_monitor():
-    """Every 30 min — check for SLA breaches on pending emails."""
-    logger.info("▶ SLA monitor check")
-    overdue = []
-
-    for task_file in NEEDS_ACTION.glob("EMAIL_*.md"):
-        try:
-            content = task_file.read_text(encoding='utf-8')
-            # Find 'received:' in frontmatter
-            for line in content.split("\n"):
-                if line.startswith("received:"):
-                    received_str = line.replace("received:", "").strip()
-                    received_dt = datetime.fromisoformat(received_str)
-                    age_hours = (datetime.now(timezone.utc) - received_dt).total_seconds() / 3600
-                    if age_hours > 24:
-                        overdue.append({"file": task_file.name, "age_hours": round(age_hours, 1)})
-                    break
-        except Exception:
-            pass
-
-    if overdue:
-        logger.warning(f"SLA breaches detected: {len(overdue)} email(s) overdue")
-        for item in overdue:
-            alert_name = f"ALERT_sla_{item['file']}"
-            alert_file = NEEDS_ACTION / alert_name
-            # Also skip if ANY existing alert mentions this file (avoids duplicates with Claude-created alerts)
-            existing_alerts = list(NEEDS_ACTION.glob("ALERT_*.md"))
-            already_alerted = any(
-                item['file'].replace('.md', '') in f.stem for f in existing_alerts
-            )
-            if not alert_file.exists() and not already_alerted:
-                alert_file.write_text(
-                    f"""---
-type: alert
-severity: high
-created: {datetime.now(timezone.utc).isoformat()}
-status: pending
----
-
-SLA Breach: {item['file']}
-
-Email task is **{item['age_hours']} hours old** (SLA = 24 hours).
-
-**Action required:** Review and respond to the client.
-
-Related: [{item['file']}]({item['file']})
-""",
-                    encoding='utf-8',
-                )
-        _log("sla_monitor", "breach_detected", {"overdue_count": len(overdue), "items": overdue})
-    else:
-        logger.info("SLA monitor: all emails within 24hr SLA")
-
-
-def job_approval_check():
-    """Every 30 min — flag expired approval requests."""
-    pending_dir = VAULT_PATH / "Pending_Approval"
-    if not pending_dir.exists():
-        return
-
-    for f in pending_dir.glob("*.md"):
-        try:
-            content = f.read_text(encoding='utf-8')
-            for line in content.split("\n"):
-                if line.startswith("expires:"):
-                    exp_str = line.replace("expires:", "").strip()
-                    exp_dt = datetime.fromisoformat(exp_str)
-                    if datetime.now(timezone.utc) > exp_dt:
-                        # Already flagged? Also check for Claude-created alerts mentioning this file
-                        alert_path = NEEDS_ACTION / f"ALERT_expired_{f.name}"
-                        existing_alerts = list(NEEDS_ACTION.glob("ALERT_*.md"))
-                        already_alerted = any(
-                            f.stem.replace('.md', '') in alert.stem for alert in existing_alerts
-                        )
-                        if not alert_path.exists() and not already_alerted:
-                            alert_path.write_text(
-                                f"""---
-type: alert
-severity: high
-created: {datetime.now(timezone.utc).isoformat()}
-status: pending
----
-
-Approval Request EXPIRED: {f.name}
-
-The approval window has closed. **Re-approve or reject** this request.
-
-Related file: [Pending_Approval/{f.name}](../Pending_Approval/{f.name})
-""",
-                                encoding='utf-8',
-                            )
-                            logger.warning(f"Expired approval flagged: {f.name}")
-                            _log("approval_expired_flagged", "success", {"file": f.name})
-                    break
-        except Exception:
-            pass
-
-
 # ── Gold Tier Jobs ─────────────────────────────────────────────────────────────
 
 def job_odoo_health_check():
@@ -639,16 +543,14 @@ def main():
     # Weekly business audit — Monday 06:00 (Gold Tier)
     schedule.every().monday.at("06:00").do(job_weekly_business_audit)
 
-    # Continuous monitoring every 30 minutes
-    schedule.every(30).minutes.do(job_sla_monitor)
-    schedule.every(30).minutes.do(job_approval_check)
+    # SLA breach + approval expiry: deadline heap fed by vault events, fires on time
+    deadline_monitor = DeadlineMonitor(VAULT_PATH)
+    deadline_monitor.start()
 
     # Social limits check — every 60 minutes (Gold Tier)
     schedule.every(60).minutes.do(job_social_limits_check)
 
     # Run monitors immediately on startup
-    job_sla_monitor()
-    job_approval_check()
     job_social_limits_check()  # Gold Tier startup check
 
     logger.info("Scheduler running. Press Ctrl+C to stop.")
@@ -657,6 +559,7 @@ def main():
             schedule.run_pending()
             time.sleep(60)
         except KeyboardInterrupt:
+            deadline_monitor.stop()
             logger.info("Scheduler stopped.")
             break
         except Exception as e:
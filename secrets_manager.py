@@ -7,6 +7,9 @@ Resolves secrets using a priority chain — stops at first match:
   3. 1Password CLI via `op read` (if `op` binary is in PATH and signed in)
   4. Raises CredentialNotFoundError
 
+Keychain and 1Password results are cached in-process (SECRET_CACHE_TTL, and
+SECRET_NEGATIVE_TTL for misses), so repeated lookups never re-spawn `op`.
+
 This means you never need to change calling code when you upgrade your
 secrets store — just stop exporting the env var and the next tier picks up.
 
@@ -15,6 +18,7 @@ Usage:
 
     token = get_secret("GMAIL_CLIENT_SECRET")
     token = get_secret("BANK_API_TOKEN", required=False)  # returns None if missing
+    prefetch()                                             # warm the cache in the background
 
 Setup:
     macOS Keychain:
@@ -33,9 +37,15 @@ Setup:
 """
 
 import os
+import re
 import sys
+import json
+import hashlib
 import subprocess
 import logging
+import threading
+import time
+from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger("secrets_manager")
@@ -45,6 +55,24 @@ OP_VAULT = os.getenv("OP_VAULT_NAME", "AI Employee")
 # Service name used for macOS Keychain entries
 KEYCHAIN_SERVICE = "ai-employee"
 
+# Resolution cache — keychain / 1Password results are kept for SECRET_CACHE_TTL
+# seconds and "not found" for SECRET_NEGATIVE_TTL, so hot paths never fork `op`
+SECRET_CACHE_TTL    = int(os.getenv("SECRET_CACHE_TTL", "300"))
+SECRET_NEGATIVE_TTL = int(os.getenv("SECRET_NEGATIVE_TTL", "60"))
+
+# Every credential the AI Employee knows about (list / prefetch)
+KNOWN_SECRETS = [
+    "GMAIL_CLIENT_ID", "GMAIL_CLIENT_SECRET",
+    "SMTP_USER", "SMTP_PASSWORD",
+    "BANK_API_TOKEN",
+    "WHATSAPP_VERIFY_TOKEN", "WHATSAPP_ACCESS_TOKEN", "WHATSAPP_PHONE_NUMBER_ID",
+    "SLACK_BOT_TOKEN",
+    "ODOO_PASSWORD",
+    "ANTHROPIC_API_KEY",
+    "OPENROUTER_API_KEY",
+    "DASHBOARD_PASSWORD", "SESSION_SECRET",
+]
+
 
 class CredentialNotFoundError(Exception):
     """Raised when a required secret cannot be resolved from any source."""
@@ -95,23 +123,90 @@ def _from_1password(name: str) -> Optional[str]:
     return None
 
 
-def get_secret(name: str, required: bool = True) -> Optional[str]:
+# name → (value or None, source, monotonic expiry)
+_cache: dict[str, tuple[Optional[str], str, float]] = {}
+_cache_lock = threading.Lock()
+_resolve_locks: dict[str, threading.Lock] = {}
+
+
+def _resolve(name: str, refresh: bool = False) -> tuple[Optional[str], str]:
+    """
+    Return (value, source) where source is env / keychain / 1password / MISSING.
+    Environment variables are always read live; the slower tiers go through the cache.
+    """
+    value = _from_env(name)
+    if value is not None:
+        return value, "env"
+
+    now = time.monotonic()
+    cached = _cache.get(name)
+    if cached and not refresh and cached[2] > now:
+        return cached[0], cached[1]
+
+    with _cache_lock:
+        lock = _resolve_locks.setdefault(name, threading.Lock())
+    with lock:
+        # Another thread may have resolved it while we waited
+        cached = _cache.get(name)
+        if cached and not refresh and cached[2] > time.monotonic():
+            return cached[0], cached[1]
+        for source, resolver in (("keychain", _from_keychain), ("1password", _from_1password)):
+            value = resolver(name)
+            if value is not None:
+                _cache[name] = (value, source, time.monotonic() + SECRET_CACHE_TTL)
+                return value, source
+        _cache[name] = (None, "MISSING", time.monotonic() + SECRET_NEGATIVE_TTL)
+        return None, "MISSING"
+
+
+def invalidate(name: Optional[str] = None) -> None:
+    """Drop one cached secret (or all of them) so the next lookup re-resolves."""
+    with _cache_lock:
+        if name is None:
+            _cache.clear()
+        else:
+            _cache.pop(name, None)
+
+
+def prefetch(names: Optional[list[str]] = None, background: bool = True) -> Optional[threading.Thread]:
+    """
+    Resolve `names` (default: KNOWN_SECRETS) into the cache up front, so the
+    first lookup on a hot path is already a dict hit. With background=True the
+    work runs in a daemon thread, which is returned.
+    """
+    def _run():
+        for name in names or KNOWN_SECRETS:
+            _resolve(name)
+        logger.debug(f"Prefetched {len(names or KNOWN_SECRETS)} secret(s)")
+
+    if not background:
+        _run()
+        return None
+    thread = threading.Thread(target=_run, name="secrets-prefetch", daemon=True)
+    thread.start()
+    return thread
+
+
+def get_secret(name: str, required: bool = True, refresh: bool = False) -> Optional[str]:
     """
     Resolve a secret by name using the priority chain:
       env var → macOS Keychain → 1Password CLI
 
+    Keychain / 1Password results (including "not found") are cached in-process;
+    pass refresh=True to bypass the cache, e.g. after rotating a credential.
+
     Args:
         name:     The credential name (e.g. "GMAIL_CLIENT_SECRET")
         required: If True, raises CredentialNotFoundError when not found.
                   If False, returns None silently.
+        refresh:  If True, ignore any cached result and re-resolve.
 
     Returns:
         The secret value as a string, or None if not found and required=False.
     """
-    for resolver in (_from_env, _from_keychain, _from_1password):
-        value = resolver(name)
-        if value is not None:
-            return value
+    value, _ = _resolve(name, refresh=refresh)
+    if value is not None:
+        return value
 
     if required:
         raise CredentialNotFoundError(
@@ -134,6 +229,7 @@ def set_secret(name: str, value: str) -> bool:
     try:
         import keyring  # type: ignore
         keyring.set_password(KEYCHAIN_SERVICE, name, value)
+        invalidate(name)
         print(f"✅ Stored '{name}' in macOS Keychain (service='{KEYCHAIN_SERVICE}')")
         return True
     except ImportError:
@@ -150,87 +246,148 @@ def list_configured() -> dict:
     Check which credentials are configured (without revealing values).
     Returns dict of {name: source} for all known AI Employee secrets.
     """
-    known_secrets = [
-        "GMAIL_CLIENT_ID", "GMAIL_CLIENT_SECRET",
-        "SMTP_USER", "SMTP_PASSWORD",
-        "BANK_API_TOKEN",
-        "WHATSAPP_VERIFY_TOKEN", "WHATSAPP_ACCESS_TOKEN", "WHATSAPP_PHONE_NUMBER_ID",
-        "SLACK_BOT_TOKEN",
-        "ODOO_PASSWORD",
-        "ANTHROPIC_API_KEY",
-        "OPENROUTER_API_KEY",
-        "DASHBOARD_PASSWORD", "SESSION_SECRET",
-    ]
-
-    report = {}
-    for name in known_secrets:
-        if os.environ.get(name):
-            report[name] = "env"
-        elif _from_keychain(name):
-            report[name] = "keychain"
-        elif _from_1password(name):
-            report[name] = "1password"
-        else:
-            report[name] = "MISSING"
-    return report
+    return {name: _resolve(name)[1] for name in KNOWN_SECRETS}
+
+
+# ── Vault leak scanner ─────────────────────────────────────────────────────────
+
+CREDENTIAL_PATTERNS = [
+    (r"sk-[a-zA-Z0-9]{20,}", "OpenAI-style sk- key"),
+    (r"ghp_[a-zA-Z0-9]{36}", "GitHub Personal Access Token"),
+    (r"xoxb-[0-9A-Za-z\-]+", "Slack Bot Token"),
+    (r"ya29\.[a-zA-Z0-9_\-]+", "Google OAuth Access Token"),
+    (r"AIza[0-9A-Za-z\-_]{35}", "Google API Key"),
+    (r"AKIA[0-9A-Z]{16}", "AWS Access Key ID"),
+    (r"[0-9a-f]{40,}", "Long hex token (possible secret)"),
+    (r"password\s*:\s*(?!your_|<|placeholder|\*{4})[^\s\*<>]{6,}", "Plaintext password in YAML"),
+    (r"api_key\s*=\s*['\"](?!your|<|placeholder)[^'\"]{8,}", "Hardcoded API key"),
+]
+
+# All patterns in one alternation; group p<i> tells which pattern hit. The
+# leading lookahead (first characters of every pattern above — keep in sync)
+# skips positions where no alternative can start, which is most of the text.
+_LEAK_RE = re.compile(
+    r"(?=[0-9a-fgpsxy])(?:"
+    + "|".join(f"(?P<p{i}>{pattern})" for i, (pattern, _) in enumerate(CREDENTIAL_PATTERNS))
+    + ")",
+    re.IGNORECASE,
+)
+
+# Per-file results cache — lives in the vault but never syncs (see vault .gitignore)
+LEAK_SCAN_CACHE = ".leak_scan_cache.json"
+# Below this many changed files a process pool costs more than it saves
+_PARALLEL_MIN_FILES = 64
+
+
+def _scan_text(rel: str, text: str) -> list[dict]:
+    """One combined search per file; per-line work only for files that hit."""
+    if not _LEAK_RE.search(text):
+        return []
+    findings = []
+    for lineno, line in enumerate(text.splitlines(), 1):
+        # Several patterns may match one line — report the first in list order
+        hits = [int(m.lastgroup[1:]) for m in _LEAK_RE.finditer(line)]
+        if hits:
+            findings.append({
+                "file": rel,
+                "line": lineno,
+                "pattern": CREDENTIAL_PATTERNS[min(hits)][1],
+                "snippet": line.strip()[:80],
+            })
+    return findings
 
 
-def scan_vault_for_leaks(vault_path: str = "./AI_Employee_Vault") -> list[dict]:
+def _scan_file(job: tuple[str, str, str]) -> tuple[str, str, list[dict] | None]:
+    """
+    Worker: (path, rel, cached_hash) → (rel, content hash, findings).
+    findings is None when the content hash matches the cache (touched, not changed).
+    """
+    path, rel, cached_hash = job
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return rel, "", []
+    digest = hashlib.sha1(data).hexdigest()
+    if digest == cached_hash:
+        return rel, digest, None
+    return rel, digest, _scan_text(rel, data.decode("utf-8", errors="ignore"))
+
+
+def scan_vault_for_leaks(vault_path: str = "./AI_Employee_Vault",
+                         workers: Optional[int] = None,
+                         use_cache: bool = True) -> list[dict]:
     """
     Scan vault markdown files for patterns that look like real credentials.
     Returns list of findings (file, line_number, pattern_matched).
 
+    Only files whose (mtime, size) changed since the last scan are read, and a
+    file whose content hash is unchanged reuses its cached findings. Changed
+    files are scanned across a process pool when there are enough of them.
+
     Patterns detected:
       - API key formats: sk-, ghp_, xoxb-, ya29., AIza, AKIA
       - Hex tokens > 32 chars
       - Passwords in YAML frontmatter: password: <value>
     """
-    import re
-    from pathlib import Path
-
-    CREDENTIAL_PATTERNS = [
-        (r"sk-[a-zA-Z0-9]{20,}", "OpenAI-style sk- key"),
-        (r"ghp_[a-zA-Z0-9]{36}", "GitHub Personal Access Token"),
-        (r"xoxb-[0-9A-Za-z\-]+", "Slack Bot Token"),
-        (r"ya29\.[a-zA-Z0-9_\-]+", "Google OAuth Access Token"),
-        (r"AIza[0-9A-Za-z\-_]{35}", "Google API Key"),
-        (r"AKIA[0-9A-Z]{16}", "AWS Access Key ID"),
-        (r"[0-9a-f]{40,}", "Long hex token (possible secret)"),
-        (r"password\s*:\s*(?!your_|<|placeholder|\*{4})[^\s\*<>]{6,}", "Plaintext password in YAML"),
-        (r"api_key\s*=\s*['\"](?!your|<|placeholder)[^'\"]{8,}", "Hardcoded API key"),
-    ]
-
-    findings = []
     vault = Path(vault_path)
-    for md_file in vault.rglob("*.md"):
+    cache_file = vault / LEAK_SCAN_CACHE
+    cache: dict = {}
+    if use_cache and cache_file.exists():
         try:
-            lines = md_file.read_text(encoding="utf-8", errors="ignore").splitlines()
-            for lineno, line in enumerate(lines, 1):
-                for pattern, label in CREDENTIAL_PATTERNS:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        findings.append({
-                            "file": str(md_file.relative_to(vault)),
-                            "line": lineno,
-                            "pattern": label,
-                            "snippet": line.strip()[:80],
-                        })
-                        break  # one finding per line
+            cache = json.loads(cache_file.read_text(encoding="utf-8"))
         except Exception:
+            cache = {}
+
+    entries: dict = {}
+    jobs: list[tuple[str, str, str]] = []
+    for md_file in vault.rglob("*.md"):
+        rel = str(md_file.relative_to(vault))
+        try:
+            st = md_file.stat()
+        except OSError:
             continue
-    return findings
+        entry = cache.get(rel)
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            entries[rel] = entry
+            continue
+        entries[rel] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size,
+                        "hash": entry["hash"] if entry else "",
+                        "findings": entry["findings"] if entry else []}
+        jobs.append((str(md_file), rel, entries[rel]["hash"]))
+
+    if len(jobs) >= _PARALLEL_MIN_FILES and workers != 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_scan_file, jobs, chunksize=32))
+    else:
+        results = [_scan_file(job) for job in jobs]
+
+    for rel, digest, findings in results:
+        entries[rel]["hash"] = digest
+        if findings is not None:
+            entries[rel]["findings"] = findings
+
+    if use_cache and (jobs or len(entries) != len(cache)):
+        try:
+            tmp = cache_file.with_suffix(".tmp")
+            tmp.write_text(json.dumps(entries), encoding="utf-8")
+            tmp.replace(cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write leak scan cache: {e}")
+
+    return [f for rel in sorted(entries) for f in entries[rel]["findings"]]
 
 
 # ── CLI ────────────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
-    import json
-
     if len(sys.argv) < 2:
         print("Usage:")
         print("  python secrets_manager.py get <NAME>          # resolve a secret")
         print("  python secrets_manager.py set <NAME> <VALUE>  # store in Keychain")
         print("  python secrets_manager.py list                # check all credentials")
         print("  python secrets_manager.py scan [vault_path]   # scan vault for leaks")
+        print("  python secrets_manager.py scan [vault_path] --full  # ignore the scan cache")
         sys.exit(0)
 
     cmd = sys.argv[1].lower()
@@ -259,8 +416,9 @@ if __name__ == "__main__":
                 print(f"   {k}")
 
     elif cmd == "scan":
-        vault = sys.argv[2] if len(sys.argv) > 2 else "./AI_Employee_Vault"
-        findings = scan_vault_for_leaks(vault)
+        args = [a for a in sys.argv[2:] if a != "--full"]
+        vault = args[0] if args else "./AI_Employee_Vault"
+        findings = scan_vault_for_leaks(vault, use_cache="--full" not in sys.argv)
         if findings:
             print(f"⚠️  {len(findings)} potential credential leak(s) found:")
             for f in findings:
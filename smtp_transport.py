@@ -0,0 +1,206 @@
+"""
+smtp_transport.py — Pooled SMTP transport (aiosmtplib) for the AI Employee.
+
+The default transport builds a Gmail API service and makes one HTTPS call per
+email. For bursts (invoice batches, campaigns, queue recovery) this module keeps
+a small pool of authenticated, keep-alive SMTP connections instead: TLS and
+AUTH are paid once per connection, then many messages go over it back to back.
+
+  - SMTP_POOL_SIZE connections at most; callers wait for a free one.
+  - A connection idle longer than SMTP_IDLE_TIMEOUT (servers drop idle
+    sessions) or that has carried SMTP_MAX_PER_CONNECTION messages is
+    replaced before use.
+  - A send that hits a dropped connection reconnects and retries once.
+
+Selected per deployment with EMAIL_TRANSPORT=smtp (default: gmail_api), using
+SMTP_HOST / SMTP_PORT / SMTP_USER / SMTP_PASSWORD. Port 465 uses implicit TLS;
+any other port upgrades with STARTTLS when the server offers it.
+
+Usage:
+    from smtp_transport import get_pool, send_message_sync, smtp_enabled
+
+    await get_pool().send(msg)          # async callers (Email MCP)
+    send_message_sync(msg)              # sync callers (orchestrator threads)
+
+Testing against a local stand-in:
+    python -m aiosmtpd -n -l localhost:8025
+    SMTP_HOST=localhost SMTP_PORT=8025 SMTP_USER= EMAIL_TRANSPORT=smtp ...
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from email.message import Message
+from typing import Optional
+
+logger = logging.getLogger("SMTPTransport")
+
+EMAIL_TRANSPORT          = os.getenv("EMAIL_TRANSPORT", "gmail_api").lower()
+SMTP_POOL_SIZE           = int(os.getenv("SMTP_POOL_SIZE", "3"))
+SMTP_IDLE_TIMEOUT        = int(os.getenv("SMTP_IDLE_TIMEOUT", "60"))          # seconds
+SMTP_MAX_PER_CONNECTION  = int(os.getenv("SMTP_MAX_PER_CONNECTION", "100"))
+SMTP_TIMEOUT             = int(os.getenv("SMTP_TIMEOUT", "30"))               # seconds
+
+
+def smtp_enabled() -> bool:
+    """True when this deployment sends email over SMTP instead of the Gmail API."""
+    return EMAIL_TRANSPORT == "smtp"
+
+
+@dataclass
+class _Conn:
+    """One pooled SMTP session."""
+    client: object = None
+    last_used: float = field(default_factory=time.monotonic)
+    sent: int = 0
+
+
+class SMTPPool:
+    """Bounded pool of authenticated keep-alive aiosmtplib connections (one event loop)."""
+
+    def __init__(self, host: str, port: int, username: str = "", password: str = "",
+                 size: int = SMTP_POOL_SIZE, idle_timeout: int = SMTP_IDLE_TIMEOUT,
+                 max_per_connection: int = SMTP_MAX_PER_CONNECTION):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.size = max(1, size)
+        self.idle_timeout = idle_timeout
+        self.max_per_connection = max_per_connection
+        self._idle: Optional[asyncio.LifoQueue] = None   # most recently used first
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.stats = {"sent": 0, "connects": 0, "reconnects": 0}
+
+    @classmethod
+    def from_env(cls) -> "SMTPPool":
+        return cls(
+            host=os.getenv("SMTP_HOST", "smtp.gmail.com"),
+            port=int(os.getenv("SMTP_PORT", "587")),
+            username=os.getenv("SMTP_USER", ""),
+            password=os.getenv("SMTP_PASSWORD", ""),
+        )
+
+    # ── Connection lifecycle ──────────────────────────────────────────────────
+
+    def _ensure_primitives(self) -> None:
+        # Created lazily so they bind to the loop that actually uses the pool
+        if self._idle is None:
+            self._idle = asyncio.LifoQueue()
+            self._slots = asyncio.Semaphore(self.size)
+
+    async def _connect(self) -> _Conn:
+        import aiosmtplib
+
+        client = aiosmtplib.SMTP(
+            hostname=self.host, port=self.port, timeout=SMTP_TIMEOUT,
+            use_tls=self.port == 465,
+        )
+        await client.connect()
+        if self.username:
+            await client.login(self.username, self.password)
+        self.stats["connects"] += 1
+        logger.debug(f"SMTP connection opened to {self.host}:{self.port}")
+        return _Conn(client=client)
+
+    @staticmethod
+    async def _close(conn: _Conn) -> None:
+        try:
+            await conn.client.quit()
+        except Exception:
+            conn.client.close()
+
+    def _stale(self, conn: _Conn) -> bool:
+        return (not conn.client.is_connected
+                or time.monotonic() - conn.last_used > self.idle_timeout
+                or conn.sent >= self.max_per_connection)
+
+    async def _acquire(self) -> _Conn:
+        self._ensure_primitives()
+        await self._slots.acquire()
+        try:
+            while not self._idle.empty():
+                conn = self._idle.get_nowait()
+                if not self._stale(conn):
+                    return conn
+                await self._close(conn)
+            return await self._connect()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release(self, conn: Optional[_Conn]) -> None:
+        if conn is not None:
+            conn.last_used = time.monotonic()
+            self._idle.put_nowait(conn)
+        self._slots.release()
+
+    # ── Public API ─────────────────────────────────────────────────────────────
+
+    async def send(self, message: Message) -> None:
+        """Send one message on a pooled connection; reconnects once if the session was dropped."""
+        import aiosmtplib
+
+        conn = await self._acquire()
+        try:
+            try:
+                await conn.client.send_message(message)
+            except (aiosmtplib.SMTPServerDisconnected, ConnectionError):
+                self.stats["reconnects"] += 1
+                conn.client.close()
+                conn = await self._connect()
+                await conn.client.send_message(message)
+            conn.sent += 1
+            self.stats["sent"] += 1
+        except BaseException:
+            if conn is not None:
+                conn.client.close()
+            self._release(None)
+            raise
+        self._release(conn)
+
+    async def send_many(self, messages: list[Message]) -> list[Optional[Exception]]:
+        """Send concurrently across the pool. Returns one exception (or None) per message."""
+        results = await asyncio.gather(*(self.send(m) for m in messages), return_exceptions=True)
+        return [r if isinstance(r, Exception) else None for r in results]
+
+    async def close(self) -> None:
+        if self._idle is None:
+            return
+        while not self._idle.empty():
+            await self._close(self._idle.get_nowait())
+
+
+# ── Module-level pools ────────────────────────────────────────────────────────
+
+_async_pool: Optional[SMTPPool] = None
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_pool: Optional[SMTPPool] = None
+_sync_lock = threading.Lock()
+
+
+def get_pool() -> SMTPPool:
+    """Pool for async callers; must be used from a single event loop."""
+    global _async_pool
+    if _async_pool is None:
+        _async_pool = SMTPPool.from_env()
+    return _async_pool
+
+
+def send_message_sync(message: Message, timeout: float = SMTP_TIMEOUT * 2) -> None:
+    """
+    Thread-safe blocking send for sync code. The pool lives on a private event
+    loop thread, so connections stay open between calls.
+    """
+    global _sync_loop, _sync_pool
+    with _sync_lock:
+        if _sync_loop is None:
+            _sync_loop = asyncio.new_event_loop()
+            threading.Thread(target=_sync_loop.run_forever, name="smtp-pool", daemon=True).start()
+            _sync_pool = SMTPPool.from_env()
+    asyncio.run_coroutine_threadsafe(_sync_pool.send(message), _sync_loop).result(timeout)
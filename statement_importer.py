@@ -0,0 +1,462 @@
+"""
+statement_importer.py — Bulk bank-statement import into the ledger.
+
+Streams a CSV or OFX statement, normalizes each transaction, drops rows that
+are already in the ledger, and commits everything else in ONE ledger write
+(one `banking_write` rate-limit slot, one Bank_Transactions.md write) instead
+of one banking_add_transaction call per row.
+
+Pipeline:
+  1. Stream   — csv.DictReader / line-wise OFX <STMTTRN> parser, no full-file load
+  2. Normalize → {date (YYYY-MM-DD), description, amount, type, category, status}
+  3. Dedupe   — multiset index of sha1(date | cents | normalized description)
+                built once from the ledger; identical rows already present are skipped
+  4. Route    — income and expenses that pass permission_guard.check_payment() are
+                committed; the rest go into ONE batched approval file:
+                  Pending_Approval/APPROVAL_statement_import_{ts}.md
+                  Accounting/Imports/IMPORT_{ts}_pending.csv   (the held rows)
+                Moving the approval file to /Approved/ makes the orchestrator call
+                import_approved_rows() for the held rows.
+
+Usage:
+    uv run import-statement statement.csv
+    uv run import-statement export.ofx --dry-run
+    uv run import-statement statement.csv --date-format %d/%m/%Y
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import logging
+import re
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from audit_logger import write_log_entry, ApprovalStatus, ApprovedBy
+from audit_logic import _match_subscription
+from ledger_store import get_ledger, format_amount
+from permission_guard import check_payment, add_known_payee
+from rate_limiter import get_limiter, RateLimitExceededError
+
+logger = logging.getLogger("statement_importer")
+
+IMPORTS_DIR = "Accounting/Imports"
+
+# Date formats considered when --date-format is not given. One format is picked
+# per file (see detect_date_format), never per row.
+DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d", "%d-%m-%Y", "%d %b %Y", "%b %d, %Y")
+
+# CSV header aliases (lowercased) → normalized field
+_CSV_COLUMNS = {
+    "date":        ("date", "transaction date", "posted date", "posting date", "value date", "booking date"),
+    "description": ("description", "payee", "name", "merchant", "details", "memo", "narrative"),
+    "amount":      ("amount", "transaction amount", "value"),
+    "debit":       ("debit", "withdrawal", "money out", "paid out"),
+    "credit":      ("credit", "deposit", "money in", "paid in"),
+    "category":    ("category",),
+}
+
+_LEDGER_FIELDS = ("date", "description", "amount", "type", "category", "status")
+_RECURRING_CATEGORIES = ("subscription", "recurring", "infrastructure")
+
+
+# ── Parsing ────────────────────────────────────────────────────────────────────
+
+def _is_compact_date(value: str) -> bool:
+    return len(value) >= 8 and value[:8].isdigit()  # OFX: 20260305120000[-5:EST]
+
+
+def _parse_date(value: str, date_format: Optional[str] = None) -> Optional[str]:
+    value = value.strip()
+    if _is_compact_date(value):
+        try:
+            return datetime.strptime(value[:8], "%Y%m%d").strftime("%Y-%m-%d")
+        except ValueError:
+            return None
+    if not date_format:
+        return None
+    try:
+        return datetime.strptime(value, date_format).strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def detect_date_format(values: Iterable[str], source: str = "statement") -> Optional[str]:
+    """
+    Pick the one DATE_FORMATS entry that reads a file's dates. The format that parses
+    the most values wins; a tie (e.g. every date is valid as both MM/DD and DD/MM)
+    raises ValueError, because guessing would silently swap day and month.
+    Returns None when there are no dates to judge (or all are compact YYYYMMDD).
+    """
+    hits = Counter()
+    total = 0
+    for value in values:
+        value = value.strip()
+        if not value or _is_compact_date(value):
+            continue
+        total += 1
+        for fmt in DATE_FORMATS:
+            try:
+                datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+            hits[fmt] += 1
+    if not hits:
+        if total:
+            raise ValueError(f"Unrecognized date format in {source}; pass --date-format")
+        return None
+    best = max(hits.values())
+    winners = [fmt for fmt in DATE_FORMATS if hits[fmt] == best]
+    if len(winners) > 1:
+        raise ValueError(
+            f"Ambiguous dates in {source} (could be {' or '.join(winners)}); pass --date-format"
+        )
+    if best < total:
+        logger.warning(f"{source}: {total - best} date(s) do not match {winners[0]} and will be skipped")
+    return winners[0]
+
+
+def _parse_amount(value: str) -> Optional[float]:
+    value = (value or "").strip().replace("$", "").replace(",", "").replace(" ", "")
+    if not value or value in ("-", "—"):
+        return None
+    negative = value.startswith("(") and value.endswith(")")
+    try:
+        amount = float(value.strip("()"))
+    except ValueError:
+        return None
+    return -abs(amount) if negative else amount
+
+
+def _normalize(date: str, description: str, amount: float, category: str = "") -> dict:
+    description = " ".join(description.replace("|", "/").split())
+    if not category:
+        category = "subscription" if _match_subscription(description.lower()) else "uncategorized"
+    return {
+        "date": date,
+        "description": description,
+        "amount": round(amount, 2),
+        "type": "income" if amount > 0 else "expense",
+        "category": category,
+        "status": "cleared",
+    }
+
+
+def iter_csv(path: Path, date_format: Optional[str] = None) -> Iterator[dict]:
+    """
+    Stream normalized rows from a bank CSV export (header aliases auto-detected).
+    Without `date_format`, the date column is read once up front to detect it.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        headers = {h.strip().lower(): h for h in reader.fieldnames or []}
+        cols = {
+            field: next((headers[a] for a in aliases if a in headers), None)
+            for field, aliases in _CSV_COLUMNS.items()
+        }
+        if not cols["date"] or not cols["description"] or not (cols["amount"] or cols["debit"] or cols["credit"]):
+            raise ValueError(f"Unrecognized CSV header in {path.name}: {reader.fieldnames}")
+
+        if not date_format:
+            date_format = detect_date_format(
+                (record.get(cols["date"]) or "" for record in reader), path.name
+            )
+            f.seek(0)
+            next(reader.reader)  # past the header again
+
+        for line_no, record in enumerate(reader, 2):
+            date = _parse_date(record.get(cols["date"], ""), date_format)
+            if cols["amount"]:
+                amount = _parse_amount(record.get(cols["amount"], ""))
+            else:
+                credit = _parse_amount(record.get(cols["credit"], "")) if cols["credit"] else None
+                debit = _parse_amount(record.get(cols["debit"], "")) if cols["debit"] else None
+                amount = (credit or 0.0) - abs(debit or 0.0) if (credit or debit) else None
+            description = record.get(cols["description"], "") or ""
+            if not date or amount is None or not description.strip():
+                logger.debug(f"{path.name}:{line_no} skipped (unparseable row)")
+                continue
+            category = record.get(cols["category"], "") if cols["category"] else ""
+            yield _normalize(date, description, amount, category.strip().lower())
+
+
+_OFX_TAG = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<\r\n]*)")
+
+
+def iter_ofx(path: Path) -> Iterator[dict]:
+    """Stream normalized rows from an OFX/QFX file (SGML v1 or XML v2)."""
+    current: Optional[dict] = None
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            for closing, tag, value in _OFX_TAG.findall(line):
+                tag = tag.upper()
+                if tag == "STMTTRN":
+                    if not closing:
+                        current = {}
+                        continue
+                    if current is not None:
+                        date = _parse_date(current.get("DTPOSTED", ""))
+                        amount = _parse_amount(current.get("TRNAMT", ""))
+                        description = current.get("NAME") or current.get("MEMO") or current.get("PAYEE", "")
+                        if date and amount is not None and description:
+                            yield _normalize(date, description, amount)
+                    current = None
+                elif current is not None and not closing and value.strip():
+                    current[tag] = value.strip()
+
+
+def iter_statement(path: Path, fmt: str = "auto", date_format: Optional[str] = None) -> Iterator[dict]:
+    """Dispatch to the CSV or OFX reader based on `fmt` or the file extension."""
+    if fmt == "auto":
+        fmt = "ofx" if path.suffix.lower() in (".ofx", ".qfx") else "csv"
+    return iter_ofx(path) if fmt == "ofx" else iter_csv(path, date_format)
+
+
+# ── Dedupe index ───────────────────────────────────────────────────────────────
+
+def dedupe_key(date: str, amount: float, description: str) -> str:
+    """Stable hash of (date, amount in cents, normalized description)."""
+    normalized = " ".join(re.sub(r"[^a-z0-9]+", " ", description.lower()).split())
+    raw = f"{date}|{round(amount * 100)}|{normalized}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _held_rows_files(vault_path: Path, exclude: Optional[Path] = None) -> Iterator[Path]:
+    """IMPORT_<ts>_pending.csv files whose APPROVAL_statement_import_<ts>.md is still unresolved."""
+    for rows_file in (vault_path / IMPORTS_DIR).glob("IMPORT_*_pending.csv"):
+        if exclude is not None and rows_file.resolve() == exclude.resolve():
+            continue
+        ts = rows_file.name[len("IMPORT_"):-len("_pending.csv")]
+        approval = f"APPROVAL_statement_import_{ts}.md"
+        if any((vault_path / folder / approval).exists() for folder in ("Pending_Approval", "Approved")):
+            yield rows_file
+
+
+def build_dedupe_index(vault_path: Path, exclude: Optional[Path] = None) -> Counter:
+    """
+    Multiset of dedupe keys for every dated ledger row, plus every row held by a
+    still-unresolved import approval (other than `exclude`), so re-importing a
+    statement never files the same payments for approval twice. Built once per import.
+    """
+    dates, amounts, _, descriptions = get_ledger(vault_path).columns()
+    index = Counter(dedupe_key(d, a, desc) for d, a, desc in zip(dates, amounts, descriptions))
+    for rows_file in _held_rows_files(vault_path, exclude):
+        with open(rows_file, newline="", encoding="utf-8") as f:
+            for record in csv.DictReader(f):
+                try:
+                    index[dedupe_key(record["date"], float(record["amount"]), record["description"])] += 1
+                except (KeyError, TypeError, ValueError):
+                    continue
+    return index
+
+
+# ── Import ─────────────────────────────────────────────────────────────────────
+
+def _needs_approval(row: dict, vault_path: Path) -> Optional[str]:
+    """Return the permission reason if this row must be held for approval."""
+    if row["amount"] >= 0:
+        return None
+    perm = check_payment(
+        amount=row["amount"],
+        payee=row["description"],
+        vault_path=vault_path,
+        recurring=row["category"] in _RECURRING_CATEGORIES,
+    )
+    return perm.reason if perm.requires_approval else None
+
+
+def _write_approval_batch(vault_path: Path, source: Path, held: list[tuple[dict, str]]) -> Path:
+    """Write the held rows to one CSV plus one Pending_Approval summary file."""
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    imports_dir = vault_path / IMPORTS_DIR
+    imports_dir.mkdir(parents=True, exist_ok=True)
+    rows_file = imports_dir / f"IMPORT_{ts}_pending.csv"
+    n = 1
+    while rows_file.exists():  # two imports within the same second
+        n += 1
+        ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ") + f"_{n}"
+        rows_file = imports_dir / f"IMPORT_{ts}_pending.csv"
+    with open(rows_file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=_LEDGER_FIELDS)
+        writer.writeheader()
+        for row, _ in held:
+            writer.writerow(row)
+
+    total = sum(r["amount"] for r, _ in held)
+    preview = "\n".join(
+        f"| {r['date']} | {r['description']} | {format_amount(r['amount'])} | {r['category']} | {reason} |"
+        for r, reason in held[:50]
+    )
+    more = f"\n\n_…and {len(held) - 50} more rows in `{IMPORTS_DIR}/{rows_file.name}`._" if len(held) > 50 else ""
+
+    pending_dir = vault_path / "Pending_Approval"
+    pending_dir.mkdir(parents=True, exist_ok=True)
+    approval_file = pending_dir / f"APPROVAL_statement_import_{ts}.md"
+    approval_file.write_text(
+        f"""---
+type: statement_import_approval
+action: import_statement_rows
+source: {source.name}
+rows_file: {IMPORTS_DIR}/{rows_file.name}
+row_count: {len(held)}
+total: {round(total, 2)}
+created: {datetime.now(timezone.utc).isoformat()}
+status: pending
+---
+
+## Statement Import — {len(held)} Payment(s) Need Approval
+
+**Source statement:** `{source.name}`
+**Rows held:** {len(held)}
+**Total:** {format_amount(total)}
+
+| Date | Description | Amount | Category | Reason |
+|------|-------------|--------|----------|--------|
+{preview}{more}
+
+## To Approve
+Move this file to `/Approved/` — the orchestrator will add all held rows to Bank_Transactions.md in one write.
+
+## To Reject
+Move this file to `/Rejected/`.
+
+---
+*Auto-generated by statement_importer §6.4 permission boundary*
+""",
+        encoding="utf-8",
+    )
+    return approval_file
+
+
+def _commit(vault_path: Path, rows: list[dict]) -> None:
+    """One rate-limit slot + one ledger transaction + one view write for all rows."""
+    if not rows:
+        return
+    # §7.3 — banking writes are never retried automatically
+    get_limiter(vault_path).check("banking_write")
+    get_ledger(vault_path).append_many(rows)
+
+
+def import_statement(
+    vault_path: Path,
+    path: Path,
+    fmt: str = "auto",
+    date_format: Optional[str] = None,
+    dry_run: bool = False,
+) -> dict:
+    """
+    Stream `path` into the ledger. Returns counts and the approval file (if any).
+    Raises RateLimitExceededError if the banking_write budget is exhausted.
+    """
+    vault_path = Path(vault_path).resolve()
+    index = build_dedupe_index(vault_path)
+    to_commit: list[dict] = []
+    held: list[tuple[dict, str]] = []
+    seen = duplicates = 0
+
+    for row in iter_statement(Path(path), fmt, date_format):
+        seen += 1
+        key = dedupe_key(row["date"], row["amount"], row["description"])
+        if index[key] > 0:
+            index[key] -= 1
+            duplicates += 1
+            continue
+        reason = _needs_approval(row, vault_path)
+        if reason:
+            held.append((row, reason))
+        else:
+            to_commit.append(row)
+
+    approval_file: Optional[Path] = None
+    if not dry_run:
+        _commit(vault_path, to_commit)
+        if held:
+            approval_file = _write_approval_batch(vault_path, Path(path), held)
+
+    result = {
+        "source": Path(path).name,
+        "rows_read": seen,
+        "duplicates_skipped": duplicates,
+        "imported": len(to_commit),
+        "held_for_approval": len(held),
+        "approval_file": approval_file.name if approval_file else None,
+        "dry_run": dry_run,
+    }
+    write_log_entry(
+        logs_dir=vault_path / "Logs",
+        action_type="statement_import",
+        actor="statement_importer",
+        target=Path(path).name,
+        result="dry_run" if dry_run else "success",
+        parameters=result,
+        approval_status=ApprovalStatus.DRY_RUN if dry_run else ApprovalStatus.AUTO,
+        approved_by=ApprovedBy.NA if dry_run else ApprovedBy.SYSTEM,
+    )
+    return result
+
+
+def import_approved_rows(vault_path: Path, rows_file: Path) -> dict:
+    """
+    Commit a held batch after human approval (called by the orchestrator).
+    Rows are re-checked against the dedupe index in case they arrived meanwhile.
+    """
+    vault_path = Path(vault_path).resolve()
+    index = build_dedupe_index(vault_path, exclude=rows_file)
+    rows: list[dict] = []
+    duplicates = 0
+    with open(rows_file, newline="", encoding="utf-8") as f:
+        for record in csv.DictReader(f):
+            row = {k: record[k] for k in _LEDGER_FIELDS}
+            row["amount"] = float(row["amount"])
+            key = dedupe_key(row["date"], row["amount"], row["description"])
+            if index[key] > 0:
+                index[key] -= 1
+                duplicates += 1
+                continue
+            rows.append(row)
+
+    _commit(vault_path, rows)
+    # Approved payees are known from now on (mirrors banking_add_transaction)
+    for payee in {r["description"] for r in rows if r["amount"] < 0}:
+        add_known_payee(payee, vault_path)
+    rows_file.rename(rows_file.with_name(rows_file.name.replace("_pending", "_imported")))
+    return {"imported": len(rows), "duplicates_skipped": duplicates}
+
+
+# ── CLI ────────────────────────────────────────────────────────────────────────
+
+def main():
+    import os
+    import json
+    import argparse
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="AI Employee — Bank Statement Importer")
+    parser.add_argument("statement", help="Path to a CSV or OFX/QFX statement")
+    parser.add_argument("--vault", default=os.getenv("VAULT_PATH", "./AI_Employee_Vault"))
+    parser.add_argument("--format", choices=["auto", "csv", "ofx"], default="auto")
+    parser.add_argument("--date-format", default=None, help="strptime format for CSV dates, e.g. %%d/%%m/%%Y")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be imported without writing")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [Importer] %(levelname)s: %(message)s")
+    try:
+        result = import_statement(
+            Path(args.vault), Path(args.statement),
+            fmt=args.format, date_format=args.date_format, dry_run=args.dry_run,
+        )
+    except RateLimitExceededError as e:
+        print(json.dumps({"error": str(e), "rate_limited": True}, indent=2))
+        raise SystemExit(1)
+    except ValueError as e:
+        print(json.dumps({"error": str(e)}, indent=2))
+        raise SystemExit(1)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
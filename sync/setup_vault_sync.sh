@@ -61,6 +61,17 @@ Thumbs.db
 *.swp
 .obsidian/workspace.json
 
+# Structured local stores (the rendered markdown views are what syncs)
+.ledger.db*
+
+# Local scan caches (machine-specific)
+.leak_scan_cache.json
+
+# Vault sync state (change journal) and raw audit logs — each agent's log
+# entries sync as append-only Logs/sync/<agent>/YYYY-MM-DD.jsonl instead
+.sync/
+Logs/*.json
+
 # Playwright browser data (large, local only)
 playwright-browsers/
 EOF
@@ -86,5 +97,6 @@ fi
 
 echo ""
 echo "=== Setup complete ==="
-echo "Local Agent: bash sync/sync_up.sh   (push changes to cloud)"
+echo "Local Agent: uv run vault-sync run  (continuous sync daemon)"
+echo "            bash sync/sync_up.sh    (one-shot push to cloud)"
 echo "Cloud Agent: bash sync/sync_down.sh (pull latest from local)"
@@ -0,0 +1,195 @@
+"""
+task_priority.py — Priority-ordered dispatch of Needs_Action tasks.
+
+Watchers tag every task with `priority:` (GmailWatcher / WhatsAppWatcher
+_detect_priority) and `received:` (the start of the 24h response SLA), but
+the agents used to work through Needs_Action in filename order. This module
+keeps a heap instead, so the next task is always the most important one:
+
+  - class heap     — (priority class, SLA deadline): high before normal before
+                     low, oldest deadline first within a class.
+  - deadline heap  — (SLA deadline): any task within TASK_SLA_ESCALATE_HOURS
+                     of breaching jumps ahead of the class order, earliest
+                     deadline first. Already-breached tasks do not: they are
+                     alerted on (deadline_monitor.py) and keep their class
+                     order, so an old low-priority backlog cannot starve fresh
+                     high-priority mail.
+
+Both heaps use lazy deletion: a removed or re-queued task leaves a stale
+entry behind that pop() skips. refresh() keeps the queue current from a
+directory listing; a task file's frontmatter is read once, when it arrives.
+
+Usage:
+    queue = PriorityTaskQueue()
+    queue.refresh([vault / "Needs_Action" / "email", vault / "Needs_Action"], "EMAIL_*.md")
+    while (task := queue.pop()) is not None:
+        handle(task)
+"""
+
+from __future__ import annotations
+
+import os
+import heapq
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+SLA_HOURS           = float(os.getenv("TASK_SLA_HOURS", "24"))
+SLA_ESCALATE_HOURS  = float(os.getenv("TASK_SLA_ESCALATE_HOURS", "2"))
+
+PRIORITY_CLASSES = {"critical": 0, "urgent": 0, "high": 1, "normal": 2, "medium": 2, "low": 3}
+DEFAULT_CLASS = PRIORITY_CLASSES["normal"]
+
+
+def read_frontmatter(path: Path, limit: int = 4096) -> dict[str, str]:
+    """Top-level `key: value` pairs of a task's frontmatter (reads at most `limit` bytes)."""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            head = f.read(limit)
+    except OSError:
+        return {}
+    lines = head.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}
+    meta = {}
+    for line in lines[1:]:
+        if line.strip() == "---":
+            break
+        key, sep, value = line.partition(":")
+        if sep and key and not key[0].isspace():
+            meta[key.strip()] = value.strip()
+    return meta
+
+
+def parse_timestamp(value: str) -> Optional[float]:
+    """Epoch seconds of an ISO-8601 frontmatter timestamp (naive → UTC); None if unparsable."""
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def task_key(path: Path, sla_hours: float = SLA_HOURS) -> tuple[int, float]:
+    """(priority class, SLA deadline epoch) for a task file; unknown priority → normal, no `received:` → mtime."""
+    meta = read_frontmatter(path)
+    pclass = PRIORITY_CLASSES.get(meta.get("priority", "").lower(), DEFAULT_CLASS)
+    received = parse_timestamp(meta.get("received", ""))
+    if received is None:
+        try:
+            received = path.stat().st_mtime
+        except OSError:
+            received = datetime.now(timezone.utc).timestamp()
+    return pclass, received + sla_hours * 3600
+
+
+class PriorityTaskQueue:
+    """Heap of task files keyed on (priority class, SLA deadline), with near-breach escalation."""
+
+    def __init__(self, sla_hours: float = SLA_HOURS, escalate_hours: float = SLA_ESCALATE_HOURS):
+        self.sla_hours = sla_hours
+        self.escalate_seconds = escalate_hours * 3600
+        self._by_class: list[tuple[int, float, int, str]] = []
+        self._by_deadline: list[tuple[float, int, str]] = []
+        self._live: dict[str, tuple[int, Path, int, float]] = {}   # name → (entry id, path, class, deadline)
+        self._ids = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._live
+
+    def push(self, path: Path, key: Optional[tuple[int, float]] = None):
+        """Queue (or re-queue) a task. The name is the identity: one entry per file name."""
+        pclass, deadline = key or task_key(path, self.sla_hours)
+        with self._lock:
+            self._ids += 1
+            self._live[path.name] = (self._ids, path, pclass, deadline)
+            heapq.heappush(self._by_class, (pclass, deadline, self._ids, path.name))
+            heapq.heappush(self._by_deadline, (deadline, self._ids, path.name))
+            if len(self._by_class) > 2 * len(self._live) + 64:
+                self._compact()
+
+    def _compact(self):
+        # Stale entries are normally dropped as they reach the top; rebuild if they pile up below it
+        self._by_class = [(c, d, i, n) for n, (i, _, c, d) in self._live.items()]
+        self._by_deadline = [(d, i, n) for n, (i, _, _, d) in self._live.items()]
+        heapq.heapify(self._by_class)
+        heapq.heapify(self._by_deadline)
+
+    def priority_of(self, name: str) -> str:
+        """Priority label of a queued task (class name as written by the watchers)."""
+        live = self._live.get(name)
+        pclass = live[2] if live else DEFAULT_CLASS
+        return next(label for label, c in PRIORITY_CLASSES.items() if c == pclass)
+
+    def discard(self, name: str):
+        with self._lock:
+            self._live.pop(name, None)
+
+    def refresh(self, directories: Iterable[Path], pattern: str = "*.md") -> list[Path]:
+        """
+        Sync with the task files currently in `directories` (earlier directories win
+        on a duplicate name). New files are read and queued; vanished ones dropped.
+        Returns the newly queued paths.
+        """
+        present: dict[str, Path] = {}
+        for directory in directories:
+            for f in directory.glob(pattern):
+                present.setdefault(f.name, f)
+        with self._lock:
+            for name in [n for n in self._live if n not in present]:
+                del self._live[name]
+            new = [p for n, p in present.items() if n not in self._live or self._live[n][1] != p]
+        for path in new:
+            self.push(path)
+        return new
+
+    def _top(self, heap: list, name_index: int, id_index: int):
+        # Drop stale entries (removed, or superseded by a re-push) from the top of a heap
+        while heap:
+            entry = heap[0]
+            live = self._live.get(entry[name_index])
+            if live is not None and live[0] == entry[id_index]:
+                return entry
+            heapq.heappop(heap)
+        return None
+
+    def _next_name(self, now: float) -> Optional[str]:
+        urgent = self._top(self._by_deadline, 2, 1)
+        while urgent is not None and urgent[0] <= now:
+            # Breached: no longer an escalation candidate (it stays in the class heap)
+            heapq.heappop(self._by_deadline)
+            urgent = self._top(self._by_deadline, 2, 1)
+        if urgent is not None and urgent[0] - now <= self.escalate_seconds:
+            return urgent[2]
+        top = self._top(self._by_class, 3, 2)
+        return top[3] if top is not None else None
+
+    def peek(self, now: Optional[float] = None) -> Optional[Path]:
+        with self._lock:
+            name = self._next_name(now if now is not None else datetime.now(timezone.utc).timestamp())
+            return self._live[name][1] if name else None
+
+    def pop(self, now: Optional[float] = None) -> Optional[Path]:
+        """Remove and return the next task: about to breach first, then by (class, deadline)."""
+        with self._lock:
+            name = self._next_name(now if now is not None else datetime.now(timezone.utc).timestamp())
+            if name is None:
+                return None
+            return self._live.pop(name)[1]
+
+    def ordered(self, paths: Iterable[Path], now: Optional[float] = None) -> list[Path]:
+        """Queued `paths` in dispatch order (without removing them)."""
+        now = now if now is not None else datetime.now(timezone.utc).timestamp()
+
+        def rank(p: Path):
+            _, _, pclass, deadline = self._live.get(p.name, (0, p, DEFAULT_CLASS, float("inf")))
+            escalated = now < deadline <= now + self.escalate_seconds
+            return (0, deadline) if escalated else (1, pclass, deadline)
+        return sorted(paths, key=rank)
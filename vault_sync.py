@@ -0,0 +1,523 @@
+"""
+vault_sync.py — Change-journal vault sync (Platinum Tier).
+
+Replaces the `git add -A` bodies of sync/sync_up.sh and sync/sync_down.sh.
+Those stat every file in the vault on each run, and they recommit each
+day's audit log JSON array as it grows. This engine does work proportional
+to what changed:
+
+  1. Journal — a watchdog observer records every changed vault-relative path
+     in .sync/journal (append-only, deduplicated, survives restarts).
+  2. Debounce — a batch is flushed once the vault has been quiet for
+     SYNC_DEBOUNCE_SECONDS, or at the latest SYNC_MAX_DELAY_SECONDS after its
+     first change.
+  3. Stage only the journalled paths (`git add` / `git rm --cached` with an
+     explicit pathspec list), then commit with write-tree/commit-tree, which
+     never scans the working tree. Then push.
+  4. Audit logs (Logs/YYYY-MM-DD.json) are not synced as rewritten JSON arrays.
+     Their new entries are appended to Logs/sync/<agent>/YYYY-MM-DD.jsonl, one
+     compact line per entry. Each agent gets its own append-only file, so git
+     diffs are pure appends and Local/Cloud never conflict over the same log.
+
+The one full-tree scan left is `git status` once at daemon start (changes made
+while it was not running) and in one-shot `up` runs without a daemon.
+
+Usage:
+    uv run vault-sync run        # daemon: journal + debounce + push, pull every SYNC_PULL_INTERVAL
+    uv run vault-sync up         # one-shot push (what sync/sync_up.sh runs)
+    uv run vault-sync down       # one-shot pull (what sync/sync_down.sh runs)
+    uv run vault-sync status
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+import subprocess
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+from dotenv import load_dotenv
+
+from audit_logger import write_log_entry, infer_approval
+
+try:
+    import fcntl
+except ImportError:  # Windows — single-process best effort
+    fcntl = None
+
+load_dotenv()
+
+logger = logging.getLogger("VaultSync")
+
+SYNC_AGENT_ID      = os.getenv("SYNC_AGENT_ID", "local-01")
+SYNC_BRANCH        = os.getenv("VAULT_SYNC_BRANCH", "main")
+SYNC_DEBOUNCE      = float(os.getenv("SYNC_DEBOUNCE_SECONDS", "5"))
+SYNC_MAX_DELAY     = float(os.getenv("SYNC_MAX_DELAY_SECONDS", "60"))
+SYNC_PULL_INTERVAL = float(os.getenv("SYNC_PULL_INTERVAL", "300"))   # 0 = never pull
+SYNC_PUSH          = os.getenv("SYNC_PUSH", "true").lower() == "true"
+
+_STATE_DIR = ".sync"
+_LOG_EXPORT_DIR = "Logs/sync"
+_AUDIT_LOG_RE = re.compile(r"^Logs/(\d{4}-\d{2}-\d{2})\.json$")
+# Never journalled: git internals, our own state, exported logs (staged by the exporter)
+_SKIP_PREFIXES = (".git/", f"{_STATE_DIR}/", f"{_LOG_EXPORT_DIR}/")
+_SKIP_SUFFIXES = (".tmp", ".swp", "~")
+# Local-only paths, kept out of git even when the vault .gitignore predates them
+_EXCLUDES = (f"/{_STATE_DIR}/", "/Logs/*.json")
+
+
+class ChangeJournal:
+    """Append-only set of changed vault-relative paths; survives restarts and failed flushes."""
+
+    def __init__(self, state_dir: Path):
+        self.path = state_dir / "journal"
+        self._pending = state_dir / "journal.pending"
+        self._lock = threading.Lock()
+        self._recorded: set[str] = set()   # dedupe until the next take()
+
+    def record(self, paths: Iterable[str]) -> int:
+        with self._lock:
+            new = [p for p in dict.fromkeys(paths) if p not in self._recorded]
+            if new:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("".join(f"{p}\n" for p in new))
+                self._recorded.update(new)
+            return len(new)
+
+    def take(self) -> set[str]:
+        """Claim every recorded path. They stay claimed (and are retried) until done()."""
+        with self._lock:
+            if self.path.exists():
+                with open(self._pending, "a", encoding="utf-8") as out:
+                    out.write(self.path.read_text(encoding="utf-8"))
+                self.path.unlink()
+            self._recorded.clear()
+        try:
+            return {line for line in self._pending.read_text(encoding="utf-8").splitlines() if line}
+        except FileNotFoundError:
+            return set()
+
+    def done(self) -> None:
+        self._pending.unlink(missing_ok=True)
+
+    def size(self) -> int:
+        return sum(len(p.read_text(encoding="utf-8").splitlines())
+                   for p in (self.path, self._pending) if p.exists())
+
+
+class VaultSync:
+    """Journal-driven git sync for one vault."""
+
+    def __init__(self, vault_path: Path, agent_id: str = SYNC_AGENT_ID, branch: str = SYNC_BRANCH,
+                 push: bool = SYNC_PUSH):
+        self.vault_path = Path(vault_path).resolve()
+        self.agent_id = agent_id
+        self.branch = branch
+        self.push_enabled = push
+        self.state_dir = self.vault_path / _STATE_DIR
+        self.state_dir.mkdir(exist_ok=True)
+        self.journal = ChangeJournal(self.state_dir)
+        self._state_file = self.state_dir / "state.json"
+        self._first_change = 0.0
+        self._last_change = 0.0
+        self._wake = threading.Event()
+        self._stopping = False
+
+    # ── git ───────────────────────────────────────────────────────────────────
+
+    def _git(self, *args: str, input: Optional[bytes] = None, check: bool = True) -> str:
+        proc = subprocess.run(["git", "--literal-pathspecs", *args], cwd=self.vault_path, input=input,
+                              capture_output=True)
+        if check and proc.returncode != 0:
+            raise RuntimeError(f"git {args[0]} failed: {proc.stderr.decode(errors='replace').strip()}")
+        return proc.stdout.decode(errors="replace").strip()
+
+    def _has_remote(self) -> bool:
+        return bool(self._git("remote", check=False))
+
+    def ensure_setup(self) -> None:
+        """One-time local config: exclude sync state and raw audit logs, untrack stale copies."""
+        if not (self.vault_path / ".git").exists():
+            raise RuntimeError(f"{self.vault_path} is not a git repo — run sync/setup_vault_sync.sh first")
+        exclude = self.vault_path / ".git" / "info" / "exclude"
+        exclude.parent.mkdir(exist_ok=True)
+        current = exclude.read_text(encoding="utf-8") if exclude.exists() else ""
+        missing = [e for e in _EXCLUDES if e not in current.splitlines()]
+        if missing:
+            with open(exclude, "a", encoding="utf-8") as f:
+                f.write(("" if current.endswith("\n") or not current else "\n") + "\n".join(missing) + "\n")
+        self._git("config", "core.untrackedCache", "true", check=False)
+        raw_logs = [f"Logs/{p.name}" for p in (self.vault_path / "Logs").glob("*.json")]
+        tracked = self._git("ls-files", "-z", "--", *raw_logs, check=False) if raw_logs else ""
+        if tracked:
+            # Raw JSON logs are replaced by per-agent JSONL exports
+            self._git("rm", "-q", "--cached", "--pathspec-from-file=-", "--pathspec-file-nul",
+                      input=tracked.encode())
+            self.journal.record(p for p in tracked.split("\0") if p)
+
+    # ── Journal ───────────────────────────────────────────────────────────────
+
+    def record(self, abs_paths: Iterable[str]) -> None:
+        """Journal changed absolute paths (called from filesystem events)."""
+        rels = []
+        for path in abs_paths:
+            try:
+                rel = Path(path).resolve().relative_to(self.vault_path).as_posix()
+            except ValueError:
+                continue
+            if rel == "." or f"{rel}/".startswith(_SKIP_PREFIXES) or rel.endswith(_SKIP_SUFFIXES):
+                continue
+            rels.append(rel)
+        if rels and self.journal.record(rels):
+            now = time.monotonic()
+            self._first_change = self._first_change or now
+            self._last_change = now
+            self._wake.set()
+
+    def reconcile(self) -> int:
+        """
+        Journal whatever changed while no observer was running: one `git status`
+        scan, plus a listing of Logs/ — raw audit logs are git-excluded, so status
+        never reports them.
+        """
+        out = self._git("status", "--porcelain", "-z", "--no-renames", "--untracked-files=all")
+        paths = [entry[3:] for entry in out.split("\0") if len(entry) > 3]
+        paths = [p for p in paths if not p.startswith(_SKIP_PREFIXES)]
+        return self.journal.record(paths + self._unexported_logs())
+
+    def _unexported_logs(self) -> list[str]:
+        """Audit logs whose entry count differs from what this agent has exported."""
+        state = self._load_state()
+        offsets, sizes = state.get("log_offsets", {}), state.get("log_sizes", {})
+        stale = []
+        for f in (self.vault_path / "Logs").glob("*.json"):
+            rel = f"Logs/{f.name}"
+            m = _AUDIT_LOG_RE.match(rel)
+            if not m:
+                continue
+            day = m.group(1)
+            try:
+                size = f.stat().st_size
+                if day in offsets and sizes.get(day) == size:
+                    continue               # untouched since the last export
+                entries = json.loads(f.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if isinstance(entries, list) and len(entries) != offsets.get(day):
+                stale.append(rel)
+        return stale
+
+    # ── Flush (stage → commit → push) ─────────────────────────────────────────
+
+    def _load_state(self) -> dict:
+        try:
+            return json.loads(self._state_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {"log_offsets": {}}
+
+    def _save_state(self, state: dict) -> None:
+        tmp = self._state_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        tmp.replace(self._state_file)
+
+    def _export_logs(self, rels: list[str]) -> set[str]:
+        """Append new audit-log entries to this agent's JSONL files; return their paths."""
+        state = self._load_state()
+        offsets = state.setdefault("log_offsets", {})
+        sizes = state.setdefault("log_sizes", {})
+        exported = set()
+        for rel in rels:
+            day = _AUDIT_LOG_RE.match(rel).group(1)
+            target = f"{_LOG_EXPORT_DIR}/{self.agent_id}/{day}.jsonl"
+            try:
+                raw = (self.vault_path / rel).read_bytes()
+                entries = json.loads(raw)
+            except (OSError, ValueError):
+                continue
+            if not isinstance(entries, list):
+                continue
+            done = offsets.get(day, 0)
+            if len(entries) < done:
+                logger.warning(f"{rel} shrank ({done} → {len(entries)} entries) — resuming from its end")
+                done = len(entries)
+            if len(entries) > done:
+                out = self.vault_path / target
+                out.parent.mkdir(parents=True, exist_ok=True)
+                with open(out, "a", encoding="utf-8") as f:
+                    f.write("".join(json.dumps(e, separators=(",", ":"), ensure_ascii=False) + "\n"
+                                    for e in entries[done:]))
+            offsets[day] = len(entries)
+            sizes[day] = len(raw)
+            exported.add(target)
+        self._save_state(state)
+        return exported
+
+    def _stage(self, paths: set[str]) -> None:
+        present = sorted(p for p in paths if (self.vault_path / p).exists())
+        gone = sorted(p for p in paths if not (self.vault_path / p).exists())
+        if present:
+            ignored = set(self._git("check-ignore", "-z", "--stdin",
+                                    input="\0".join(present).encode() + b"\0", check=False).split("\0"))
+            present = [p for p in present if p not in ignored]
+        if present:
+            self._git("add", "-A", "--pathspec-from-file=-", "--pathspec-file-nul",
+                      input="\0".join(present).encode())
+        if gone:
+            self._git("rm", "-r", "-q", "--cached", "--ignore-unmatch", "--pathspec-from-file=-",
+                      "--pathspec-file-nul", input="\0".join(gone).encode())
+
+    def _commit(self, message: str) -> Optional[str]:
+        """Commit the index without scanning the working tree. Returns the commit id, or None."""
+        tree = self._git("write-tree")
+        head = self._git("rev-parse", "-q", "--verify", "HEAD", check=False)
+        if head and self._git("rev-parse", "HEAD^{tree}") == tree:
+            return None
+        commit = self._git("commit-tree", tree, "-m", message, *(["-p", head] if head else []))
+        self._git("update-ref", "HEAD", commit)
+        return commit
+
+    @contextmanager
+    def _locked(self):
+        """Serialise flush/pull between the daemon and one-shot runs."""
+        with open(self.state_dir / "lock", "a") as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def flush(self, push: Optional[bool] = None) -> dict:
+        """Stage and commit every journalled path; push if enabled. Returns a summary."""
+        t0 = time.monotonic()
+        self._first_change = 0.0
+        with self._locked():
+            # A merge left half-done (crash, or an older version) blocks write-tree
+            self._resolve_merge()
+            paths = self.journal.take()
+            if not paths:
+                return {"paths": 0, "commit": None}
+            logs = [p for p in paths if _AUDIT_LOG_RE.match(p)]
+            stage = (paths - set(logs)) | self._export_logs(logs)
+            self._stage(stage)
+            ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            commit = self._commit(f"sync: {self.agent_id} update @ {ts} ({len(stage)} paths)")
+            self.journal.done()
+            pushed = False
+            if commit and (self.push_enabled if push is None else push) and self._has_remote():
+                pushed = self._push()
+        summary = {"paths": len(stage), "audit_logs": len(logs), "commit": commit and commit[:10],
+                   "pushed": pushed, "elapsed_ms": round((time.monotonic() - t0) * 1000, 1)}
+        if commit:
+            # Not audit-logged: the log entry would itself be the next change to sync
+            logger.info(f"Synced {summary['paths']} path(s) → {summary['commit']}"
+                        + (" (pushed)" if pushed else "") + f" in {summary['elapsed_ms']} ms")
+        return summary
+
+    def _push(self) -> bool:
+        for attempt in (1, 2):
+            try:
+                self._git("push", "-q", "origin", f"HEAD:{self.branch}")
+                return True
+            except RuntimeError as e:
+                if attempt == 2:
+                    logger.error(f"Push failed: {e}")
+                    self._log("vault_sync_up", "error", {"error": str(e)})
+                    return False
+                # Usually non-fast-forward — the other agent pushed first
+                self._merge_remote()
+        return False
+
+    def _merge_remote(self) -> bool:
+        self._git("fetch", "-q", "origin", self.branch)
+        before = self._git("rev-parse", "-q", "--verify", "HEAD", check=False)
+        try:
+            self._git("merge", "-q", f"origin/{self.branch}", "--no-edit", "--strategy-option=theirs")
+        except RuntimeError:
+            # -X theirs settles content conflicts only; modify/delete still stops the merge
+            if not self._resolve_merge():
+                raise
+        return self._git("rev-parse", "HEAD") != before
+
+    def _resolve_merge(self) -> bool:
+        """
+        Finish an interrupted merge with the remote side of every unmerged path
+        (its version, or its deletion), or abort it. Never leaves unmerged index
+        entries behind, which would make every later write-tree fail.
+        Returns True if the merge was concluded.
+        """
+        merging = self._git("rev-parse", "-q", "--verify", "MERGE_HEAD", check=False)
+        unmerged: dict[str, set[str]] = {}
+        for entry in self._git("ls-files", "-u", "-z", check=False).split("\0"):
+            if entry:
+                info, path = entry.split("\t", 1)
+                unmerged.setdefault(path, set()).add(info.split()[2])
+        if not merging and not unmerged:
+            return False
+        theirs = sorted(p for p, stages in unmerged.items() if "3" in stages)
+        deleted = sorted(p for p, stages in unmerged.items() if "3" not in stages)
+        try:
+            if theirs:
+                nul = "\0".join(theirs).encode()
+                self._git("checkout", "--theirs", "--pathspec-from-file=-", "--pathspec-file-nul", input=nul)
+                self._git("add", "--pathspec-from-file=-", "--pathspec-file-nul", input=nul)
+            if deleted:
+                self._git("rm", "-q", "--ignore-unmatch", "--pathspec-from-file=-", "--pathspec-file-nul",
+                          input="\0".join(deleted).encode())
+            if merging:
+                self._git("commit", "-q", "--no-edit", "--no-verify")
+        except RuntimeError as e:
+            logger.error(f"Could not resolve merge, aborting it: {e}")
+            if merging:
+                self._git("merge", "--abort", check=False)
+            else:
+                self._git("reset", "-q", "--", ".", check=False)
+            return False
+        logger.warning(f"Merge conflicts resolved with origin/{self.branch}: "
+                       f"{len(theirs)} taken, {len(deleted)} deleted")
+        return True
+
+    def pull(self) -> bool:
+        """Commit local changes first, then merge the remote branch (remote wins conflicts)."""
+        if not self._has_remote():
+            logger.warning("No remote configured. Nothing to pull.")
+            return False
+        self.flush(push=False)
+        with self._locked():
+            try:
+                merged = self._merge_remote()
+            except RuntimeError as e:
+                logger.error(f"Pull failed: {e}")
+                self._log("vault_sync_down", "error", {"error": str(e)})
+                return False
+        if merged:
+            logger.info(f"Pulled origin/{self.branch}")
+            self._log("vault_sync_down", "success", {"branch": self.branch})
+        return merged
+
+    def _log(self, action_type: str, result: str, details: dict) -> None:
+        approval_status, approved_by = infer_approval(action_type)
+        write_log_entry(
+            logs_dir=self.vault_path / "Logs",
+            action_type=action_type,
+            actor=f"vault_sync:{self.agent_id}",
+            target=self.branch,
+            result=result,
+            parameters=details,
+            approval_status=approval_status,
+            approved_by=approved_by,
+        )
+
+    # ── Daemon ────────────────────────────────────────────────────────────────
+
+    def run(self, debounce: float = SYNC_DEBOUNCE, max_delay: float = SYNC_MAX_DELAY,
+            pull_interval: float = SYNC_PULL_INTERVAL) -> None:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+
+        sync = self
+
+        class _JournalHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.event_type in ("opened", "closed_no_write"):
+                    return
+                if event.is_directory and event.event_type == "modified":
+                    return   # the entry's own event is journalled; staging the dir would rescan it
+                sync.record([event.src_path, getattr(event, "dest_path", "") or event.src_path])
+
+        self.ensure_setup()
+        n = self.reconcile()
+        if n:
+            logger.info(f"{n} path(s) changed while sync was not running")
+            self._first_change = self._last_change = time.monotonic()
+        observer = Observer()
+        observer.schedule(_JournalHandler(), str(self.vault_path), recursive=True)
+        observer.start()
+        logger.info(f"Vault sync running for {self.vault_path} (agent {self.agent_id}, "
+                    f"debounce {debounce}s, max delay {max_delay}s)")
+        next_pull = time.monotonic() + pull_interval if pull_interval else float("inf")
+        try:
+            while not self._stopping:
+                now = time.monotonic()
+                due = (min(self._last_change + debounce, self._first_change + max_delay)
+                       if self._first_change else float("inf"))
+                if now >= due:
+                    try:
+                        self.flush()
+                    except Exception as e:
+                        logger.error(f"Sync flush failed (will retry): {e}")
+                        self._first_change = self._last_change = time.monotonic()
+                    continue
+                if now >= next_pull:
+                    try:
+                        self.pull()
+                    except Exception as e:
+                        logger.error(f"Sync pull failed: {e}")
+                    next_pull = time.monotonic() + pull_interval
+                    continue
+                deadline = min(due, next_pull)
+                self._wake.wait(None if deadline == float("inf") else deadline - now)
+                self._wake.clear()
+        finally:
+            observer.stop()
+            observer.join()
+            self.flush()
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._wake.set()
+
+    def status(self) -> dict:
+        return {"vault": str(self.vault_path), "agent": self.agent_id, "branch": self.branch,
+                "journal_paths": self.journal.size(), "remote": self._has_remote(),
+                "log_offsets": self._load_state().get("log_offsets", {}),
+                "unexported_logs": self._unexported_logs()}
+
+
+# ── CLI ────────────────────────────────────────────────────────────────────────
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [VaultSync] %(levelname)s: %(message)s",
+                        datefmt="%Y-%m-%dT%H:%M:%S")
+    parser = argparse.ArgumentParser(description="Change-journal vault sync (Local ↔ Cloud)")
+    parser.add_argument("command", nargs="?", default="run", choices=["run", "up", "down", "status"])
+    parser.add_argument("--vault", default=os.getenv("VAULT_PATH", "./AI_Employee_Vault"))
+    args = parser.parse_args()
+
+    sync = VaultSync(Path(args.vault))
+    if args.command == "status":
+        print(json.dumps(sync.status(), indent=2))
+        return
+    try:
+        sync.ensure_setup()
+    except RuntimeError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+    if args.command == "run":
+        import signal
+        signal.signal(signal.SIGTERM, lambda *_: sync.stop())
+        try:
+            sync.run()
+        except KeyboardInterrupt:
+            pass
+    elif args.command == "up":
+        sync.reconcile()
+        summary = sync.flush()
+        print("No changes to sync." if not summary.get("commit") else f"Sync UP complete: {summary}")
+    else:
+        sync.pull()
+        print("Sync DOWN complete.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+watcher_forkserver.py — Preloaded forkserver for watcher processes (optional orchestrator mode).
+
+In the default subprocess mode every (re)start is a cold `python -m watchers.X`:
+a fresh interpreter that re-imports google-api-python-client, playwright,
+dotenv … and the orchestrator only notices a crash on its 60s health tick.
+
+Forkserver mode keeps one zygote process (multiprocessing's "forkserver"
+start method) that has already imported PRELOAD_MODULES. Each watcher is
+forked from it on demand, so a restart costs a fork() instead of an
+interpreter boot. Watchers keep their own process — a crash or leak in one
+never touches the orchestrator or its siblings.
+
+Supervision:
+  - A monitor thread blocks on every child's sentinel fd (readable the instant
+    the child exits) — no polling, zero idle wake-ups.
+  - The first restart is immediate; a watcher that keeps dying backs off
+    RESTART_BACKOFF_BASE * 2^(n-1) seconds (capped at RESTART_BACKOFF_MAX),
+    and the counter resets after RESTART_RESET_AFTER healthy seconds.
+  - stop_all() terminates every child and joins.
+
+POSIX only. The scheduler is not a BaseWatcher and keeps running as its own process.
+
+Usage:
+    uv run python orchestrator.py --forkserver
+    # or: WATCHER_RUNTIME=forkserver in .env
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+import logging
+import threading
+import multiprocessing
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Optional
+
+from audit_logger import write_log_entry, infer_approval
+from watcher_runtime import (
+    WATCHER_FACTORIES, RESTART_BACKOFF_BASE, RESTART_BACKOFF_MAX, RESTART_RESET_AFTER,
+)
+
+logger = logging.getLogger("WatcherForkServer")
+
+# Imported once in the zygote; missing optional packages are skipped silently.
+# "__main__" (the orchestrator script) is preloaded too, otherwise every child
+# would re-execute it on startup.
+PRELOAD_MODULES = [
+    "__main__",
+    "dotenv",
+    "audit_logger", "retry_handler", "rate_limiter", "permission_guard", "google_quota",
+    "watchers.base_watcher", "watchers.async_base_watcher",
+    "googleapiclient.discovery", "google.oauth2.credentials", "google.auth.transport.requests",
+    "playwright.sync_api", "playwright.async_api", "httpx", "watchdog.observers",
+    "watchers.filesystem_watcher", "watchers.gmail_watcher", "watchers.linkedin_watcher",
+    "watchers.whatsapp_watcher", "watchers.social_watcher",
+    "watcher_forkserver",
+]
+
+# Orchestrator process names this mode can host (social_watcher = all platforms, one child)
+SOCIAL_WATCHERS = [name for name in WATCHER_FACTORIES if name.startswith("social_")]
+TARGETS = [name for name in WATCHER_FACTORIES if name not in SOCIAL_WATCHERS] + ["social_watcher"]
+
+
+def _child_main(name: str, vault: str) -> None:
+    """Entry point of a forked watcher child (runs in the forkserver's copy of the imports)."""
+    os.environ["VAULT_PATH"] = vault
+    if name == "social_watcher":
+        from watchers.async_base_watcher import run_watchers
+        asyncio.run(run_watchers([WATCHER_FACTORIES[n](vault) for n in SOCIAL_WATCHERS]))
+        return
+    WATCHER_FACTORIES[name](vault).run()
+
+
+@dataclass
+class _Child:
+    """One supervised watcher process."""
+    name: str
+    process: Optional[multiprocessing.process.BaseProcess] = None
+    restarts: int = 0
+    started_at: float = 0.0
+    restart_at: float = 0.0      # monotonic deadline of a pending restart (0 = none)
+    last_exit_code: Optional[int] = None
+
+
+class WatcherForkServer:
+    """Forks watchers from a preloaded zygote and restarts them the moment they die."""
+
+    def __init__(self, vault_path: Path):
+        self.vault_path = Path(vault_path).resolve()
+        self.logs_path = self.vault_path / "Logs"
+        self.dry_run = os.getenv("DRY_RUN", "true").lower() == "true"
+        # The zygote starts on first use and inherits this environment
+        os.environ["VAULT_PATH"] = str(self.vault_path)
+        self._ctx = multiprocessing.get_context("forkserver")
+        self._ctx.set_forkserver_preload(PRELOAD_MODULES)
+        self._children: dict[str, _Child] = {}
+        self._lock = threading.Lock()
+        self._wake_r, self._wake_w = multiprocessing.Pipe(duplex=False)
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    @staticmethod
+    def available() -> bool:
+        return "forkserver" in multiprocessing.get_all_start_methods()
+
+    def log_action(self, action_type: str, target: str, result: str, details: dict = None):
+        approval_status, approved_by = infer_approval(action_type, self.dry_run)
+        write_log_entry(
+            logs_dir=self.logs_path,
+            action_type=action_type,
+            actor="watcher_forkserver",
+            target=target,
+            result=result,
+            parameters=details or {},
+            approval_status=approval_status,
+            approved_by=approved_by,
+        )
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+
+    def start(self, name: str) -> None:
+        """Fork `name` (no-op if already running) and make sure the monitor is up."""
+        if name not in TARGETS:
+            raise KeyError(f"No forkserver target for '{name}'")
+        with self._lock:
+            child = self._children.setdefault(name, _Child(name=name))
+            if child.process is not None and child.process.is_alive():
+                return
+            self._spawn(child)
+        if self._monitor_thread is None:
+            self._monitor_thread = threading.Thread(target=self._monitor, name="watcher-forkserver-monitor",
+                                                    daemon=True)
+            self._monitor_thread.start()
+        self._wake()
+
+    def _spawn(self, child: _Child) -> None:
+        t0 = time.monotonic()
+        proc = self._ctx.Process(target=_child_main, args=(child.name, str(self.vault_path)),
+                                 name=f"watcher-{child.name}", daemon=True)
+        proc.start()
+        child.process = proc
+        child.started_at = time.monotonic()
+        child.restart_at = 0.0
+        spawn_ms = round((child.started_at - t0) * 1000, 1)
+        logger.info(f"Forked {child.name} (PID {proc.pid}, {spawn_ms} ms)")
+        self.log_action("process_start", child.name, "success",
+                        {"pid": proc.pid, "mode": "forkserver", "spawn_ms": spawn_ms})
+
+    def _wake(self) -> None:
+        self._wake_w.send(None)
+
+    def _on_exit(self, child: _Child, now: float) -> None:
+        """Record a child's death and schedule its restart on the backoff curve."""
+        proc = child.process
+        proc.join(0)
+        child.last_exit_code = proc.exitcode
+        proc.close()
+        child.process = None
+        if now - child.started_at >= RESTART_RESET_AFTER:
+            child.restarts = 0
+        delay = 0 if child.restarts == 0 else min(RESTART_BACKOFF_BASE * 2 ** (child.restarts - 1),
+                                                  RESTART_BACKOFF_MAX)
+        child.restarts += 1
+        child.restart_at = now + delay
+        logger.warning(f"{child.name} exited (code {child.last_exit_code}) — "
+                       f"restart #{child.restarts} in {delay}s")
+        self.log_action("process_restart", child.name, "warning",
+                        {"exit_code": child.last_exit_code, "restart": child.restarts,
+                         "backoff_seconds": delay, "mode": "forkserver"})
+
+    def _monitor(self) -> None:
+        """Block on child sentinels; react to exits and due restarts only."""
+        while not self._stopping:
+            with self._lock:
+                live = {c.process.sentinel: c for c in self._children.values() if c.process is not None}
+                pending = [c.restart_at for c in self._children.values() if c.restart_at]
+            timeout = max(min(pending) - time.monotonic(), 0) if pending else None
+            ready = wait([self._wake_r, *live], timeout)
+            while self._wake_r.poll():
+                self._wake_r.recv()
+
+            with self._lock:
+                if self._stopping:
+                    return
+                now = time.monotonic()
+                for sentinel in ready:
+                    if sentinel in live:
+                        self._on_exit(live[sentinel], now)
+                for child in self._children.values():
+                    if child.restart_at and time.monotonic() >= child.restart_at:
+                        try:
+                            self._spawn(child)
+                        except Exception as e:
+                            logger.error(f"Could not fork {child.name}: {e}")
+                            child.restart_at = time.monotonic() + RESTART_BACKOFF_MAX
+
+    def names(self) -> list[str]:
+        return list(self._children)
+
+    def status(self) -> dict[str, dict]:
+        """Per-watcher liveness, PID and restart count (for health signals)."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                name: {
+                    "alive": child.process is not None and child.process.is_alive(),
+                    "mode": "forkserver",
+                    "pid": child.process.pid if child.process is not None else None,
+                    "restarts": child.restarts,
+                    "uptime_seconds": int(now - child.started_at) if child.process is not None else 0,
+                    "last_exit_code": child.last_exit_code,
+                }
+                for name, child in self._children.items()
+            }
+
+    def stop_all(self, timeout: float = 10.0) -> None:
+        """Terminate every child and wait up to `timeout` seconds for them to exit."""
+        with self._lock:
+            self._stopping = True
+            procs = [c.process for c in self._children.values() if c.process is not None]
+        self._wake()
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+        deadline = time.monotonic() + timeout
+        for proc in procs:
+            proc.join(max(deadline - time.monotonic(), 0))
+            if proc.is_alive():
+                proc.kill()
+                proc.join(1)
+        logger.info("All forkserver watchers stopped.")
@@ -0,0 +1,279 @@
+"""
+watcher_runtime.py — In-process watcher runtime (optional orchestrator mode).
+
+Hosts every BaseWatcher subclass as a supervised thread or task inside ONE interpreter
+instead of one `python -m watchers.<name>` process per watcher. The watchers
+share imported modules (google-api-python-client, playwright, dotenv …), the
+serialized audit writer and the §7.3 fallback directory, so total RSS is that
+of a single process and startup pays each import once.
+
+Supervision:
+  - Each blocking watcher runs in its own daemon thread; AsyncBaseWatcher
+    subclasses (e.g. the per-platform social watchers) all share ONE event
+    loop thread as separate tasks. A crash in one never touches the others.
+  - A watcher whose run() raises or returns unexpectedly is rebuilt from its
+    factory and restarted after RESTART_BACKOFF_BASE * 2^n seconds (capped at
+    RESTART_BACKOFF_MAX). The counter resets once it has stayed up for
+    RESTART_RESET_AFTER seconds.
+  - stop_all() asks every watcher to stop via BaseWatcher.stop() and joins.
+
+The scheduler is not a BaseWatcher and keeps running as its own process.
+
+Usage:
+    uv run python orchestrator.py --in-process
+    # or: WATCHER_RUNTIME=inprocess in .env
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from audit_logger import write_log_entry, infer_approval
+
+logger = logging.getLogger("WatcherRuntime")
+
+RESTART_BACKOFF_BASE = int(os.getenv("WATCHER_RESTART_BACKOFF_BASE", "5"))     # seconds
+RESTART_BACKOFF_MAX  = int(os.getenv("WATCHER_RESTART_BACKOFF_MAX", "300"))    # seconds
+RESTART_RESET_AFTER  = int(os.getenv("WATCHER_RESTART_RESET_AFTER", "600"))    # healthy seconds
+
+
+# ── Watcher factories (mirror each watcher's main() defaults) ──────────────────
+
+def _filesystem(vault: str):
+    from watchers.filesystem_watcher import FilesystemWatcher
+    return FilesystemWatcher(vault_path=vault)
+
+
+def _gmail(vault: str):
+    from watchers.gmail_watcher import GmailWatcher
+    return GmailWatcher(
+        vault_path=vault,
+        credentials_path=os.getenv("GMAIL_CREDENTIALS_PATH", "./secrets/gmail_credentials.json"),
+        token_path=os.getenv("GMAIL_TOKEN_PATH", "./secrets/gmail_token.json"),
+        check_interval=int(os.getenv("GMAIL_CHECK_INTERVAL", "120")),
+    )
+
+
+def _linkedin(vault: str):
+    from watchers.linkedin_watcher import LinkedInWatcher
+    return LinkedInWatcher(vault_path=vault)
+
+
+def _whatsapp(vault: str):
+    from watchers.whatsapp_watcher import WhatsAppWatcher
+    return WhatsAppWatcher(
+        vault_path=vault,
+        session_path=os.getenv("WHATSAPP_SESSION_PATH", "./secrets/whatsapp_session"),
+    )
+
+
+def _social(platform: str) -> Callable[[str], object]:
+    def factory(vault: str):
+        from watchers.social_watcher import SocialWatcher
+        return SocialWatcher(vault, platform)
+    factory.is_async = True   # AsyncBaseWatcher: known even when construction fails
+    return factory
+
+
+# Orchestrator process name → factory(vault_path) -> BaseWatcher
+WATCHER_FACTORIES: dict[str, Callable[[str], object]] = {
+    "filesystem_watcher": _filesystem,
+    "gmail_watcher":      _gmail,
+    "linkedin_watcher":   _linkedin,
+    "whatsapp_watcher":   _whatsapp,
+    "social_facebook":    _social("Facebook"),
+    "social_instagram":   _social("Instagram"),
+    "social_twitter":     _social("Twitter"),
+}
+
+
+# ── Supervisor ─────────────────────────────────────────────────────────────────
+
+@dataclass
+class _Slot:
+    """One supervised watcher."""
+    name: str
+    factory: Callable[[str], object]
+    thread: Optional[threading.Thread] = None
+    task: Optional[asyncio.Future] = None
+    watcher: object = None
+    restarts: int = 0
+    started_at: float = 0.0
+    last_error: str = ""
+    stopping: bool = False
+    wake: threading.Event = field(default_factory=threading.Event)
+
+
+class WatcherRuntime:
+    """Runs watchers as supervised threads (blocking) or tasks (async) in this process."""
+
+    def __init__(self, vault_path: Path):
+        self.vault_path = Path(vault_path).resolve()
+        self.logs_path = self.vault_path / "Logs"
+        self.dry_run = os.getenv("DRY_RUN", "true").lower() == "true"
+        self._slots: dict[str, _Slot] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+
+    def log_action(self, action_type: str, target: str, result: str, details: dict = None):
+        approval_status, approved_by = infer_approval(action_type, self.dry_run)
+        write_log_entry(
+            logs_dir=self.logs_path,
+            action_type=action_type,
+            actor="watcher_runtime",
+            target=target,
+            result=result,
+            parameters=details or {},
+            approval_status=approval_status,
+            approved_by=approved_by,
+        )
+
+    def _shared_loop(self) -> asyncio.AbstractEventLoop:
+        """The single event loop (own thread) that hosts every async watcher."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self._loop.run_forever,
+                                                 name="watcher-async-loop", daemon=True)
+            self._loop_thread.start()
+        return self._loop
+
+    def start(self, name: str, factory: Optional[Callable[[str], object]] = None) -> None:
+        """Start (or no-op if already running) the watcher registered as `name`."""
+        slot = self._slots.get(name)
+        if slot and not slot.stopping and self._alive(slot):
+            return
+        from watchers.async_base_watcher import AsyncBaseWatcher
+
+        slot = _Slot(name=name, factory=factory or WATCHER_FACTORIES[name])
+        self._slots[name] = slot
+        try:
+            slot.watcher = slot.factory(str(self.vault_path))
+        except Exception as e:
+            # Construction failures are retried by the supervisor with backoff
+            slot.last_error = f"{type(e).__name__}: {e}"
+
+        # Decided from the factory too: a failed first build must not move an
+        # async watcher onto its own thread and event loop for good
+        if isinstance(slot.watcher, AsyncBaseWatcher) or getattr(slot.factory, "is_async", False):
+            slot.task = asyncio.run_coroutine_threadsafe(self._supervise_async(slot), self._shared_loop())
+            where = "shared event loop"
+        else:
+            slot.thread = threading.Thread(target=self._supervise, args=(slot,),
+                                           name=f"watcher-{name}", daemon=True)
+            slot.thread.start()
+            where = f"thread {slot.thread.name}"
+        logger.info(f"Started {name} in-process ({where})")
+        self.log_action("process_start", name, "success", {"mode": "inprocess"})
+
+    @staticmethod
+    def _alive(slot: _Slot) -> bool:
+        if slot.task is not None:
+            return not slot.task.done()
+        return bool(slot.thread and slot.thread.is_alive())
+
+    def _backoff(self, slot: _Slot) -> float:
+        """Record an unexpected exit and return the delay before the next restart."""
+        if time.monotonic() - slot.started_at >= RESTART_RESET_AFTER:
+            slot.restarts = 0
+        delay = min(RESTART_BACKOFF_BASE * (2 ** slot.restarts), RESTART_BACKOFF_MAX)
+        slot.restarts += 1
+        logger.warning(f"{slot.name} exited ({slot.last_error}) — restart #{slot.restarts} in {delay}s")
+        self.log_action("process_restart", slot.name, "warning",
+                        {"error": slot.last_error, "restart": slot.restarts,
+                         "backoff_seconds": delay, "mode": "inprocess"})
+        slot.watcher = None
+        return delay
+
+    def _supervise(self, slot: _Slot) -> None:
+        while not slot.stopping:
+            slot.started_at = time.monotonic()
+            try:
+                if slot.watcher is None:
+                    slot.watcher = slot.factory(str(self.vault_path))
+                slot.watcher.run()
+                if slot.stopping:
+                    break
+                slot.last_error = "run() returned"
+            except Exception as e:
+                slot.last_error = f"{type(e).__name__}: {e}"
+                logger.exception(f"{slot.name} crashed")
+            if slot.wake.wait(self._backoff(slot)):
+                break
+
+    async def _supervise_async(self, slot: _Slot) -> None:
+        while not slot.stopping:
+            slot.started_at = time.monotonic()
+            try:
+                if slot.watcher is None:
+                    slot.watcher = slot.factory(str(self.vault_path))
+                await slot.watcher.run_async()
+                if slot.stopping or slot.watcher.stopped:
+                    break
+                slot.last_error = "run_async() returned"
+            except Exception as e:
+                slot.last_error = f"{type(e).__name__}: {e}"
+                logger.exception(f"{slot.name} crashed")
+            delay = self._backoff(slot)
+            deadline = time.monotonic() + delay
+            while not slot.stopping and time.monotonic() < deadline:
+                await asyncio.sleep(min(1.0, deadline - time.monotonic()))
+
+    async def supervise_all(self, watchers: list) -> None:
+        """
+        Supervise already-built async watchers as tasks on the *current* event loop
+        (standalone social watcher, forkserver child) with the same restart policy
+        as start(). A crashed watcher is restarted as the same instance.
+        """
+        slots = []
+        for watcher in watchers:
+            slot = _Slot(name=watcher.watcher_id, factory=lambda _vault, w=watcher: w, watcher=watcher)
+            self._slots[slot.name] = slot
+            slots.append(slot)
+        await asyncio.gather(*(self._supervise_async(slot) for slot in slots))
+
+    def names(self) -> list[str]:
+        return list(self._slots)
+
+    def status(self) -> dict[str, dict]:
+        """Per-watcher liveness, restart count and last error (for health signals)."""
+        now = time.monotonic()
+        return {
+            name: {
+                "alive": self._alive(slot),
+                "mode": "async" if slot.task is not None else "thread",
+                "restarts": slot.restarts,
+                "uptime_seconds": int(now - slot.started_at) if slot.started_at else 0,
+                "last_error": slot.last_error,
+                "interval_seconds": (slot.watcher.metrics().get("interval_seconds")
+                                     if hasattr(slot.watcher, "metrics") else None),
+            }
+            for name, slot in self._slots.items()
+        }
+
+    def stop_all(self, timeout: float = 10.0) -> None:
+        """Stop every watcher and wait up to `timeout` seconds for the threads."""
+        for slot in self._slots.values():
+            slot.stopping = True
+            slot.wake.set()
+            stop = getattr(slot.watcher, "stop", None)
+            if stop:
+                stop()
+        deadline = time.monotonic() + timeout
+        for slot in self._slots.values():
+            if slot.thread:
+                slot.thread.join(max(deadline - time.monotonic(), 0))
+            elif slot.task:
+                try:
+                    slot.task.result(max(deadline - time.monotonic(), 0))
+                except Exception:
+                    slot.task.cancel()
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        logger.info("All in-process watchers stopped.")
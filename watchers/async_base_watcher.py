@@ -0,0 +1,124 @@
+"""
+async_base_watcher.py — asyncio-native variant of BaseWatcher.
+
+Subclasses implement `async check_for_updates()` and `async create_action_file()`.
+Blocking file I/O inside them belongs in `asyncio.to_thread`, so one slow
+disk call never stalls the other watchers on the loop.
+Any number of them can share ONE event loop (run_watchers), so per-platform or
+per-account watchers cost a coroutine each instead of an OS thread each.
+
+The §7.1 / §7.3 behaviour is inherited unchanged from BaseWatcher — error
+classification, auth pause + alert, quarantine, temp-dir fallback and the
+repeated-failure alert — only the sleeps become `asyncio.sleep` (via an
+asyncio.Event, so stop() wakes them immediately).
+
+Usage:
+    class MyWatcher(AsyncBaseWatcher):
+        async def check_for_updates(self) -> list: ...
+        async def create_action_file(self, item) -> Path: ...
+
+    asyncio.run(run_watchers([MyWatcher(vault, "a"), MyWatcher(vault, "b")]))
+"""
+
+from __future__ import annotations
+
+import asyncio
+from abc import abstractmethod
+from pathlib import Path
+
+from watchers.base_watcher import BaseWatcher
+
+
+class AsyncBaseWatcher(BaseWatcher):
+    """BaseWatcher whose poll loop is a coroutine."""
+
+    def __init__(self, vault_path: str, check_interval: int = 60):
+        super().__init__(vault_path, check_interval)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._async_stop: asyncio.Event | None = None
+
+    @abstractmethod
+    async def check_for_updates(self) -> list:
+        """Return a list of new items to process."""
+
+    @abstractmethod
+    async def create_action_file(self, item) -> Path:
+        """Create a .md file in Needs_Action and return its path."""
+
+    def stop(self):
+        """Thread-safe: wakes the coroutine's current sleep and ends run_async()."""
+        super().stop()
+        if self._loop and self._async_stop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._async_stop.set)
+
+    async def _asleep(self, seconds: float) -> bool:
+        """Non-blocking interruptible sleep. Returns True if stop() was called."""
+        try:
+            await asyncio.wait_for(self._async_stop.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        return self._async_stop.is_set()
+
+    async def run_async(self):
+        """Coroutine twin of BaseWatcher.run() — same §7.1 handling, asyncio sleeps."""
+        self._loop = asyncio.get_running_loop()
+        self._async_stop = asyncio.Event()
+        if self.stopped:
+            return
+        self.logger.info(f"Starting {self.__class__.__name__} (interval={self.check_interval}s, async"
+                         f"{', adaptive' if self.adaptive else ''})")
+        consecutive_errors = 0
+        max_backoff = self.check_interval * 8
+
+        while not self._async_stop.is_set():
+            try:
+                items = await self.check_for_updates()
+                if consecutive_errors > 0:
+                    self.logger.info(f"Recovered after {consecutive_errors} consecutive error(s).")
+                    consecutive_errors = 0
+                # §7.3 — flush any files queued during vault outage (file I/O + a thread lock)
+                await asyncio.to_thread(self._flush_fallback_to_vault)
+
+                for item in items:
+                    try:
+                        path = await self.create_action_file(item)
+                        await asyncio.to_thread(self._item_created, path)
+                    except Exception as e:
+                        await asyncio.to_thread(self._handle_item_error, item, e)
+                # May export Signals/WATCHER_<id>.json (tmp write + rename)
+                interval = await asyncio.to_thread(self._next_interval, len(items))
+                if await self._asleep(interval):
+                    break
+
+            except asyncio.CancelledError:
+                self.logger.info(f"{self.__class__.__name__} cancelled.")
+                raise
+
+            except Exception as e:
+                consecutive_errors += 1
+                # Writes audit entries and alert / report files
+                backoff = await asyncio.to_thread(self._handle_poll_error, e, consecutive_errors, max_backoff)
+                if backoff is None:
+                    # Pause until stopped — watchdog or human must restart
+                    await self._async_stop.wait()
+                    break
+                if await self._asleep(backoff):
+                    break
+
+    def run(self):
+        """Blocking entry point for a single watcher (own event loop)."""
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            self.logger.info(f"{self.__class__.__name__} stopped.")
+
+
+async def run_watchers(watchers: list[AsyncBaseWatcher]) -> None:
+    """
+    Multiplex many async watchers on the current event loop, each crash-isolated.
+    Restarts use WatcherRuntime's supervisor (WATCHER_RESTART_BACKOFF_* settings).
+    """
+    if not watchers:
+        return
+    from watcher_runtime import WatcherRuntime
+    await WatcherRuntime(watchers[0].vault_path).supervise_all(watchers)
@@ -2,9 +2,11 @@
 
 import os
 import sys
+import json
 import time
 import logging
 import tempfile
+import threading
 from pathlib import Path
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
@@ -21,6 +23,12 @@ def _resolve_dry_run() -> bool:
         return dev_mode == "true"
     return os.getenv("DRY_RUN", "true").lower() == "true"
 
+# Adaptive polling (see AdaptiveInterval) — WATCHER_ADAPTIVE=false restores fixed intervals
+ADAPTIVE_POLLING   = os.getenv("WATCHER_ADAPTIVE", "true").lower() == "true"
+BUSINESS_HOURS     = os.getenv("WATCHER_BUSINESS_HOURS", "08:00-18:00")   # local time
+BUSINESS_DAYS      = os.getenv("WATCHER_BUSINESS_DAYS", "0-4")            # Mon=0 … Sun=6
+OFF_HOURS_FACTOR   = float(os.getenv("WATCHER_OFF_HOURS_FACTOR", "4"))
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -29,6 +37,69 @@ logging.basicConfig(
 )
 
 
+def _parse_business_hours(hours: str, days: str) -> tuple[int, int, set[int]]:
+    """'08:00-18:00', '0-4' → (start minute, end minute, {0,1,2,3,4})."""
+    start, end = (int(h) * 60 + int(m) for h, m in (t.split(":") for t in hours.split("-")))
+    weekdays: set[int] = set()
+    for part in days.split(","):
+        lo, _, hi = part.partition("-")
+        weekdays.update(range(int(lo), int(hi or lo) + 1))
+    return start, end, weekdays
+
+
+class AdaptiveInterval:
+    """
+    Poll-interval controller.
+
+      - a poll that found items halves the interval (down to min_interval)
+      - an idle poll grows it by idle_factor (up to max_interval)
+      - outside business hours the floor rises to the base interval and the
+        ceiling is multiplied by OFF_HOURS_FACTOR
+
+    Defaults: min = base / 4 (≥ 5s), max = base * 8.
+    """
+
+    def __init__(self, base: float, min_interval: float | None = None,
+                 max_interval: float | None = None, idle_factor: float = 1.5):
+        self.base = float(base)
+        self.min_interval = float(min_interval if min_interval is not None else max(base / 4, 5))
+        self.max_interval = float(max_interval if max_interval is not None else base * 8)
+        self.idle_factor = idle_factor
+        self.current = self.base
+        self.last_found = 0
+        self._hours = _parse_business_hours(BUSINESS_HOURS, BUSINESS_DAYS)
+
+    def in_business_hours(self, now: datetime | None = None) -> bool:
+        now = now or datetime.now()
+        start, end, weekdays = self._hours
+        minute = now.hour * 60 + now.minute
+        return now.weekday() in weekdays and start <= minute < end
+
+    def bounds(self, now: datetime | None = None) -> tuple[float, float]:
+        if self.in_business_hours(now):
+            return self.min_interval, self.max_interval
+        return max(self.min_interval, self.base), self.max_interval * OFF_HOURS_FACTOR
+
+    def update(self, found: int, now: datetime | None = None) -> float:
+        """Feed the number of items the last poll found; returns the next interval."""
+        lo, hi = self.bounds(now)
+        self.last_found = found
+        nxt = self.current / 2 if found else self.current * self.idle_factor
+        self.current = min(max(nxt, lo), hi)
+        return self.current
+
+    def metrics(self) -> dict:
+        lo, hi = self.bounds()
+        return {
+            "interval_seconds": round(self.current, 1),
+            "base_seconds": self.base,
+            "min_seconds": lo,
+            "max_seconds": hi,
+            "last_found": self.last_found,
+            "business_hours": self.in_business_hours(),
+        }
+
+
 class BaseWatcher(ABC):
     """
     Template for all AI Employee watchers.
@@ -44,12 +115,67 @@ class BaseWatcher(ABC):
         self.check_interval = check_interval
         self.dry_run = _resolve_dry_run()
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._stop_event = threading.Event()
+        # Event-driven watchers (check_interval=0) don't poll, so nothing to adapt
+        self.adaptive = AdaptiveInterval(check_interval) if ADAPTIVE_POLLING and check_interval > 0 else None
         if self.dry_run:
             self.logger.warning("DRY RUN mode — no external actions will be taken. Set DRY_RUN=false to enable.")
         self._ensure_dirs()
 
     # §7.3 — temp fallback dir when vault is locked/unavailable
     _FALLBACK_DIR = Path(tempfile.gettempdir()) / "ai_employee_fallback"
+    # Shared by every watcher in the process (in-process runtime)
+    _FALLBACK_LOCK = threading.Lock()
+
+    def stop(self):
+        """Ask run() to return at its next sleep (used by the in-process runtime)."""
+        self._stop_event.set()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop_event.is_set()
+
+    @property
+    def watcher_id(self) -> str:
+        """Name used for metrics; subclasses with several instances override this."""
+        return self.__class__.__name__
+
+    def _next_interval(self, found: int) -> float:
+        """
+        Seconds to wait before the next poll. With adaptive polling on, feeds the
+        controller and exports Signals/WATCHER_<id>.json whenever the interval changes.
+        """
+        if not self.adaptive:
+            return self.check_interval
+        previous = round(self.adaptive.current)
+        interval = self.adaptive.update(found)
+        if round(interval) != previous:
+            self.logger.debug(f"Poll interval {previous}s → {round(interval)}s (found={found})")
+            self._export_metrics()
+        return interval
+
+    def metrics(self) -> dict:
+        """Current polling metrics (also exported to Signals/ on change)."""
+        data = {"watcher": self.watcher_id, "updated": datetime.now(timezone.utc).isoformat()}
+        if self.adaptive:
+            data.update(self.adaptive.metrics())
+        else:
+            data["interval_seconds"] = self.check_interval
+        return data
+
+    def _export_metrics(self) -> None:
+        signal_file = self.vault_path / "Signals" / f"WATCHER_{self.watcher_id}.json"
+        try:
+            signal_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = signal_file.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.metrics(), indent=2), encoding="utf-8")
+            tmp.replace(signal_file)
+        except OSError as e:
+            self.logger.debug(f"Could not export metrics: {e}")
+
+    def _sleep(self, seconds: float) -> bool:
+        """Interruptible sleep. Returns True if stop() was called meanwhile."""
+        return self._stop_event.wait(seconds)
 
     def _ensure_dirs(self):
         """Make sure required vault directories exist."""
@@ -80,16 +206,17 @@ class BaseWatcher(ABC):
         if not self._FALLBACK_DIR.exists():
             return 0
         synced = 0
-        for f in self._FALLBACK_DIR.glob("*.md"):
-            try:
-                dest = self.needs_action / f.name
-                dest.write_text(f.read_text(encoding="utf-8"), encoding="utf-8")
-                f.unlink()
-                self.logger.info(f"Flushed fallback file to vault: {f.name}")
-                self.log_action("vault_sync", str(dest), "success", {"source": "fallback"})
-                synced += 1
-            except Exception as e:
-                self.logger.error(f"Could not flush {f.name} to vault: {e}")
+        with self._FALLBACK_LOCK:
+            for f in self._FALLBACK_DIR.glob("*.md"):
+                try:
+                    dest = self.needs_action / f.name
+                    dest.write_text(f.read_text(encoding="utf-8"), encoding="utf-8")
+                    f.unlink()
+                    self.logger.info(f"Flushed fallback file to vault: {f.name}")
+                    self.log_action("vault_sync", str(dest), "success", {"source": "fallback"})
+                    synced += 1
+                except Exception as e:
+                    self.logger.error(f"Could not flush {f.name} to vault: {e}")
         return synced
 
     @abstractmethod
@@ -115,7 +242,7 @@ class BaseWatcher(ABC):
         )
 
     def run(self):
-        """Main event loop — runs continuously until interrupted.
+        """Main event loop — runs until interrupted or stop() is called.
 
         Uses §7.1 error classification + exponential backoff:
           - TransientError  → exponential backoff, alert after 3 consecutive
@@ -123,12 +250,16 @@ class BaseWatcher(ABC):
           - DataError       → quarantine item, short backoff, alert after 3
           - Other           → generic backoff as before
           - Reset counter on any successful poll.
+
+        Between successful polls the wait comes from AdaptiveInterval (shorter
+        while items keep arriving, longer while idle and outside business hours).
         """
-        self.logger.info(f"Starting {self.__class__.__name__} (interval={self.check_interval}s)")
+        self.logger.info(f"Starting {self.__class__.__name__} (interval={self.check_interval}s"
+                         f"{', adaptive' if self.adaptive else ''})")
         consecutive_errors = 0
         max_backoff = self.check_interval * 8
 
-        while True:
+        while not self.stopped:
             try:
                 items = self.check_for_updates()
                 if consecutive_errors > 0:
@@ -140,69 +271,91 @@ class BaseWatcher(ABC):
                 for item in items:
                     try:
                         path = self.create_action_file(item)
-                        self.logger.info(f"Created action file: {path.name}")
-                        self.log_action("file_created", str(path), "success")
-                    except DataError as e:
-                        self.logger.error(f"Data error for {item} — quarantining: {e}")
-                        self._quarantine_item(item, str(e))
-                        self.log_action("file_created", str(item), "data_error", {"error": str(e)})
-                    except OSError as e:
-                        # §7.3 — vault locked / disk full → write to temp fallback
-                        ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-                        filename = f"FALLBACK_{self.__class__.__name__}_{ts}.md"
-                        try:
-                            content = f"---\ntype: fallback\nsource: {self.__class__.__name__}\ncreated: {datetime.now(timezone.utc).isoformat()}\noriginal_error: {e}\n---\n\nVault unavailable. Item: {item}\n"
-                            self._write_to_fallback(filename, content)
-                            self.log_action("file_created", filename, "fallback", {"error": str(e), "item": str(item)})
-                        except Exception:
-                            self.logger.error(f"Fallback write also failed for {item}: {e}")
+                        self._item_created(path)
                     except Exception as e:
-                        self.logger.error(f"Failed to create action file for {item}: {e}")
-                        self.log_action("file_created", str(item), "error", {"error": str(e)})
-                time.sleep(self.check_interval)
+                        self._handle_item_error(item, e)
+                if self._sleep(self._next_interval(len(items))):
+                    break
 
             except KeyboardInterrupt:
                 self.logger.info(f"{self.__class__.__name__} stopped.")
                 break
 
             except Exception as e:
-                classified = classify_error(e)
                 consecutive_errors += 1
-
-                # §7.1 AuthenticationError — pause immediately, alert human
-                if isinstance(classified, AuthenticationError):
-                    self.logger.error(
-                        f"Authentication failure in {self.__class__.__name__}: {e}. "
-                        "Pausing — credentials must be fixed before this watcher can continue."
-                    )
-                    self.log_action(
-                        "poll_error", self.__class__.__name__, "auth_error",
-                        {"error": str(e), "category": "authentication"}
-                    )
-                    self._write_auth_error_alert(str(e))
+                backoff = self._handle_poll_error(e, consecutive_errors, max_backoff)
+                if backoff is None:
                     # Pause indefinitely — watchdog or human must restart
-                    while True:
-                        time.sleep(300)
-
-                backoff = min(self.check_interval * (2 ** consecutive_errors), max_backoff)
-                self.logger.error(
-                    f"Error in check_for_updates [{classified.category}] "
-                    f"(attempt {consecutive_errors}): {e}. Retrying in {backoff}s."
-                )
-                self.log_action(
-                    "poll_error", self.__class__.__name__, "error",
-                    {
-                        "error": str(e),
-                        "error_category": classified.category,
-                        "consecutive_errors": consecutive_errors,
-                        "backoff_seconds": backoff,
-                    }
-                )
-
-                if consecutive_errors >= 3:
-                    self._write_repeated_failure_alert(consecutive_errors, str(e))
-
-                time.sleep(backoff)
+                    while not self._sleep(300):
+                        pass
+                    break
+                if self._sleep(backoff):
+                    break
+
+    # ── §7.1 / §7.3 handling shared by the sync and async run loops ──────────
+
+    def _item_created(self, path: Path) -> None:
+        self.logger.info(f"Created action file: {path.name}")
+        self.log_action("file_created", str(path), "success")
+
+    def _handle_item_error(self, item, e: Exception) -> None:
+        """DataError → quarantine; OSError → §7.3 fallback dir; anything else → log."""
+        if isinstance(e, DataError):
+            self.logger.error(f"Data error for {item} — quarantining: {e}")
+            self._quarantine_item(item, str(e))
+            self.log_action("file_created", str(item), "data_error", {"error": str(e)})
+        elif isinstance(e, OSError):
+            # §7.3 — vault locked / disk full → write to temp fallback
+            ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            filename = f"FALLBACK_{self.__class__.__name__}_{ts}.md"
+            try:
+                content = f"---\ntype: fallback\nsource: {self.__class__.__name__}\ncreated: {datetime.now(timezone.utc).isoformat()}\noriginal_error: {e}\n---\n\nVault unavailable. Item: {item}\n"
+                self._write_to_fallback(filename, content)
+                self.log_action("file_created", filename, "fallback", {"error": str(e), "item": str(item)})
+            except Exception:
+                self.logger.error(f"Fallback write also failed for {item}: {e}")
+        else:
+            self.logger.error(f"Failed to create action file for {item}: {e}")
+            self.log_action("file_created", str(item), "error", {"error": str(e)})
+
+    def _handle_poll_error(self, e: Exception, consecutive_errors: int, max_backoff: float) -> float | None:
+        """
+        Classify a check_for_updates() failure, log/alert, and return the backoff
+        in seconds — or None for an AuthenticationError (caller must pause).
+        """
+        classified = classify_error(e)
+
+        # §7.1 AuthenticationError — pause immediately, alert human
+        if isinstance(classified, AuthenticationError):
+            self.logger.error(
+                f"Authentication failure in {self.__class__.__name__}: {e}. "
+                "Pausing — credentials must be fixed before this watcher can continue."
+            )
+            self.log_action(
+                "poll_error", self.__class__.__name__, "auth_error",
+                {"error": str(e), "category": "authentication"}
+            )
+            self._write_auth_error_alert(str(e))
+            return None
+
+        backoff = min(self.check_interval * (2 ** consecutive_errors), max_backoff)
+        self.logger.error(
+            f"Error in check_for_updates [{classified.category}] "
+            f"(attempt {consecutive_errors}): {e}. Retrying in {backoff}s."
+        )
+        self.log_action(
+            "poll_error", self.__class__.__name__, "error",
+            {
+                "error": str(e),
+                "error_category": classified.category,
+                "consecutive_errors": consecutive_errors,
+                "backoff_seconds": backoff,
+            }
+        )
+
+        if consecutive_errors >= 3:
+            self._write_repeated_failure_alert(consecutive_errors, str(e))
+        return backoff
 
     def _quarantine_item(self, item, reason: str) -> None:
         """Move a problematic item to /Quarantine/ to isolate data errors (§7.1)."""
@@ -247,8 +247,9 @@ _Add project scope, dependencies, or constraints here._
         self._observer.start()
 
         try:
-            while self._observer.is_alive():
-                self._observer.join(timeout=1)
+            while self._observer.is_alive() and not self._sleep(1):
+                pass
+            self._observer.stop()
         except KeyboardInterrupt:
             self.logger.info("Stopping watcher...")
             self._observer.stop()
@@ -26,6 +26,7 @@ from datetime import datetime, timezone
 from dotenv import load_dotenv
 
 from watchers.base_watcher import BaseWatcher
+from google_quota import get_quota, PRIORITY_POLL
 
 load_dotenv()
 
@@ -166,18 +167,35 @@ class GmailWatcher(BaseWatcher):
             self.logger.info("[DRY RUN] Skipping Gmail API call")
             return []
 
+        # Polls are the lowest Gmail priority — defer while sends/reads need the budget
+        quota = get_quota(self.vault_path)
+        if not quota.try_reserve("gmail.messages.list", priority=PRIORITY_POLL):
+            self.logger.info("Gmail quota budget low — deferring this poll")
+            self.log_action("gmail_poll", "Gmail API", "deferred", {"reason": "quota_budget_low"})
+            return []
+
         try:
             service = self._get_service()
             query = "is:unread " + " OR ".join(f"label:{l}" for l in self.watch_labels)
             result = service.users().messages().list(userId="me", q=query, maxResults=20).execute()
             messages = result.get("messages", [])
             new = [m for m in messages if m["id"] not in self._processed_ids]
+            # Reserve the per-message fetches up front; anything that doesn't fit
+            # stays unprocessed and is picked up by a later poll.
+            reserved = 0
+            while reserved < len(new) and quota.try_reserve("gmail.messages.get", priority=PRIORITY_POLL):
+                reserved += 1
+            if reserved < len(new):
+                self.logger.info(f"Gmail quota budget low — fetching {reserved}/{len(new)} now")
+            new = new[:reserved]
             if new:
                 self.logger.info(f"Found {len(new)} new email(s)")
             return new
         except Exception as e:
             err_str = str(e)
-            if "403" in err_str or "forbidden" in err_str.lower():
+            if quota.record_error("gmail", e):
+                self.logger.warning("Gmail API 429 — quota exhausted, all Gmail callers paused")
+            elif "403" in err_str or "forbidden" in err_str.lower():
                 self.logger.error(
                     "Gmail API 403 Forbidden — check: "
                     "(1) Gmail API enabled in Google Cloud Console, "
@@ -203,6 +221,7 @@ class GmailWatcher(BaseWatcher):
                 metadataHeaders=["From", "Subject", "Date"]
             ).execute()
         except Exception as e:
+            get_quota(self.vault_path).record_error("gmail", e)
             self.logger.error(f"Failed to fetch message {message['id']}: {e}")
             raise
 
@@ -146,24 +146,23 @@ Run: `/post-linkedin` (Step 7 - publish approved post via Playwright MCP)
 
     def run(self):
         """Main loop: scan approved queue, create Playwright MCP triggers."""
-        import time
         self.logger.info("LinkedIn Watcher started (Playwright MCP mode)")
         self.logger.info(f"Monitoring: /Approved/LINKEDIN_POST_*.md → /Scheduled/ triggers")
         self.logger.info("Publishing via: Playwright MCP (claude mcp add playwright)")
         self.logger.info("Press Ctrl+C to stop.")
 
-        while True:
+        while not self.stopped:
             try:
                 items = self.check_for_updates()
                 for item in items:
                     self.create_action_file(item)
-                time.sleep(self.check_interval)
+                self._sleep(self._next_interval(len(items)))
             except KeyboardInterrupt:
                 self.logger.info("LinkedIn Watcher stopped.")
                 break
             except Exception as e:
                 self.logger.error(f"Loop error: {e}")
-                time.sleep(self.check_interval)
+                self._sleep(self.check_interval)
 
 
 def _run_setup(vault_path: str):
@@ -5,7 +5,8 @@ Watches /Approved/ for SOCIAL_{PLATFORM}_*.md files and creates
 /Scheduled/TRIGGER_social_{platform}_{ts}.md files for Claude to publish
 via Playwright MCP browser automation.
 
-Follows the BaseWatcher pattern (check_for_updates / create_action_file).
+Follows the BaseWatcher pattern (check_for_updates / create_action_file) on
+the asyncio variant: all platforms share one event loop instead of one thread each.
 
 Usage:
     uv run social-watcher
@@ -13,15 +14,14 @@ Usage:
 """
 
 import os
-import time
+import asyncio
 import logging
-import threading
 import argparse
 from pathlib import Path
 from datetime import datetime, timezone
 from dotenv import load_dotenv
 
-from watchers.base_watcher import BaseWatcher
+from watchers.async_base_watcher import AsyncBaseWatcher, run_watchers
 
 load_dotenv()
 
@@ -37,7 +37,7 @@ PLATFORMS = ["Facebook", "Instagram", "Twitter"]
 logger = logging.getLogger("SocialWatcher")
 
 
-class SocialWatcher(BaseWatcher):
+class SocialWatcher(AsyncBaseWatcher):
     """
     Watches /Approved/ for SOCIAL_{PLATFORM}_*.md files.
     Creates /Scheduled/ trigger files for Claude to publish via Playwright MCP.
@@ -59,26 +59,37 @@ class SocialWatcher(BaseWatcher):
         for d in [self.approved_dir, self.scheduled_dir, self.done]:
             d.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def watcher_id(self) -> str:
+        return f"SocialWatcher_{self.platform}"
+
     @property
     def done(self) -> Path:
         return self.vault_path / "Done"
 
     # ── BaseWatcher interface ─────────────────────────────────────────────────
 
-    def check_for_updates(self) -> list:
+    async def check_for_updates(self) -> list:
         """Return approved social post files for this platform not yet processed."""
+        return await asyncio.to_thread(self._scan_approved)
+
+    async def create_action_file(self, item: Path) -> Path:
+        """
+        Create /Scheduled/TRIGGER_social_{platform}_{ts}.md from an approved post.
+        Moves the approved file to /Done/ after trigger creation.
+        """
+        return await asyncio.to_thread(self._write_trigger, item)
+
+    # ── Blocking helpers (run off the event loop) ─────────────────────────────
+
+    def _scan_approved(self) -> list:
         pattern = f"SOCIAL_{self.platform.upper()}_*.md"
         return [
             f for f in sorted(self.approved_dir.glob(pattern))
             if f.name not in self._seen
         ]
 
-    def create_action_file(self, item: Path) -> Path:
-        """
-        Create /Scheduled/TRIGGER_social_{platform}_{ts}.md from an approved post.
-        Moves the approved file to /Done/ after trigger creation.
-        """
-        approved_file = item
+    def _write_trigger(self, approved_file: Path) -> Path:
         content = approved_file.read_text(encoding="utf-8")
         post_file = ""
         for line in content.split("\n"):
@@ -148,16 +159,9 @@ def main():
 
     if args.platform == "all":
         watchers = [SocialWatcher(args.vault, p, args.interval) for p in PLATFORMS]
-        threads  = [
-            threading.Thread(target=w.run, daemon=True, name=f"SocialWatcher-{w.platform}")
-            for w in watchers
-        ]
-        for t in threads:
-            t.start()
-        logger.info(f"All platform watchers started: {PLATFORMS}")
+        logger.info(f"All platform watchers started on one event loop: {PLATFORMS}")
         try:
-            while True:
-                time.sleep(1)
+            asyncio.run(run_watchers(watchers))
         except KeyboardInterrupt:
             logger.info("Stopping all social watchers...")
     else: